@@ -0,0 +1,243 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import pygame
+import pymunk
+import pymunk.pygame_util
+import src.collisions as collisions
+from pygame.locals import KEYDOWN, K_SPACE
+from src.classes import Floor, Pig, Wooden_bar, space_draw
+from src.generator import generate_level
+from src.get_levels import Game, build_level, create_level, get_data, get_level
+from src.rendering import WorldRenderer
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    FPS,
+    gravity
+)
+
+
+body_counts = (50, 200, 800)
+generated_sizes = (30, 300, 3000)
+display_sizes = ((1280, 720), (1920, 1080), (2560, 1440))
+scripted_shots = ((0, 10, 1500), (0, 5, 2500), (2, 30, 1200))
+
+
+def measure(function, repeat=5, number=10):
+    """
+    Calls function number times in each of repeat rounds and returns median time of one call in milliseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number * 1000)
+    return statistics.median(times)
+
+
+def percentile(values: list, percent: float):
+    """
+    Returns percentile of the values using the nearest-rank method.
+    """
+    values = sorted(values)
+    index = max(0, min(len(values) - 1, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def bench_level_load(repeat: int):
+    """
+    Measures time of building every level from levels.json.
+    """
+    results = {}
+    for number in range(len(get_data()['levels'])):
+        results[f'level_build/{number + 1}'] = measure(lambda: build_level(number), repeat, 1)
+    return results
+
+
+def stress_space(count: int):
+    """
+    Returns space with floor, collision handlers and the given number of wooden bars stacked in columns.
+    """
+    space = pymunk.Space()
+    space.gravity = gravity
+    collisions.create_handlers(space)
+    Floor(space)
+    columns = max(1, -(-count // 16))
+    for index in range(count):
+        column, row = index % columns, index // columns
+        Wooden_bar(space, (100 + column * (1700 / columns), 225 + row * 42), (min(20, 1700 / columns - 2), 40))
+    return space
+
+
+def bench_space_step(repeat: int):
+    """
+    Measures time of one physics step and number of bodies simulated per second for several body counts.
+    """
+    results = {}
+    for count in body_counts:
+        space = stress_space(count)
+        for _ in range(FPS):
+            space.step(1 / FPS)
+        step = measure(lambda: space.step(1 / FPS), repeat, 10)
+        results[f'space_step/{count}'] = step
+        results[f'space_step_throughput/{count}'] = count / step * 1000
+    return results
+
+
+def bench_generated_levels(repeat: int):
+    """
+    Measures time of creating, simulating and drawing levels made by generator for several numbers of objects.
+    """
+    results = {}
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = WorldRenderer()
+    for size in generated_sizes:
+        level_data = generate_level(1, size, seed=0)
+        results[f'generated_create/{size}'] = measure(lambda: create_level(level_data), repeat, 1)
+        space = create_level(level_data).space
+        renderer.set_space(space)
+        step = measure(lambda: space.step(1 / FPS), repeat, 5)
+        results[f'generated_step/{size}'] = step
+        results[f'generated_draw/{size}'] = measure(lambda: renderer.draw(screen), repeat, 5)
+    return results
+
+
+def bench_drawing(repeat: int):
+    """
+    Measures time of drawing skin of one pig and of drawing every level
+    with space_draw and with WorldRenderer.
+    """
+    results = {}
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pig = Pig(pymunk.Space(), (500, 500), 20)
+    results['skin_update'] = measure(lambda: pig.body.skin.update(screen), repeat, 100)
+    pymunk.pygame_util.positive_y_is_up = True
+    options = pymunk.pygame_util.DrawOptions(screen)
+    renderer = WorldRenderer()
+    for number in range(len(get_data()['levels'])):
+        space = get_level(number).space
+        renderer.set_space(space)
+        results[f'space_draw/{number + 1}'] = measure(lambda: space_draw(space, options), repeat, 10)
+        results[f'world_draw/{number + 1}'] = measure(lambda: renderer.draw(screen), repeat, 10)
+    return results
+
+
+def bench_scale_screen(repeat: int):
+    """
+    Measures time of resizing the screen and showing it on displays of several sizes.
+    """
+    results = {}
+    game = Game()
+    for width, height in display_sizes:
+        game.display = pygame.display.set_mode((width, height))
+        results[f'scale_screen/{width}x{height}'] = measure(game.scale_screen, repeat, 5)
+    return results
+
+
+def bench_frames(frames: int):
+    """
+    Measures times of Game.step in headless mode with rendering during scripted shots.
+    Returns median, 95th percentile and maximal frame time of every shot.
+    """
+    results = {}
+    for level, angle, velocity in scripted_shots:
+        game = Game(headless=True)
+        game.start(level)
+        game.bird.aim(angle, velocity)
+        game.queue_input([pygame.event.Event(KEYDOWN, key=K_SPACE)])
+        times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            game.step()
+            times.append((time.perf_counter() - start) * 1000)
+        name = f'frame/{level + 1}-{angle}-{velocity}'
+        results[f'{name}/p50'] = statistics.median(times)
+        results[f'{name}/p95'] = percentile(times, 95)
+        results[f'{name}/max'] = max(times)
+    return results
+
+
+def run(quick=False):
+    """
+    Runs all benchmarks and returns dictionary with metadata and results.
+    Quick run makes fewer repetitions and is meant only to check that benchmarks work.
+    """
+    repeat = 2 if quick else 7
+    frames = 10 if quick else 150
+    results = {}
+    results.update(bench_level_load(repeat))
+    results.update(bench_space_step(repeat))
+    results.update(bench_generated_levels(repeat))
+    results.update(bench_drawing(repeat))
+    results.update(bench_scale_screen(repeat))
+    results.update(bench_frames(frames))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'pymunk': pymunk.version,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+            'quick': quick
+        },
+        'results': results
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance=0.2):
+    """
+    Compares results with baseline and returns list of (name, baseline value, value, ratio, regressed) tuples
+    for metrics present in both of them.
+    Throughput is better when higher, every other metric is time which is better when lower.
+    Metric regressed if it is worse than baseline by more than tolerance.
+    """
+    comparison = []
+    for name, value in results.items():
+        if name not in baseline or not baseline[name]:
+            continue
+        ratio = value / baseline[name]
+        if 'throughput' in name:
+            regressed = ratio < 1 / (1 + tolerance)
+        else:
+            regressed = ratio > 1 + tolerance
+        comparison.append((name, baseline[name], value, ratio, regressed))
+    return comparison
+
+
+def main(argv=None):
+    """
+    Runs benchmarks, saves results to the output file and compares them with the baseline file if it is given.
+    Returns 1 if any metric regressed, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description='Benchmarks of the game run with SDL dummy video driver.')
+    parser.add_argument('--output', default='benchmark.json', help='file to which results are saved')
+    parser.add_argument('--baseline', help='file with results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown, default: 0.2')
+    parser.add_argument('--quick', action='store_true', help='make fewer repetitions')
+    args = parser.parse_args(argv)
+    report = run(args.quick)
+    with open(args.output, 'w') as fp:
+        json.dump(report, fp, indent=4)
+    for name, value in report['results'].items():
+        print(f'{name:<40}{value:12.3f}')
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)['results']
+    comparison = compare(report['results'], baseline, args.tolerance)
+    print()
+    print(f'{"metric":<40}{"baseline":>12}{"current":>12}{"ratio":>8}')
+    for name, old, new, ratio, regressed in comparison:
+        print(f'{name:<40}{old:12.3f}{new:12.3f}{ratio:8.2f}' + ('  REGRESSION' if regressed else ''))
+    return 1 if any(regressed for *_, regressed in comparison) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,14 +1,20 @@
+import argparse
+from src.assets import AssetLoader
 from src.get_levels import Game
+from src.preview import ImpactPreview
+from src.recording import InputRecorder
+from setup.config import parse_resolution, settings
 
 
-def main():
+def run(game: Game):
     """
-    Main function of the game which contains the loop of the game.
-    Creates instance of Game and calls step, start screen or end_screen method.
+    Contains the loop of the game.
+    Calls loading_screen, step, start screen or end_screen method until the game stops running.
     """
-    game = Game()
     while game.running:
-        if game.status == 0:
+        if game.status == 3:
+            game.loading_screen()
+        elif game.status == 0:
             game.start_screen()
         elif game.status == 1:
             game.step()
@@ -16,5 +22,60 @@ def main():
             game.end_screen()
 
 
+def main(argv=None):
+    """
+    Main function of the game.
+    Creates instance of Game and runs it.
+    If path of the log is given, input of every frame is recorded and can be replayed by src.replay.
+    With --preview the first impact of the aimed bird is marked, found by segment queries
+    or by simulating copy of the level.
+    Images are loaded in background threads while loading screen is shown,
+    with --debug time of starting the game is printed.
+    Resolution of the monitor can be given by --resolution instead of reading it from the system.
+    With --scaled the game is drawn on a display resized by SDL, with --dirty-rects only changed regions
+    of the screen are redrawn and with --interpolate bodies are drawn between physics steps.
+    The game is shown in a window unless --fullscreen is given.
+    """
+    parser = argparse.ArgumentParser(description='Angry Birds')
+    parser.add_argument('--record', help='file to which input of every frame is recorded')
+    parser.add_argument(
+        '--preview', nargs='?', const='query', choices=('query', 'simulate'),
+        help='mark the first impact of the aimed bird, default method: query'
+    )
+    parser.add_argument('--debug', action='store_true', help='print time of starting the game')
+    parser.add_argument(
+        '--resolution', type=parse_resolution,
+        help='resolution of the monitor as WIDTHxHEIGHT, default: resolution read from the system'
+    )
+    parser.add_argument('--scaled', action='store_true', help='draw on a display resized to the monitor by SDL')
+    parser.add_argument('--fullscreen', action='store_true', help='fill the whole monitor instead of a window')
+    parser.add_argument('--dirty-rects', action='store_true', help='redraw only changed regions of the screen')
+    parser.add_argument(
+        '--interpolate', action='store_true', help='draw bodies between physics steps at a higher frame rate'
+    )
+    args = parser.parse_args(argv)
+    if args.resolution is not None:
+        settings.override(args.resolution)
+    preview = None if args.preview is None else ImpactPreview(args.preview == 'simulate')
+    options = {
+        'dirty_rects': args.dirty_rects,
+        'scaled_display': args.scaled,
+        'fullscreen': args.fullscreen,
+        'interpolate': args.interpolate,
+        'preview': preview,
+        'loader': AssetLoader(),
+        'debug': args.debug
+    }
+    try:
+        if args.record is None:
+            run(Game(**options))
+            return
+        with open(args.record, 'wb') as fp:
+            run(Game(recorder=InputRecorder(fp), **options))
+    finally:
+        if preview is not None:
+            preview.close()
+
+
 if __name__ == '__main__':
     main()
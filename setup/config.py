@@ -1,14 +1,47 @@
+import os
 import pygame
 
 
-def get_screen_size():
+# Environment variable with resolution of the monitor used instead of the real one, e.g. 1280x720.
+resolution_variable = 'ANGRYBIRDS_RESOLUTION'
+
+
+def parse_resolution(text: str):
+    """
+    Returns (width, height) pair from resolution written as WIDTHxHEIGHT.
+
+    Raises ValueError if resolution is invalid or not positive.
+    """
+    try:
+        width, height = (int(value) for value in text.lower().split('x'))
+    except ValueError:
+        raise ValueError(f'Invalid resolution {text!r}, has to be WIDTHxHEIGHT')
+    if width <= 0 or height <= 0:
+        raise ValueError('Resolution has to be positive')
+    return width, height
+
+
+def get_monitor_resolution():
+    """
+    Returns resolution of user's monitor.
+    Initializes only display subsystem of pygame and only if it was not initialized before.
+    """
+    if not pygame.display.get_init():
+        pygame.display.init()
+    sizes = pygame.display.get_desktop_sizes()
+    if sizes:
+        return sizes[0]
+    screen = pygame.display.Info()
+    return screen.current_w, screen.current_h
+
+
+def get_screen_size(resolution=None):
     """
     Calculates display width and height so it is in 16/9 ratio
     and the factor by which it was resized compared to 1080p resolution.
+    Resolution of user's monitor is used if resolution is not given.
     """
-    screen = pygame.display.Info()
-    width = screen.current_w
-    height = screen.current_h
+    width, height = resolution or get_monitor_resolution()
     if width / height > 16 / 9:
         factor = height / 1080
         return (1920 * factor, height, factor)
@@ -17,16 +50,126 @@ def get_screen_size():
         return (width, 1080 * factor, factor)
 
 
-pygame.init()
-screen = get_screen_size()
+class Settings:
+    """
+    Class Settings.
+    Keeps size of the display and the factor by which it is resized compared to screen,
+    which are calculated on first use, so importing configuration does not initialize pygame.
+    Resolution of the monitor is taken from override method, from environment variable
+    resolution_variable or from pygame, in this order.
+    Contains attributes:
+    :param resolution: resolution of the monitor
+    :type resolution: tuple
+
+    :param display_size: width and height of the window in which the game is shown
+    :type display_size: tuple
+
+    :param screen_factor: factor by which display is resized compared to 1080p resolution
+    :type screen_factor: float
+    """
+    def __init__(self, environ=os.environ):
+        """
+        Creates instance of Settings. Nothing is calculated until it is used.
+        """
+        self._environ = environ
+        self._resolution = None
+        self._screen = None
+
+    @property
+    def resolution(self):
+        """
+        Returns resolution of the monitor.
+
+        Raises ValueError if resolution in the environment variable is invalid.
+        """
+        if self._resolution is None:
+            if self._environ.get(resolution_variable):
+                self._resolution = parse_resolution(self._environ[resolution_variable])
+            else:
+                self._resolution = get_monitor_resolution()
+        return self._resolution
+
+    @property
+    def display_size(self):
+        """
+        Returns width and height of the window in which the game is shown.
+        """
+        screen = self._screen_size()
+        return (int(screen[0]) - 7, int(screen[1]) - 30)
+
+    @property
+    def screen_factor(self):
+        """
+        Returns factor by which display is resized compared to 1080p resolution.
+        """
+        return self._screen_size()[2]
+
+    def _screen_size(self):
+        """
+        Returns display size in 16/9 ratio and its factor calculated once from the resolution.
+        """
+        if self._screen is None:
+            self._screen = get_screen_size(self.resolution)
+        return self._screen
+
+    def override(self, resolution=None):
+        """
+        Sets resolution of the monitor, given as (width, height) pair or WIDTHxHEIGHT text,
+        or forgets it if resolution is None, so it is read again on next use.
+
+        Raises ValueError if resolution is invalid.
+        """
+        if isinstance(resolution, str):
+            resolution = parse_resolution(resolution)
+        elif resolution is not None:
+            resolution = parse_resolution(f'{resolution[0]}x{resolution[1]}')
+        self._resolution = resolution
+        self._screen = None
+
+
+settings = Settings()
+
+
+def __getattr__(name: str):
+    """
+    Returns display metrics from settings for code which reads them as variables of the module.
+    """
+    if name == 'DISPLAY_WIDTH':
+        return settings.display_size[0]
+    if name == 'DISPLAY_HEIGHT':
+        return settings.display_size[1]
+    if name == 'screen_factor':
+        return settings.screen_factor
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 SCREEN_WIDTH = 1913
 SCREEN_HEIGHT = 1050
-DISPLAY_WIDTH = int(screen[0]) - 7
-DISPLAY_HEIGHT = int(screen[1]) - 30
-screen_factor = screen[2]
 FPS = 30
 gravity = (0, -500)
 bird_radius = 20
 bird_position = (220, 200 + bird_radius)
 floor_height = 200
 aiming_range = 200
+rotation_step = 2
+text_cache_size = 256
+dirty_rect_limit = 0.5
+sleep_time_threshold = 0.5
+idle_speed_threshold = 10
+settle_energy = 5000
+settle_timeout = 15
+physics_rate = 30
+# Frame rate limit used when bodies are interpolated, higher than physics_rate,
+# so that frames are drawn between physics steps.
+interpolation_fps = 60
+max_frame_time = 0.25
+max_substeps = 4
+substep_distance = bird_radius
+profiler_window = 300
+profiler_overlay_interval = 15
+trace_event_limit = 200000
+trace_path = 'trace.json'
+preview_angle_step = 1
+preview_velocity_step = 10
+preview_cache_size = 512
+preview_time_limit = 5
@@ -0,0 +1,178 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from src.classes import (
+    textures,
+    bird_skin_size,
+    pig_skin_size
+)
+from src.get_levels import get_data
+
+
+# Images drawn by Game outside of the level: background, image next to the number of attempts,
+# title, the end, time and grass.
+screen_images = (
+    ('background.jpg', (1914, 1029)),
+    ('red_bird.png', (80, 80)),
+    ('title.png', (512, 295)),
+    ('the_end.png', (512, 182)),
+    ('time.png', (256, 65)),
+    ('grass.png', (300, 32))
+)
+
+
+def startup_images(levels_data=None):
+    """
+    Returns list of (file, size) pairs of images needed before the first level is shown:
+    images drawn by Game, image of the bird and images of pigs of every size used in the levels.
+    Levels are read by get_data function if levels_data is not given.
+    """
+    if levels_data is None:
+        levels_data = get_data()
+    images = list(screen_images)
+    images.append(('red_bird.png', bird_skin_size()))
+    for level in levels_data['levels']:
+        for pig in level['objects']['pigs']:
+            images.append(('pig.png', pig_skin_size(pig['radius'])))
+    return list(dict.fromkeys(images))
+
+
+class AssetLoader:
+    """
+    Class AssetLoader.
+    Decodes and resizes images in background threads and stores them in textures,
+    so that the window can show loading screen while images are loaded.
+    The largest files are loaded first and several of them are decoded at the same time.
+    Every file is decoded once and resized to all sizes in which it is needed.
+    Contains attributes:
+    :param images: (file, size) pairs of images which are loaded
+    :type images: list
+
+    :param workers: number of threads decoding images, default: number of CPUs
+    :type workers: int
+
+    :param progress: part of bytes of image files which are already loaded
+    :type progress: float
+
+    :param timings: time of decoding and resizing of every loaded file in seconds stored by file
+    :type timings: dict
+
+    :param wall_time: time from starting to collecting the last image in seconds, None if it is not finished
+    :type wall_time: float
+    """
+    def __init__(self, images=None, workers=None):
+        """
+        Creates instance of AssetLoader. Images are not loaded until start method is called.
+        """
+        self._images = list(images) if images is not None else startup_images()
+        self._workers = workers or os.cpu_count() or 1
+        self._bytes = {file: os.path.getsize(f'images/{file}') for file, _ in self._images}
+        self._executor = None
+        self._futures = {}
+        self._loaded = set()
+        self._timings = {}
+        self._start = None
+        self._wall_time = None
+
+    @property
+    def images(self):
+        """
+        Returns (file, size) pairs of images which are loaded.
+        """
+        return self._images
+
+    @property
+    def workers(self):
+        """
+        Returns number of threads decoding images.
+        """
+        return self._workers
+
+    @property
+    def progress(self):
+        """
+        Returns part of bytes of image files which are already loaded.
+        """
+        total = sum(self._bytes.values())
+        return sum(self._bytes[file] for file in self._loaded) / total if total else 1
+
+    @property
+    def done(self):
+        """
+        Returns True if all images are stored in textures.
+        """
+        return len(self._loaded) == len(self._bytes)
+
+    @property
+    def timings(self):
+        """
+        Returns time of decoding and resizing of every loaded file in seconds.
+        """
+        return self._timings
+
+    @property
+    def wall_time(self):
+        """
+        Returns time from starting to collecting the last image in seconds or None if loading is not finished.
+        """
+        return self._wall_time
+
+    def start(self):
+        """
+        Starts loading images which are not in textures yet. Does nothing if loading was already started.
+        """
+        if self._start is not None:
+            return
+        self._start = time.perf_counter()
+        missing = {}
+        for file, size in self._images:
+            if (file, size) not in textures:
+                missing.setdefault(file, []).append(size)
+        self._loaded = set(self._bytes) - set(missing)
+        if missing:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(self._workers, len(missing)), thread_name_prefix='asset-loader'
+            )
+            for file in sorted(missing, key=self._bytes.get, reverse=True):
+                self._futures[file] = self._executor.submit(self.load, file, missing[file])
+        self.collect()
+
+    def load(self, file: str, sizes: list):
+        """
+        Returns list of (size, image) pairs of the image from the file resized to every size
+        and time of loading them in seconds.
+        Images are not converted to display's pixel format, so it runs in the worker thread.
+        """
+        start = time.perf_counter()
+        image = pygame.image.load(f'images/{file}')
+        images = [(size, pygame.transform.smoothscale(image, size)) for size in sizes]
+        return images, time.perf_counter() - start
+
+    def collect(self):
+        """
+        Stores images loaded by worker threads in textures.
+        Raises the error of the worker if an image could not be loaded.
+        """
+        for file, future in list(self._futures.items()):
+            if not future.done():
+                continue
+            images, seconds = future.result()
+            del self._futures[file]
+            for size, image in images:
+                textures.add(file, size, image)
+            self._timings[file] = seconds
+            self._loaded.add(file)
+        if self.done and self._wall_time is None and self._start is not None:
+            self._wall_time = time.perf_counter() - self._start
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+
+    def wait(self):
+        """
+        Starts loading if it was not started, waits until all images are loaded and stores them in textures.
+        """
+        self.start()
+        for future in list(self._futures.values()):
+            future.result()
+        self.collect()
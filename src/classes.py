@@ -1,6 +1,8 @@
 import pygame
 import pymunk
 import pymunk.pygame_util
+import collections
+import numpy as np
 from math import sin, cos, asin, radians, degrees, sqrt
 import setup.colors as colors
 from setup.config import (
@@ -10,7 +12,9 @@ from setup.config import (
     gravity,
     bird_position,
     bird_radius,
-    aiming_range
+    aiming_range,
+    rotation_step,
+    text_cache_size
 )
 from pygame.locals import (
     K_w,
@@ -99,6 +103,30 @@ def is_on_circle(circle_position: tuple, radius: int, point: tuple):
     return False
 
 
+def bird_skin_size():
+    """
+    Returns size of the image of the bird.
+    """
+    return (bird_radius * 2 + 21, bird_radius * 2 + 21)
+
+
+def pig_skin_size(radius: int):
+    """
+    Returns size of the image of the pig with the given radius.
+    """
+    if radius == 20:
+        return (radius * 2 + 10, radius * 2 + 10)
+    return (radius * 2 + 13, radius * 2 + 13)
+
+
+def load_image(file: str, size: tuple):
+    """
+    Returns image from the file in images folder resized to given size.
+    Image is not converted to display's pixel format, so it can be loaded in any thread.
+    """
+    return pygame.transform.smoothscale(pygame.image.load(f'images/{file}'), size)
+
+
 class CoordinatesError(Exception):
     """
     Class CoordinatesError.
@@ -183,8 +211,7 @@ class Bird:
         self.x_velocity = 0
         self.y_velocity = 0
         self.body.velocity = (self.x_velocity, self.y_velocity)
-        skin_radius = bird_radius * 2 + 21
-        self.body.skin = Skin(self, 'red_bird.png', (skin_radius, skin_radius))
+        self.body.skin = Skin(self, 'red_bird.png', bird_skin_size())
         space.add(self.body, self.shape)
 
     @property
@@ -214,6 +241,7 @@ class Bird:
         """
         Sets speed of the bird depending on angle and velocity given by user by keyboard keys
         or depending on mouse position.
+        Draws line from the bird to the mouse position unless screen is None.
         """
         max_speed = aiming_range * 1913 / 400
         if mouse_pos is None:
@@ -246,15 +274,31 @@ class Bird:
                 self.angle = 360 - angle
             else:
                 self.angle = angle
-            # Calculates the point where the line from bird to mouse position should end so it will represent maximum
-            # force that can be aplied to a bird.
-            line_point = (x + aiming_range * cos(radians(self.angle + 180)),
-                          y + aiming_range * sin(radians(self.angle + 180)))
-            if is_on_circle(bird_position, aiming_range, mouse_pos):
-                pygame.draw.line(screen, (0, 0, 0), convert_coords(mouse_pos), convert_coords(bird_position), 3)
-            else:
-                pygame.draw.line(screen, (0, 0, 0), convert_coords(line_point), convert_coords(bird_position), 3)
+            if screen is not None:
+                pygame.draw.line(
+                    screen, (0, 0, 0), convert_coords(self.aiming_point(mouse_pos)), convert_coords(bird_position), 3
+                )
             self.velocity = distance * 1913 / 400
+        self.aim(self.angle, self.velocity)
+
+    def aiming_point(self, mouse_pos: tuple):
+        """
+        Returns point where the line from the bird to the mouse position ends.
+        """
+        if is_on_circle(bird_position, aiming_range, mouse_pos):
+            return mouse_pos
+        # Calculates the point where the line from bird to mouse position should end so it will represent maximum
+        # force that can be aplied to a bird.
+        x, y = bird_position
+        return (x + aiming_range * cos(radians(self.angle + 180)),
+                y + aiming_range * sin(radians(self.angle + 180)))
+
+    def aim(self, angle: float, velocity: float):
+        """
+        Sets angle and velocity of the bird and calculates its horizontal and vertical speed.
+        """
+        self.angle = angle
+        self.velocity = velocity
         self.x_velocity = int(self.velocity * cos(radians(self.angle)))
         self.y_velocity = int(self.velocity * sin(radians(self.angle)))
 
@@ -279,6 +323,10 @@ class Trajectory:
 
     :param a_of_pattern: first coefficient of quadratic function of trajcetory
     :type x_velocity: float
+
+    :param overlay: transparent surface with points of the trajectory and its rectangle on the screen,
+    drawn again only when velocity of the bird changes
+    :type overlay: tuple
     """
     def __init__(self, bird: Bird):
         """
@@ -290,6 +338,8 @@ class Trajectory:
         self.start_point = list(bird.body.position)
         self.vertex = list(bird.body.position)
         self.a_of_pattern = 0
+        self._overlay = None
+        self._overlay_key = None
 
     def calc(self):
         """
@@ -305,33 +355,69 @@ class Trajectory:
             # Calculates 'a' coefficient of the function
             self.a_of_pattern = (self.start_point[1] - self.vertex[1]) / ((self.start_point[0] - self.vertex[0]) ** 2)
 
-    def draw(self, screen: pygame.Surface):
+    def point_array(self):
         """
-        Draws trajectory of the bird based of user input.
+        Returns NumPy array with coordinates of points of the trajectory in pygame's coordinates in rows.
+        All points are calculated at once from the quadratic function.
         """
-        if self.y_vel >= 0:
+        if self.y_vel < 0 or (self.x_vel and not self.y_vel) or (not self.x_vel and self.y_vel <= 0):
+            return np.empty((0, 2))
+        if self.x_vel:
             interval = int(abs(self.x_vel) / 15) + 1
             if self.x_vel > 0:
-                # Draws trajectory when bird is shot to the right
-                for x in range(bird_position[0], 700, interval):
-                    y = self.a_of_pattern * (x - self.vertex[0]) ** 2 + self.vertex[1]
-                    if y >= 100 and self.y_vel:
-                        pygame.draw.circle(screen, (0, 0, 0), convert_coords((x, y)), 3)
-            elif self.x_vel < 0:
-                # Draws trajectory when bird is shot to the left
-                for x in range(-100, bird_position[0], interval):
-                    y = self.a_of_pattern * (x - self.vertex[0]) ** 2 + self.vertex[1]
-                    if y >= 100 and self.y_vel:
-                        pygame.draw.circle(screen, (0, 0, 0), convert_coords((x, y)), 3)
-            elif self.y_vel > 0:
-                # Draws trajectory when bird is shot straight upwards
-                distance = self.y_vel ** 2 / (2 * -gravity[1])
-                pygame.draw.circle(screen, (0, 0, 0),
-                                   (bird_position[0], SCREEN_HEIGHT - (distance + bird_radius + floor_height)), 3)
-                for height in range(0, int(distance), 30):
-                    pygame.draw.circle(screen, (0, 0, 0),
-                                       (bird_position[0],
-                                        SCREEN_HEIGHT - (floor_height + bird_radius + height)), 3)
+                # Calculates trajectory when bird is shot to the right
+                xs = np.arange(bird_position[0], 700, interval)
+            else:
+                # Calculates trajectory when bird is shot to the left
+                xs = np.arange(-100, bird_position[0], interval)
+            ys = self.a_of_pattern * (xs - self.vertex[0]) ** 2 + self.vertex[1]
+            visible = ys >= 100
+            return np.column_stack((xs[visible], SCREEN_HEIGHT - ys[visible]))
+        # Calculates trajectory when bird is shot straight upwards
+        distance = self.y_vel ** 2 / (2 * -gravity[1])
+        heights = np.concatenate(([distance], np.arange(0, int(distance), 30)))
+        ys = SCREEN_HEIGHT - (floor_height + bird_radius + heights)
+        return np.column_stack((np.full(len(ys), bird_position[0]), ys))
+
+    def overlay(self):
+        """
+        Returns transparent surface with points of the trajectory and its rectangle on the screen
+        or None if trajectory is empty.
+        Surface is drawn again only if velocity of the bird changed since the last call.
+        """
+        key = (self.x_vel, self.y_vel)
+        if key != self._overlay_key:
+            self._overlay_key = key
+            self._overlay = None
+            points = self.point_array()
+            if len(points):
+                left, top = points.min(axis=0)
+                right, bottom = points.max(axis=0)
+                rect = pygame.Rect(left - 4, top - 4, right - left + 8, bottom - top + 8)
+                # Transparent color with run-length encoding makes blitting mostly empty surface cheap.
+                surface = pygame.Surface(rect.size)
+                surface.fill((255, 0, 255))
+                surface.set_colorkey((255, 0, 255), pygame.RLEACCEL)
+                # Centers are truncated like by pygame.draw.circle on the screen, also for negative coordinates.
+                for point in (np.trunc(points) - rect.topleft).tolist():
+                    pygame.draw.circle(surface, (0, 0, 0), point, 3)
+                self._overlay = (surface, rect)
+        return self._overlay
+
+    def rect(self):
+        """
+        Returns pygame's rectangle which contains whole trajectory or None if trajectory is empty.
+        """
+        overlay = self.overlay()
+        return None if overlay is None else overlay[1]
+
+    def draw(self, screen: pygame.Surface):
+        """
+        Draws trajectory of the bird based of user input by blitting its cached overlay.
+        """
+        overlay = self.overlay()
+        if overlay is not None:
+            screen.blit(*overlay)
 
 
 class Pig:
@@ -365,11 +451,7 @@ class Pig:
         self._shape.friction = 0.8
         self._shape.color = pygame.Color(colors.pig)
         self._shape.collision_type = 3
-        if self._radius == 20:
-            skin_radius = self._radius * 2 + 10
-        else:
-            skin_radius = self._radius * 2 + 13
-        self.body.skin = Skin(self, 'pig.png', (skin_radius, skin_radius))
+        self.body.skin = Skin(self, 'pig.png', pig_skin_size(self._radius))
         space.add(self.body, self._shape)
 
     @property
@@ -566,6 +648,141 @@ class Floor:
         return self._shape
 
 
+class TextureCache:
+    """
+    Class TextureCache.
+    Keeps images loaded from files and resized to given size, so that all skins
+    with the same file and size share one surface and the file is read only once.
+    Keeps also rotated copies of these images.
+    Contains attributes:
+    :param textures: loaded images and information whether they were converted to display's pixel format,
+    stored by file and size or by file, size and angle of rotation
+    :type textures: dict
+
+    :param hits: number of requests for images which were already loaded
+    :type hits: int
+
+    :param misses: number of requests for images which had to be loaded from file
+    :type misses: int
+
+    :param memory_usage: number of bytes used by pixels of all loaded images
+    :type memory_usage: int
+    """
+    def __init__(self):
+        """
+        Creates empty instance of TextureCache.
+        """
+        self._textures = {}
+        self._hits = 0
+        self._misses = 0
+        self._memory_usage = 0
+
+    @property
+    def hits(self):
+        """
+        Returns number of requests for images which were already loaded.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Returns number of requests for images which had to be loaded from file.
+        """
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """
+        Returns part of requests for images which were already loaded.
+        """
+        requests = self._hits + self._misses
+        return self._hits / requests if requests else 0
+
+    @property
+    def memory_usage(self):
+        """
+        Returns number of bytes used by pixels of all loaded images.
+        """
+        return self._memory_usage
+
+    def __len__(self):
+        """
+        Returns number of loaded images.
+        """
+        return len(self._textures)
+
+    def __contains__(self, key: tuple):
+        """
+        Returns True if image with the (file, size) key was loaded.
+        """
+        return (key[0], tuple(key[1])) in self._textures
+
+    def add(self, file: str, size: tuple, image: pygame.Surface):
+        """
+        Stores image from the file resized to given size which was loaded outside the cache, e.g. by another thread.
+        Image is converted to display's pixel format when it is requested for the first time.
+        """
+        self._store((file, tuple(size)), image, False)
+
+    def get(self, file: str, size: tuple):
+        """
+        Returns image from the file in images folder resized to given size.
+        Loads the image only if it was not loaded before in the same size.
+        """
+        key = (file, tuple(size))
+        # Images can be converted to display's pixel format only if display was created.
+        display_set = pygame.display.get_surface() is not None
+        if key in self._textures:
+            self._hits += 1
+            image, converted = self._textures[key]
+            if not converted and display_set:
+                image = image.convert_alpha()
+                self._store(key, image, True)
+            return image
+        self._misses += 1
+        image = load_image(file, size)
+        if display_set:
+            image = image.convert_alpha()
+        self._store(key, image, display_set)
+        return image
+
+    def get_rotated(self, file: str, size: tuple, angle: int):
+        """
+        Returns image from the file in images folder resized to given size and rotated by angle in degrees.
+        Rotates the image only if it was not rotated before by the same angle.
+        """
+        key = (file, tuple(size), angle)
+        if key in self._textures:
+            self._hits += 1
+            return self._textures[key][0]
+        image = pygame.transform.rotate(self.get(file, size), angle)
+        self._store(key, image, True)
+        return image
+
+    def _store(self, key: tuple, image: pygame.Surface, converted: bool):
+        """
+        Stores image by the key and updates memory usage, subtracting size of the image which it replaces.
+        """
+        if key in self._textures:
+            old_image = self._textures[key][0]
+            self._memory_usage -= old_image.get_bytesize() * old_image.get_width() * old_image.get_height()
+        self._textures[key] = (image, converted)
+        self._memory_usage += image.get_bytesize() * image.get_width() * image.get_height()
+
+    def clear(self):
+        """
+        Removes all loaded images and resets counters.
+        """
+        self._textures.clear()
+        self._hits = 0
+        self._misses = 0
+        self._memory_usage = 0
+
+
+textures = TextureCache()
+
+
 class Skin:
     """
     Class Skin. Contains attributes:
@@ -577,18 +794,24 @@ class Skin:
 
     :param image: image after rotation
     :type image: pygame.Image
+
+    :param angle: angle in degrees by which image was rotated, rounded to rotation_step
+    :type angle: int
     """
     def __init__(self, object, file: str, size: tuple):
         """
         Creates instance of skin with image compressed to given size.
+        Image is taken from textures, so it is shared with other skins with the same file and size.
 
         Raises ValueError if size is not positive.
         """
         check_size(size)
         self._object = object
-        image = pygame.image.load(f'images/{file}').convert_alpha()
-        self._default_image = pygame.transform.smoothscale(image, size)
+        self._file = file
+        self._size = tuple(size)
+        self._default_image = textures.get(file, size)
         self._image = None
+        self._angle = None
 
     @property
     def object(self):
@@ -611,21 +834,120 @@ class Skin:
         """
         return self._image
 
-    def update(self, screen: pygame.Surface):
+    @property
+    def angle(self):
         """
-        Rotates skin's image, changes its position and draws on the screen depending
-        on object's position and rotation.
+        Returns angle in degrees by which image was rotated.
         """
+        return self._angle
+
+    def update(self, screen: pygame.Surface, position=None, angle=None):
+        """
+        Rotates skin's image, changes its position and draws on the screen depending
+        on object's position and rotation, which can be replaced by the given position and angle in radians.
+        Angle of rotation is rounded to rotation_step and rotated images are taken from textures.
+        Image is not rotated again if the rounded angle has not changed since the last update.
+        """
+        if position is None:
+            position = self._object.body.position
+        if angle is None:
+            angle = self._object.body.angle
         if self._object.shape.collision_type == 3:
-            image_center = (self._object.body.position[0],
-                            self._object.body.position[1] + 3)
+            image_center = (position[0], position[1] + 3)
         else:
-            image_center = self._object.body.position
-        self._image = pygame.transform.rotate(self._default_image, degrees(self._object.body.angle))
+            image_center = position
+        angle = round(degrees(angle) / rotation_step) * rotation_step % 360
+        if angle != self._angle:
+            self._image = textures.get_rotated(self._file, self._size, angle)
+            self._angle = angle
         self._rect = self._image.get_rect(center=image_center)
         screen.blit(self._image, convert_coords(self._rect.bottomleft))
 
 
+class FontCache:
+    """
+    Class FontCache.
+    Keeps system fonts, so that every font is looked for only once,
+    and texts rendered with them, so that the same text is not rendered again.
+    Rendered texts have white color set as transparent.
+    Contains attributes:
+    :param max_size: maximal number of rendered texts kept in the cache, defualt: text_cache_size
+    :type max_size: int
+
+    :param fonts: pygame fonts stored by font type and size
+    :type fonts: dict
+
+    :param texts: rendered texts stored by font type, size, content, color and background
+    ordered from the least recently used
+    :type texts: collections.OrderedDict
+    """
+    def __init__(self, max_size=text_cache_size):
+        """
+        Creates empty instance of FontCache.
+
+        Raises ValueError if max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError('Size of the cache has to be positive')
+        self._max_size = max_size
+        self._fonts = {}
+        self._texts = collections.OrderedDict()
+
+    @property
+    def max_size(self):
+        """
+        Returns maximal number of rendered texts kept in the cache.
+        """
+        return self._max_size
+
+    def __len__(self):
+        """
+        Returns number of rendered texts kept in the cache.
+        """
+        return len(self._texts)
+
+    def font(self, font_type: str, size: int):
+        """
+        Returns system font of the given type and size.
+        Initializes font module of pygame if it was not initialized.
+        """
+        key = (font_type, size)
+        if key not in self._fonts:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._fonts[key] = pygame.font.SysFont(font_type, size)
+        return self._fonts[key]
+
+    def render(self, font_type: str, size: int, str: str, color: tuple, background: tuple):
+        """
+        Returns surface with the text rendered with the given font, color and background.
+        White color of the surface is transparent.
+        Removes the least recently used text if there are more than max_size texts in the cache.
+
+        Raises ValueError if color or background is invalid.
+        """
+        key = (font_type, size, str, tuple(color), tuple(background))
+        if key in self._texts:
+            self._texts.move_to_end(key)
+            return self._texts[key]
+        surf = self.font(font_type, size).render(str, True, color, background)
+        surf.set_colorkey((255, 255, 255))
+        self._texts[key] = surf
+        if len(self._texts) > self._max_size:
+            self._texts.popitem(last=False)
+        return surf
+
+    def clear(self):
+        """
+        Removes all fonts and rendered texts.
+        """
+        self._fonts.clear()
+        self._texts.clear()
+
+
+fonts = FontCache()
+
+
 class Text:
     """
     Class Text. Contains attributes:
@@ -647,7 +969,7 @@ class Text:
     :param font_type: system's font of the text, defualt: 'timesnewroman'
     :type font_type: str
 
-    :param font: pygame font object, contains font_type and size
+    :param font: pygame font object, contains font_type and size, taken from fonts
     :type font: pygame.font.SysFont
     """
     def __init__(
@@ -677,8 +999,8 @@ class Text:
         self._color = color
         self._background = background
         self._font_type = font
-        self._font = pygame.font.SysFont(self._font_type, self._size)
-        self._surf = self._font.render(self._str, True, self._color, self._background)
+        self._font = fonts.font(self._font_type, self._size)
+        self._surf = self._render()
 
     @property
     def str(self):
@@ -722,14 +1044,29 @@ class Text:
         """
         return self._font_type
 
+    @property
+    def rect(self):
+        """
+        Returns pygame's rectangle which contains the text.
+        """
+        return self._surf.get_rect(topleft=self._position)
+
+    def _render(self):
+        """
+        Returns surface with rendered text taken from fonts.
+        """
+        return fonts.render(self._font_type, self._size, self._str, self._color, self._background)
+
     def set_str(self, screen: pygame.Surface, new_str: str):
         """
-        Changes str of the text to new_str and draws new text.
+        Changes str of the text to new_str and draws new text unless screen is None.
+        Text is rendered again only if new_str is different from the current str.
         """
-        self._str = new_str
-        self._surf = self._font.render(self._str, True, self._color, self._background)
-        self._surf.set_colorkey((255, 255, 255))
-        screen.blit(self._surf, self._position)
+        if new_str != self._str:
+            self._str = new_str
+            self._surf = self._render()
+        if screen is not None:
+            screen.blit(self._surf, self._position)
 
     def set_position(self, new_position: tuple):
         """
@@ -749,8 +1086,8 @@ class Text:
         if new_size <= 0:
             raise ValueError('Size has to be positive')
         self._size = new_size
-        self._font = pygame.font.SysFont(self._font_type, self._size)
-        self._surf = self._font.render(self._str, True, self._color, self._background)
+        self._font = fonts.font(self._font_type, self._size)
+        self._surf = self._render()
 
     def set_color(self, new_color: tuple):
         """
@@ -759,7 +1096,7 @@ class Text:
         Raises ValueError if color is invalid.
         """
         self._color = new_color
-        self._surf = self._font.render(self._str, True, self._color, self._background)
+        self._surf = self._render()
 
     def set_background(self, new_background: tuple):
         """
@@ -768,19 +1105,18 @@ class Text:
         Raises ValueError if background is invalid.
         """
         self._background = new_background
-        self._surf = self._font.render(self._str, True, self._color, self._background)
+        self._surf = self._render()
 
     def set_font_type(self, new_font_type: str):
         """
         Changes font_type of the text to new_font_type.
         """
         self._font_type = new_font_type
-        self._font = pygame.font.SysFont(self._font_type, self._size)
-        self._surf = self._font.render(self._str, True, self._color, self._background)
+        self._font = fonts.font(self._font_type, self._size)
+        self._surf = self._render()
 
     def draw(self, screen: pygame.Surface):
         """
         Draws text on pygame display.
         """
-        self._surf.set_colorkey((255, 255, 255))
         screen.blit(self._surf, self._position)
@@ -1,63 +1,182 @@
+import json
 import pymunk
 
 
-def calculate_collision(arbiter: pymunk.Arbiter, space: pymunk.Space, data):
-    """
-    Depending on which bodies has collided it decides whether the body should be removed
-    from pymunk's space taking kinetic energy of the collision into account.
-    """
-    shape_1, shape_2 = arbiter.shapes
-    match (shape_1.collision_type, shape_2.collision_type):
-        case (1, 3):
-            if arbiter.total_ke > 3000000:
-                space.remove(shape_2.body, shape_2)
-                return False
-        case (2, 3):
-            if arbiter.total_ke > 40000000:
-                space.remove(shape_2.body, shape_2)
-        case (3, 4) | (3, 5) | (3, 6):
-            if arbiter.total_ke > 23000000:
-                space.remove(shape_1.body, shape_1)
-        case (3, 3):
-            if arbiter.total_ke > 23000000:
-                space.remove(shape_1.body, shape_1)
-                space.remove(shape_2.body, shape_2)
-        case (2, 5) | (4, 5) | (5, 5) | (5, 6):
-            if arbiter.total_ke > 300000000:
-                space.remove(shape_2.body, shape_2)
-        case (5, 6):
-            if arbiter.total_ke > 300000000:
-                space.remove(shape_1.body, shape_1)
-    return True
-
-
-def create_handlers(space: pymunk.Space):
-    """
-    Creates collision handlers for every combination of collision types.
-    Adds calculate_collision function as a callback function for begin and post_solve
-    events of each of pymunk's collision handlers.
-    """
-    handlers = [space.add_collision_handler(i, j)
-                for i in range(1, 6) for j in range(i + 1, 6)]
-    for handler in handlers:
-        handler.begin = calculate_collision
-        handler.post_solve = calculate_collision
-    return handlers
+collision_types = {
+    'bird': 1,
+    'floor': 2,
+    'pig': 3,
+    'bar': 4,
+    'wooden_bar': 5,
+    'stone_bar': 6
+}
+
+_damage_table = {}
+
+
+def compile_damage_table(data: dict):
+    """
+    Returns dictionary in which every pair of collision types which can cause damage is mapped to
+    kinetic energy above which objects are destroyed and indexes of destroyed shapes in the pair.
+    Pairs are ordered so that the collision type of the first shape is not bigger than the second one.
+
+    Raises KeyError if name of the object is invalid.
+
+    Raises ValueError if energy is negative or destroyed object does not belong to the pair.
+    """
+    table = {}
+    for entry in data['damage']:
+        names = sorted(entry['pair'], key=lambda name: collision_types[name])
+        pair = tuple(collision_types[name] for name in names)
+        if entry['energy'] < 0:
+            raise ValueError('Energy cannot be negative')
+        indexes = []
+        for name in entry['destroy']:
+            # The second shape is destroyed first when both shapes have the same type.
+            free = [index for index in (1, 0) if names[index] == name and index not in indexes]
+            if not free:
+                raise ValueError(f'Destroyed object {name} does not belong to the pair')
+            indexes.append(free[0])
+        table[pair] = (entry['energy'], tuple(sorted(indexes)))
+    return table
+
+
+def get_damage_table(path='setup/damage.json'):
+    """
+    Returns damage table compiled from the JSON file.
+    File is loaded and compiled only once for every path.
+    """
+    if path not in _damage_table:
+        with open(path) as fp:
+            _damage_table[path] = compile_damage_table(json.load(fp))
+    return _damage_table[path]
+
+
+class Destruction:
+    """
+    Class Destruction. Describes object removed from pymunk's space after a collision.
+    Contains attributes:
+    :param shape: removed shape
+    :type shape: pymunk.Shape
+
+    :param body: body of the removed shape
+    :type body: pymunk.Body
+
+    :param collision_type: collision type of the removed shape
+    :type collision_type: int
+
+    :param position: position of the body when it was removed
+    :type position: tuple
 
+    :param energy: kinetic energy of the collision which destroyed the object
+    :type energy: float
+    """
+    def __init__(self, shape: pymunk.Shape, energy: float):
+        """
+        Creates instance of Destruction.
+        """
+        self.shape = shape
+        self.body = shape.body
+        self.collision_type = shape.collision_type
+        self.position = tuple(shape.body.position)
+        self.energy = energy
+
+
+class DestructionQueue:
+    """
+    Class DestructionQueue.
+    Collects shapes marked for removal by collision callbacks during pymunk's step
+    and removes all of them at once in a post-step callback after the step.
+    Every shape is removed only once even if it was marked by several collisions.
+    Contains attributes:
+    :param marked: energies of collisions which destroyed marked shapes stored by shapes
+    :type marked: dict
+
+    :param events: destructions made since events were taken by pop_events method
+    :type events: list
+    """
+    def __init__(self):
+        """
+        Creates instance of DestructionQueue.
+        """
+        self._marked = {}
+        self._events = []
+
+    @property
+    def marked(self):
+        """
+        Returns list of shapes which will be removed after the current step.
+        """
+        return list(self._marked)
+
+    @property
+    def events(self):
+        """
+        Returns list of destructions which were not taken yet.
+        """
+        return self._events
+
+    def mark(self, space: pymunk.Space, shape: pymunk.Shape, energy: float):
+        """
+        Marks shape for removal after the current step of the space.
+        """
+        if shape not in self._marked:
+            self._marked[shape] = energy
+        space.add_post_step_callback(self.remove_marked, self)
 
-def rolling_resistance(space: pymunk.Space):
+    def remove_marked(self, space: pymunk.Space, key=None):
+        """
+        Removes all marked shapes which are still in the space together with their bodies
+        and adds Destruction of each of them to events.
+        """
+        for shape, energy in self._marked.items():
+            if shape.space is space:
+                space.remove(shape.body, shape)
+                self._events.append(Destruction(shape, energy))
+        self._marked.clear()
+
+    def pop_events(self):
+        """
+        Returns list of destructions which were not taken yet and clears it.
+        """
+        events = self._events
+        self._events = []
+        return events
+
+
+def damage_callback(energy: float, indexes: tuple):
     """
-    Creates rolling resistance for bird and pigs which slows down
-    their horizontal speed when their vertical speed is zero.
+    Returns post_solve callback which marks shapes with the given indexes for removal from pymunk's space
+    when kinetic energy of the collision is bigger than energy.
     """
-    for body, shape in zip(space.bodies, space.shapes):
-        if shape.collision_type == 1 or shape.collision_type == 3:
-            if round(body.velocity[1]) == 0:
-                if body.velocity[0] >= 3:
-                    body.velocity -= (3, 0)
-                elif body.velocity[0] > 0:
-                    body.velocity = (0, 0)
-                elif body.velocity[0] <= -3:
-                    body.velocity += (3, 0)
-                elif body.velocity[0] < 0:
-                    body.velocity = (0, 0)
+    if len(indexes) == 1:
+        index = indexes[0]
+
+        def calculate_collision(arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+            if arbiter.total_ke > energy:
+                space.destruction_queue.mark(space, arbiter.shapes[index], arbiter.total_ke)
+    else:
+        def calculate_collision(arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+            if arbiter.total_ke > energy:
+                for shape in arbiter.shapes:
+                    space.destruction_queue.mark(space, shape, arbiter.total_ke)
+    return calculate_collision
+
+
+def create_handlers(space: pymunk.Space, table=None):
+    """
+    Creates collision handlers only for pairs of collision types from the damage table,
+    which defaults to the table loaded by get_damage_table.
+    Every handler gets its own post_solve callback created by damage_callback.
+    Kinetic energy is not checked in begin, because impulses of new contacts are not calculated yet.
+    Sets destruction_queue attribute of the space, which removes destroyed objects after every step.
+    """
+    if table is None:
+        table = get_damage_table()
+    space.destruction_queue = DestructionQueue()
+    handlers = []
+    for (type_1, type_2), (energy, indexes) in table.items():
+        handler = space.add_collision_handler(type_1, type_2)
+        handler.post_solve = damage_callback(energy, indexes)
+        handlers.append(handler)
+    return handlers
@@ -0,0 +1,95 @@
+import numpy as np
+import pymunk
+from setup.config import FPS, physics_rate
+
+
+def rolling_resistance(velocities: np.ndarray, dt: float):
+    """
+    Creates rolling resistance which slows down horizontal speed of bodies by 3 every 1 / FPS seconds
+    when their vertical speed is zero and stops bodies which are slower than that.
+    Velocities is an array with one row of horizontal and vertical velocity for every body.
+    """
+    x_velocities = velocities[:, 0]
+    rolling = np.rint(velocities[:, 1]) == 0
+    resistance = 3 * FPS * dt
+    stopped = rolling & (x_velocities != 0) & (np.abs(x_velocities) < resistance)
+    velocities[rolling, 0] -= np.sign(x_velocities[rolling]) * resistance
+    velocities[stopped] = 0
+
+
+class ForcePass:
+    """
+    Class ForcePass.
+    Keeps index of bodies affected by custom forces and applies all forces to their velocities
+    at once as operations on NumPy arrays.
+    Every force is a function taking array of velocities, which it changes in place, and time step.
+    Contains attributes:
+    :param bodies: bodies affected by forces, removed from the index when they leave their space
+    :type bodies: list
+
+    :param forces: functions changing velocities of bodies, default: rolling_resistance
+    :type forces: list
+    """
+    def __init__(self, forces=(rolling_resistance,)):
+        """
+        Creates instance of ForcePass with empty index of bodies.
+        """
+        self._bodies = []
+        self._forces = list(forces)
+
+    @property
+    def bodies(self):
+        """
+        Returns list of bodies affected by forces.
+        """
+        return self._bodies
+
+    @property
+    def forces(self):
+        """
+        Returns list of applied forces.
+        """
+        return self._forces
+
+    def __len__(self):
+        """
+        Returns number of bodies in the index.
+        """
+        return len(self._bodies)
+
+    def add_force(self, force):
+        """
+        Adds force applied after all previously added forces.
+        """
+        self._forces.append(force)
+
+    def add(self, body: pymunk.Body):
+        """
+        Adds body to the index.
+        """
+        self._bodies.append(body)
+
+    def set_space(self, space: pymunk.Space, collision_types=(1, 3)):
+        """
+        Replaces index with bodies of the space which have shapes with the given collision types,
+        by default birds and pigs.
+        """
+        self._bodies = [shape.body for shape in space.shapes if shape.collision_type in collision_types]
+
+    def apply(self, dt=1 / physics_rate):
+        """
+        Applies all forces to bodies in the index which are not sleeping.
+        Only bodies whose velocity was changed are updated, because setting velocity wakes the body up.
+        """
+        bodies = [body for body in self._bodies if body.space is not None]
+        if len(bodies) != len(self._bodies):
+            self._bodies = bodies
+        bodies = [body for body in bodies if not body.is_sleeping]
+        if not bodies or not self._forces:
+            return
+        velocities = np.array([tuple(body.velocity) for body in bodies], dtype=float)
+        previous = velocities.copy()
+        for force in self._forces:
+            force(velocities, dt)
+        for index in np.flatnonzero((velocities != previous).any(axis=1)):
+            bodies[index].velocity = (float(velocities[index, 0]), float(velocities[index, 1]))
@@ -0,0 +1,213 @@
+import argparse
+import json
+import math
+import random
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    floor_height
+)
+
+
+min_x_position = 40
+max_x_position = SCREEN_WIDTH - 520
+max_y_position = SCREEN_HEIGHT - floor_height - 20
+max_tower_floors = 4
+structure_kinds = ('tower', 'pyramid', 'pig_field')
+
+
+def bar(x_position: float, y_position: float, x_size: float, y_size: float, stone=False):
+    """
+    Returns dictionary describing bar in the format of levels.json.
+    Positions are given in the same way as in levels.json: x from the right edge of the screen
+    and y from the floor to the center of the bar.
+    """
+    data = {
+        'x_position': round(x_position, 1),
+        'y_position': round(y_position, 1),
+        'x_size': round(x_size, 1),
+        'y_size': round(y_size, 1)
+    }
+    if stone:
+        data['type'] = 'stone'
+    return data
+
+
+def pig(x_position: float, y_position: float, radius: float):
+    """
+    Returns dictionary describing pig in the format of levels.json.
+    """
+    return {
+        'x_position': round(x_position, 1),
+        'y_position': round(y_position, 1),
+        'radius': round(radius, 1)
+    }
+
+
+def tower(x_position: float, unit: float, floors: int, width=3, stone=False):
+    """
+    Returns pigs and bars of the tower standing on the floor with center at x_position.
+    Every floor consists of two posts of size (unit, 2 * unit), roof lying on them
+    and pig standing between the posts.
+    Width of the floor between the posts is given in units.
+    """
+    thickness = unit
+    height = 2 * unit
+    span = width * unit
+    pigs, bars = [], []
+    base = 0
+    for _ in range(floors):
+        bars.append(bar(x_position - span / 2, base + height / 2, thickness, height, stone))
+        bars.append(bar(x_position + span / 2, base + height / 2, thickness, height, stone))
+        bars.append(bar(x_position, base + height + thickness / 2, span + thickness, thickness, stone))
+        pigs.append(pig(x_position, base + unit * 0.6, unit * 0.6))
+        base += height + thickness
+    return pigs, bars
+
+
+def pyramid(x_position: float, unit: float, rows: int, stone=False):
+    """
+    Returns bars of the pyramid of square blocks of size unit standing on the floor with center at x_position.
+    The lowest row has rows blocks and every next row has one block less.
+    """
+    bars = []
+    for row in range(rows):
+        blocks = rows - row
+        left = x_position - (blocks - 1) * unit / 2
+        for block in range(blocks):
+            bars.append(bar(left + block * unit, row * unit + unit / 2, unit, unit, stone))
+    return [], bars
+
+
+def pig_field(x_position: float, unit: float, pigs: int):
+    """
+    Returns row of pigs with radius unit / 2 lying on the floor with center at x_position.
+    """
+    spacing = 1.5 * unit
+    left = x_position - (pigs - 1) * spacing / 2
+    return [pig(left + index * spacing, unit / 2, unit / 2) for index in range(pigs)], []
+
+
+def structure_width(kind: str, unit: float, size: int, width=3):
+    """
+    Returns horizontal size of the structure of the given kind and size.
+    Size is number of floors of the tower, rows of the pyramid or pigs of the pig field.
+    """
+    if kind == 'tower':
+        return (width + 1) * unit
+    if kind == 'pyramid':
+        return size * unit
+    return (size - 1) * 1.5 * unit + unit
+
+
+def place_structures(rng: random.Random, objects: int, unit: float, stone_ratio: float, kinds: tuple):
+    """
+    Places structures of random kinds and sizes made of objects of the given unit size
+    next to each other from the right edge of the screen until there are at least the given number
+    of objects or there is no more space.
+    Returns lists of pigs and bars.
+    """
+    max_floors = max(1, min(max_tower_floors, int(max_y_position // (3 * unit))))
+    max_rows = max(1, int(max_y_position // unit))
+    pigs, bars = [], []
+    x_position = min_x_position
+    while len(pigs) + len(bars) < objects:
+        left = objects - len(pigs) - len(bars)
+        kind = rng.choice(kinds)
+        if kind == 'tower':
+            size = min(rng.randint(max(1, max_floors // 2), max_floors), max(1, -(-left // 4)))
+        elif kind == 'pyramid':
+            size = min(rng.randint(max(1, max_rows // 2), max_rows), max(1, math.ceil(math.sqrt(2 * left))))
+        else:
+            size = min(rng.randint(1, 6), left)
+        width = structure_width(kind, unit, size)
+        if x_position + width > max_x_position:
+            break
+        center = x_position + width / 2
+        stone = rng.random() < stone_ratio
+        if kind == 'tower':
+            new_pigs, new_bars = tower(center, unit, size, stone=stone)
+        elif kind == 'pyramid':
+            new_pigs, new_bars = pyramid(center, unit, size, stone)
+        else:
+            new_pigs, new_bars = pig_field(center, unit, size)
+        pigs.extend(new_pigs)
+        bars.extend(new_bars)
+        x_position += width + unit
+    return pigs, bars
+
+
+def generate_level(number: int, objects=100, seed=None, birds=3, stone_ratio=0.3, kinds=structure_kinds):
+    """
+    Returns data of the level with the given number in the format of levels.json.
+    Level consists of towers, pyramids and pig fields of random sizes placed next to each other
+    from the right edge of the screen and has approximately the given number of objects.
+    Towers have at most max_tower_floors floors, because higher towers collapse under their own weight.
+    Size of the objects is chosen so that all of them fit in the area which the bird can reach
+    and is reduced until at least 90% of the objects fit, so the number of objects can be anything
+    from tens to thousands.
+    Level with the same arguments and seed is always the same.
+
+    Raises ValueError if number of objects is smaller than 1 or kinds are invalid.
+    """
+    if objects < 1:
+        raise ValueError('Number of objects has to be positive')
+    if not kinds or any(kind not in structure_kinds for kind in kinds):
+        raise ValueError('Invalid kind of structure')
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    area = (max_x_position - min_x_position) * max_y_position
+    unit = min(40, max(4, math.sqrt(area / objects / 2.2)))
+    while True:
+        pigs, bars = place_structures(random.Random(seed), objects, unit, stone_ratio, kinds)
+        if len(pigs) + len(bars) >= objects * 0.9 or unit <= 4:
+            break
+        unit = max(4, unit * 0.9)
+    return {
+        'level': number,
+        'objects': {
+            'birds': {
+                'amount': birds
+            },
+            'pigs': pigs,
+            'bars': bars
+        }
+    }
+
+
+def generate_levels(sizes: list, seed=None, **kwargs):
+    """
+    Returns data in the format of levels.json with one generated level for every number of objects in sizes.
+    Every level gets its own seed derived from the given seed.
+    Other keyword arguments are passed to generate_level function.
+    """
+    rng = random.Random(seed)
+    return {
+        'levels': [
+            generate_level(number, objects, rng.randrange(2 ** 32), **kwargs)
+            for number, objects in enumerate(sizes, 1)
+        ]
+    }
+
+
+def main(argv=None):
+    """
+    Generates levels and saves them to the file in the format of levels.json.
+    """
+    parser = argparse.ArgumentParser(description='Generates levels with many objects for scaling tests.')
+    parser.add_argument('sizes', type=int, nargs='+', help='approximate number of objects in every level')
+    parser.add_argument('--output', default='stress_levels.json', help='file to which levels are saved')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generator, default: 0')
+    parser.add_argument('--birds', type=int, default=3, help='number of attempts in every level, default: 3')
+    parser.add_argument('--stone-ratio', type=float, default=0.3, help='part of stone structures, default: 0.3')
+    args = parser.parse_args(argv)
+    data = generate_levels(args.sizes, args.seed, birds=args.birds, stone_ratio=args.stone_ratio)
+    with open(args.output, 'w') as fp:
+        json.dump(data, fp, indent=4)
+    for level in data['levels']:
+        objects = level['objects']
+        print(f'level {level["level"]}: {len(objects["pigs"])} pigs, {len(objects["bars"])} bars')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@ import pymunk
 import json
 import os
 import time
+import collections
+from math import degrees
 import src.collisions as collisions
 from src.classes import (
     Bird,
@@ -15,20 +17,37 @@ from src.classes import (
     Trajectory,
     Text,
     convert_coords,
-    is_on_circle,
-    space_draw
+    check_coords,
+    check_radius,
+    check_size,
+    is_on_circle
+)
+from src.forces import ForcePass
+from src.physics import FixedTimestep, Interpolation
+from src.profiling import FrameProfiler
+from src.recording import state_checksum
+from src.registry import EntityRegistry
+from src.rendering import (
+    DirtyRenderer,
+    WorldRenderer,
+    body_rect,
+    scale_rect
 )
 from setup.config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    DISPLAY_WIDTH,
-    DISPLAY_HEIGHT,
     FPS,
-    screen_factor,
+    interpolation_fps,
+    settings,
     bird_position,
     bird_radius,
     floor_height,
-    gravity
+    gravity,
+    sleep_time_threshold,
+    idle_speed_threshold,
+    settle_timeout,
+    rotation_step,
+    trace_path
 )
 from pygame.locals import (
     K_ESCAPE,
@@ -37,31 +56,101 @@ from pygame.locals import (
     MOUSEBUTTONDOWN,
     MOUSEBUTTONUP,
     QUIT,
-    K_r
+    K_r,
+    K_F3,
+    K_F4
 )
 
 
-def get_data():
+# Data read from the file by get_data function and modification time and size of the file.
+_levels_data = {
+    'stamp': None,
+    'data': None
+}
+
+
+def validate_level(level_data: dict):
+    """
+    Checks whether all objects of the level have valid position and size.
+
+    Raises KeyError if the level or one of its objects misses required value.
+
+    Raises ValueError if number of the level or number of birds is not positive
+    or type of a bar is invalid.
+
+    Raises CoordinatesError if position of an object is negative or bigger than screen size.
+
+    Raises SizeError if size of an object is not positive.
+    """
+    objects = level_data['objects']
+    if level_data['level'] <= 0:
+        raise ValueError('Number of the level has to be positive')
+    if objects['birds']['amount'] <= 0:
+        raise ValueError('Amount of birds has to be positive')
+    for pig in objects['pigs']:
+        check_coords((SCREEN_WIDTH - pig['x_position'], pig['y_position'] + floor_height))
+        check_radius(pig['radius'])
+    for bar in objects['bars']:
+        check_coords((SCREEN_WIDTH - bar['x_position'], bar['y_position'] + floor_height))
+        check_size((bar['x_size'], bar['y_size']))
+        if 'type' in bar.keys() and bar['type'] not in ('stone', 'static', 'dynamic'):
+            raise ValueError('Invalid type of the bar')
+
+
+def get_data(path='setup/levels.json'):
     """
     Returns data from the file.
+    The file is read and its levels are validated only if its modification time or size
+    has changed since the last call, otherwise previously read data is returned.
+    Returned data is shared between calls, so it must not be modified.
     """
-    with open('setup/levels.json') as fp:
-        return json.load(fp)
+    stat = os.stat(path)
+    stamp = (path, stat.st_mtime_ns, stat.st_size)
+    if _levels_data['stamp'] != stamp:
+        with open(path) as fp:
+            data = json.load(fp)
+        for level_data in data['levels']:
+            validate_level(level_data)
+        _levels_data['data'] = data
+        _levels_data['stamp'] = stamp
+    return _levels_data['data']
 
 
-def get_level(space: pymunk.Space, level: int):
+def create_level(level_data: dict, amount_of_levels=1):
     """
-    Removes all objects from space.
-    Creates and returns instance of Level and calls create_objects method.
+    Creates instance of Level from data in the format of levels.json and new pymunk space with collision handlers
+    in which bodies fall asleep after not moving for sleep_time_threshold seconds,
+    calls create_objects method and sets force_pass attribute of the space affecting all pigs.
     """
-    for body, shape in zip(space.bodies, space.shapes):
-        space.remove(body, shape)
-    data = get_data()
-    level = Level(data['levels'][level], len(data['levels']))
+    space = pymunk.Space()
+    space.gravity = gravity
+    space.sleep_time_threshold = sleep_time_threshold
+    space.idle_speed_threshold = idle_speed_threshold
+    collisions.create_handlers(space)
+    level = Level(level_data, amount_of_levels)
     level.create_objects(space)
+    space.force_pass = ForcePass()
+    space.force_pass.set_space(space)
     return level
 
 
+def build_level(level: int):
+    """
+    Creates instance of Level with the given number from levels.json using create_level function.
+    """
+    data = get_data()
+    return create_level(data['levels'][level], len(data['levels']))
+
+
+def get_level(level: int):
+    """
+    Returns new instance of the level with the given number and its pymunk space created by build_level function.
+    Only data of levels.json is cached by get_data function, because creating the level again is faster
+    than copying a created one, which pickles every object of its pymunk space.
+    """
+    return build_level(level)
+
+
 class Game:
     """
     Class Game.
@@ -88,8 +177,11 @@ class Game:
     :param images: dictionary of all images used in the game stored as Skin class
     :type images: dict
 
-    :param draw_options: options that allow pymunk to draw objects in pygame
-    :type draw_options: pymunk.pygame_util.DrawOptions
+    :param destructions: list of Destruction of objects destroyed by collisions in the last frame
+    :type destructions: list
+
+    :param world_renderer: renderer which draws every object of the level once using its skin or cached image
+    :type world_renderer: WorldRenderer
 
     :param running: is True if the game is running
     :type running: bool
@@ -106,7 +198,8 @@ class Game:
     :param stopwatch: counts time from the begining of the game to the end
     :type stopwatch: time.Time
 
-    :param status: shows status of the game. If 0 game is in start screen, 1 - game in progress, 2 - game in end screen
+    :param status: shows status of the game. If 0 game is in start screen, 1 - game in progress, 2 - game in end screen,
+    3 - images are loaded by loader and loading screen is shown
     :type status: int
 
     :param level: current level
@@ -117,29 +210,180 @@ class Game:
 
     :param trajectory: trajectory of curruntly used bird
     :type trajectory: Trajectory
+
+    :param headless: is True if the game runs without display and without limiting frame rate, defualt: False
+    :type headless: bool
+
+    :param render: is True if objects are drawn on the screen, defualt: True
+    :type render: bool
+
+    :param time: time of the game in seconds, increased by duration of every frame
+    :type time: float
+
+    :param shot_time: simulated time of the last shot in seconds
+    :type shot_time: float
+
+    :param dirty_renderer: renderer which redraws only changed regions of the screen,
+    None if the whole screen is redrawn every frame
+    :type dirty_renderer: DirtyRenderer
+
+    :param scaled_display: is True if the screen is the display itself and it is resized
+    to user's resolution by SDL while it is shown, defualt: False
+    :type scaled_display: bool
+
+    :param fullscreen: is True if the display fills the whole monitor instead of being shown in a window,
+    defualt: False
+    :type fullscreen: bool
+
+    :param timestep: accumulator deciding how many physics steps are made every frame
+    :type timestep: FixedTimestep
+
+    :param interpolation: transforms of bodies from the previous physics step used to draw bodies
+    between physics steps, None if bodies are drawn at their current transforms
+    :type interpolation: Interpolation
+
+    :param fps: limit of the frame rate, interpolation_fps if bodies are interpolated, otherwise FPS
+    :type fps: int
+
+    :param adaptive_substeps: is True if physics steps are divided into substeps when bodies move fast,
+    defualt: False
+    :type adaptive_substeps: bool
+
+    :param frame_time: duration of the last frame in seconds, 1 / FPS in headless mode
+    :type frame_time: float
+
+    :param profiler: profiler measuring time of phases of every frame, turned on with the overlay by F3 key,
+    trace of the latest frames is saved to trace_path by F4 key
+    :type profiler: FrameProfiler
+
+    :param recorder: recorder writing input and checksum of bodies of every frame to the log,
+    None if input is not recorded, defualt: None
+    :type recorder: InputRecorder
+
+    :param preview: preview computing the first impact of the aimed bird in the worker thread,
+    None if the impact is not shown, defualt: None
+    :type preview: ImpactPreview
+
+    :param impact: the first impact of the aimed bird shown by the marker, None if it is unknown
+    :type impact: Impact
+
+    :param loader: loader decoding images in background threads while loading screen is shown,
+    None if images are loaded before the game is created, defualt: None
+    :type loader: AssetLoader
+
+    :param debug: is True if time of starting the game is printed, defualt: False
+    :type debug: bool
+
+    :param startup_times: seconds from creating the game to showing the first frame, to loading all images
+    and to showing the start screen stored by 'first_frame', 'assets' and 'ready'
+    :type startup_times: dict
     """
-    def __init__(self):
+    def __init__(
+            self,
+            headless=False,
+            render=True,
+            dirty_rects=False,
+            scaled_display=False,
+            fullscreen=False,
+            interpolate=False,
+            adaptive_substeps=False,
+            profile=False,
+            recorder=None,
+            preview=None,
+            loader=None,
+            debug=False
+    ):
         """
         Creates instance of Game.
-        Creates pymunk space.
-        Initializes pygame, sets pygame clock and display with calculated size.
-        Creates instances of texts and skins used in the game.
-        Sets draw_options for pymunk.pygame_util module.
-        Creates collision handlers for all collision types.
+        Initializes pygame, sets pygame clock and display with size calculated from settings.
+        In headless mode pygame is not initialized, display is not created and input is taken from queue_input method.
+        If dirty_rects is True only changed regions of the screen are redrawn and displayed.
+        If scaled_display is True the game is drawn directly on a display with screen's resolution,
+        which is resized to user's resolution by SDL, so screen is never resized by scale_screen.
+        If fullscreen is True the display fills the whole monitor, otherwise it is shown in a window.
+        Physics is simulated in steps of fixed length independent of the frame rate.
+        If interpolate is True bodies are drawn between their transforms from the last two physics steps
+        and frame rate is limited to interpolation_fps instead of FPS, so that frames are drawn between steps.
+        If adaptive_substeps is True physics steps are divided into substeps when bodies move fast.
+        If profile is True time of every phase of the frame is measured by profiler.
+        If recorder is given input of every frame is recorded from the start of the game.
+        If preview is given the first impact of the aimed bird is marked on the screen.
+        If loader is given images are loaded by it while loading screen is shown
+        and texts, skins and the first level are created after that,
+        otherwise they are created immediately by load_assets method.
+        If debug is True time of starting the game is printed when the start screen is shown.
+        Creates world_renderer drawing objects of the level.
         Sets other attributes to starting values.
         """
-        self.space = pymunk.Space()
-        self.space.gravity = gravity
-        # Sets pygame display's left corner in the left corner of user's screen.
-        os.environ['SDL_VIDEO_WINDOW_POS'] = "%d,%d" % (0, 0)
-        pygame.init()
-        pygame.display.set_caption('Angry Birds')
+        self._created = time.perf_counter()
+        self._startup_times = {}
+        self._headless = headless
+        self._render = render
+        self._scaled_display = scaled_display and not headless
+        self._fullscreen = fullscreen and not headless
+        self._dirty_renderer = DirtyRenderer() if dirty_rects else None
+        self._timestep = FixedTimestep()
+        self._interpolation = Interpolation() if interpolate else None
+        self._fps = interpolation_fps if interpolate else FPS
+        self._adaptive_substeps = adaptive_substeps
+        self._frame_time = 1 / FPS
+        self._profiler = FrameProfiler(profile)
+        self._recorder = recorder
+        self._preview = preview
+        self._impact = None
+        self._loader = loader
+        self._debug = debug
+        if not headless:
+            # Subsystems of SDL are initialized only when the window is shown, fonts initialize themselves.
+            pygame.init()
         self._clock = pygame.time.Clock()
-        # Creates pygame's surface which everything will be drawn on. It has 1080p resolution.
-        self.screen = pygame.Surface((1913, 1050))
-        # Creates pygame's surface which is showed on user's screen. It will be a copy of screen but in different size.
-        self.display = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
-        self.load_level(0)
+        if headless:
+            self.display = None
+        elif self._scaled_display:
+            pygame.display.set_caption('Angry Birds')
+            # Creates display which has the same resolution as screen and is resized by SDL while it is shown.
+            self.display = pygame.display.set_mode(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | (pygame.FULLSCREEN if fullscreen else 0)
+            )
+        else:
+            # Sets pygame display's left corner in the left corner of user's screen.
+            os.environ['SDL_VIDEO_WINDOW_POS'] = "%d,%d" % (0, 0)
+            pygame.display.set_caption('Angry Birds')
+            # Creates pygame's surface which is showed on user's screen.
+            # It will be a copy of screen but in different size.
+            self.display = pygame.display.set_mode(settings.display_size, pygame.FULLSCREEN if fullscreen else 0)
+        if self._scaled_display:
+            self.screen = self.display
+        else:
+            # Creates pygame's surface which everything will be drawn on. It has 1080p resolution.
+            self.screen = pygame.Surface((1913, 1050))
+        pymunk.pygame_util.positive_y_is_up = True
+        self._world_renderer = WorldRenderer()
+        self._running = True
+        self._bird_shot = False
+        self._bird_clicked = False
+        self._timer = 0
+        self._stopwatch = 0
+        self._status = 0
+        self._time = 0
+        self._events = []
+        self._pressed_keys = collections.defaultdict(bool)
+        self._mouse_pos = (0, 0)
+        self._queued_frame_time = None
+        self._destructions = []
+        self._shot_time = 0
+        self._aim_point = None
+        if loader is None or loader.done:
+            self.load_assets()
+        else:
+            loader.start()
+            self._status = 3
+
+    def load_assets(self):
+        """
+        Creates instances of texts and skins used in the game and loads first level together with its pymunk space.
+        Images are taken from textures, so they are loaded from files only if loader did not load them.
+        """
         self._texts = {
             'attempts': Text('0', (130, 70), 40),
             'start_info': Text(
@@ -170,15 +414,7 @@ class Game:
             'the_end': Skin(None, 'the_end.png', (512, 182)),
             'time': Skin(None, 'time.png', (256, 65))
         }
-        pymunk.pygame_util.positive_y_is_up = True
-        self._draw_options = pymunk.pygame_util.DrawOptions(self.screen)
-        collisions.create_handlers(self.space)
-        self._running = True
-        self._bird_shot = False
-        self._bird_clicked = False
-        self._timer = 0
-        self._stopwatch = 0
-        self._status = 0
+        self.load_level(0)
 
     @property
     def level(self):
@@ -229,12 +465,152 @@ class Game:
         """
         return self._status
 
+    @property
+    def headless(self):
+        """
+        Returns True if the game runs without display.
+        """
+        return self._headless
+
+    @property
+    def render(self):
+        """
+        Returns True if objects are drawn on the screen.
+        """
+        return self._render
+
+    @property
+    def time(self):
+        """
+        Returns simulated time of the game in seconds.
+        """
+        return self._time
+
+    @property
+    def scaled_display(self):
+        """
+        Returns True if the screen is the display resized to user's resolution by SDL.
+        """
+        return self._scaled_display
+
+    @property
+    def fullscreen(self):
+        """
+        Returns True if the display fills the whole monitor.
+        """
+        return self._fullscreen
+
+    @property
+    def dirty_renderer(self):
+        """
+        Returns renderer which redraws only changed regions of the screen or None.
+        """
+        return self._dirty_renderer
+
+    @property
+    def profiler(self):
+        """
+        Returns profiler measuring time of phases of every frame.
+        """
+        return self._profiler
+
+    @property
+    def recorder(self):
+        """
+        Returns recorder writing input of every frame to the log or None.
+        """
+        return self._recorder
+
+    @property
+    def loader(self):
+        """
+        Returns loader of images or None.
+        """
+        return self._loader
+
+    @property
+    def startup_times(self):
+        """
+        Returns seconds from creating the game to showing the first frame, to loading all images
+        and to showing the start screen.
+        """
+        return self._startup_times
+
+    @property
+    def preview(self):
+        """
+        Returns preview computing the first impact of the aimed bird or None.
+        """
+        return self._preview
+
+    @property
+    def impact(self):
+        """
+        Returns the first impact of the aimed bird or None if it is unknown.
+        """
+        return self._impact
+
+    @property
+    def timestep(self):
+        """
+        Returns accumulator deciding how many physics steps are made every frame.
+        """
+        return self._timestep
+
+    @property
+    def interpolation(self):
+        """
+        Returns transforms of bodies from the previous physics step or None if interpolation is turned off.
+        """
+        return self._interpolation
+
+    @property
+    def fps(self):
+        """
+        Returns limit of the frame rate.
+        """
+        return self._fps
+
+    @property
+    def destructions(self):
+        """
+        Returns list of objects destroyed by collisions in physics steps of the last frame.
+        """
+        return self._destructions
+
+    @property
+    def world_renderer(self):
+        """
+        Returns renderer which draws all objects of the level.
+        """
+        return self._world_renderer
+
+    def start(self, level_number=0):
+        """
+        Starts the game from the level with the given number.
+        Duration of the frame and accumulator of physics steps are reset,
+        so the first frame is simulated in the same way as by replay of the recorded input.
+        If input is recorded, recording of the level begins.
+        """
+        self._status = 1
+        self._frame_time = 1 / FPS
+        self._timestep = FixedTimestep()
+        self.load_level(level_number)
+        if self._recorder is not None:
+            self._recorder.begin(level_number, self._adaptive_substeps)
+        self._stopwatch = time.time()
+
     def load_level(self, level_number: int):
         """
-        Loads level with the given number by calling get_level function and sets level, bird and trajectory attributes.
+        Loads level with the given number by calling get_level function
+        and sets level, space, bird and trajectory attributes.
         """
-        self._level = get_level(self.space, level_number)
+        self._level = get_level(level_number)
+        self.space = self._level.space
+        self._world_renderer.set_space(self.space)
         self.load_bird()
+        if self._dirty_renderer is not None:
+            self._dirty_renderer.set_background(self.draw_background())
 
     def load_bird(self):
         """
@@ -242,26 +618,26 @@ class Game:
         """
         if self._level.attempts > 0:
             self._bird = Bird(self.space, bird_position, bird_radius, 0.7, 0.6, 0.8)
+            self._world_renderer.add(self._bird.shape)
+            self.space.force_pass.add(self._bird.body)
+            self._level.registry.add(self._bird.shape)
             self._trajectory = Trajectory(self._bird)
             self._bird_shot = False
+            self._impact = None
+            if self._preview is not None:
+                self._preview.set_level(self._level, self._bird.shape)
 
     def shoot_bird(self):
         """
         Shoots the bird with speed set by user.
         """
         self._bird.body.velocity = (self.bird.x_velocity, self.bird.y_velocity)
+        self._level.registry.wake(self._bird.shape)
         self._bird_shot = True
         self._bird_clicked = False
+        self._shot_time = self._time
         self._level.reduce_attempts()
 
-    def update_skins(self):
-        """
-        Updates skins of all objects by calling update method of each skin.
-        """
-        for body, shape in zip(self.space.bodies, self.space.shapes):
-            if shape.collision_type == 1 or shape.collision_type == 3:
-                body.skin.update(self.screen)
-
     def draw_grass(self):
         """
         Draw grass on the screen.
@@ -272,83 +648,217 @@ class Game:
                 convert_coords((-10 + 300 * x, floor_height + 20))
             )
 
-    def scale_screen(self):
+    def grass_rect(self):
+        """
+        Returns rectangle of the screen covered by grass.
+        """
+        height = self._level.floor.body.grass.default_image.get_height()
+        top = convert_coords((0, floor_height + 20))[1]
+        return pygame.Rect(0, top, SCREEN_WIDTH, height)
+
+    def scale_screen(self, rects=None):
         """
         Sets frame as screen resized to user's resoltion and displays it on pygame display.
+        If rects is a list of rectangles, only these regions of the screen are resized and displayed.
+        If display is scaled, screen is displayed without resizing.
+        Does nothing in headless mode.
         """
-        self.frame = pygame.transform.scale(self.screen, (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+        if self.display is None:
+            return
+        if self._scaled_display:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+        if rects is not None:
+            display_size = self.display.get_size()
+            display_rects = []
+            for rect in rects:
+                display_rect = scale_rect(rect, display_size)
+                region = pygame.transform.scale(self.screen.subsurface(rect), display_rect.size)
+                self.display.blit(region, display_rect)
+                display_rects.append(display_rect)
+            pygame.display.update(display_rects)
+            return
+        self.frame = pygame.transform.scale(self.screen, self.display.get_size())
         self.display.blit(self.frame, self.frame.get_rect())
         pygame.display.flip()
 
+    def tick(self):
+        """
+        Increases time of the game by duration of the frame.
+        Limits frame rate to fps unless the game is in headless mode, in which every frame lasts 1 / FPS
+        or time given by queue_input method.
+        """
+        if self._headless:
+            self._frame_time = 1 / FPS if self._queued_frame_time is None else self._queued_frame_time
+            self._queued_frame_time = None
+        else:
+            self._frame_time = self._clock.tick(self._fps) / 1000
+        self._time += self._frame_time
+
+    def queue_input(self, events=(), pressed_keys=None, mouse_pos=None, frame_time=None):
+        """
+        Queues events for the next frame and sets pressed keys and mouse position used in headless mode.
+        Mouse position is given in screen coordinates.
+        If frame_time is given the next frame lasts frame_time seconds instead of 1 / FPS.
+        """
+        self._events.extend(events)
+        if pressed_keys is not None:
+            self._pressed_keys = pressed_keys
+        if mouse_pos is not None:
+            self._mouse_pos = mouse_pos
+        if frame_time is not None:
+            self._queued_frame_time = frame_time
+
+    def read_input(self):
+        """
+        Returns events, pressed keys and mouse position resized to screen of the current frame.
+        In headless mode returns input given by queue_input method.
+        """
+        if self._headless:
+            events, self._events = self._events, []
+            return events, self._pressed_keys, self._mouse_pos
+        mouse_pos = pygame.mouse.get_pos()
+        if not self._scaled_display:
+            factor = settings.screen_factor
+            mouse_pos = (mouse_pos[0] / factor, mouse_pos[1] / factor)
+        return pygame.event.get(), pygame.key.get_pressed(), mouse_pos
+
+    def loading_screen(self):
+        """
+        Draws progress bar of loading images on display and handles user events such as pressing escape.
+        When all images are loaded, creates texts, skins and the first level and shows start screen.
+        """
+        events, _, _ = self.read_input()
+        for event in events:
+            if event.type == QUIT or event.type == KEYDOWN and event.key == K_ESCAPE:
+                self._running = False
+        self._loader.collect()
+        if self._render:
+            self.screen.fill((255, 255, 255))
+            bar = pygame.Rect(0, 0, 600, 30)
+            bar.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+            filled = bar.inflate(-8, -8)
+            filled.width = round(filled.width * self._loader.progress)
+            pygame.draw.rect(self.screen, (0, 0, 0), bar, 3)
+            pygame.draw.rect(self.screen, (0, 0, 0), filled)
+        self.scale_screen()
+        self._startup_times.setdefault('first_frame', time.perf_counter() - self._created)
+        if self._loader.done:
+            self._startup_times['assets'] = time.perf_counter() - self._created
+            self.load_assets()
+            self._status = 0
+            self._startup_times['ready'] = time.perf_counter() - self._created
+            if self._debug:
+                self.print_startup_times()
+        self.tick()
+
+    def print_startup_times(self):
+        """
+        Prints time of starting the game and time of loading every image file.
+        """
+        times = self._startup_times
+        print(
+            f'first frame after {times["first_frame"] * 1000:.0f} ms, '
+            f'images loaded after {times["assets"] * 1000:.0f} ms, '
+            f'start screen after {times["ready"] * 1000:.0f} ms'
+        )
+        for file, seconds in sorted(self._loader.timings.items(), key=lambda item: -item[1]):
+            print(f'    {file}: {seconds * 1000:.0f} ms')
+
     def start_screen(self):
         """
         Draws start screen on display and handles user events such as pressing escape or space.
         Loads level 1 after starting the game by pressing space.
+        Space of the started level is not stepped and the frame is not ticked,
+        because every frame of the level is made by step method and can be recorded.
         """
-        for event in pygame.event.get():
+        events, _, _ = self.read_input()
+        for event in events:
             if event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     self._running = False
                 elif event.key == K_SPACE:
-                    self._status = 1
-                    self.load_level(0)
-                    self._stopwatch = time.time()
+                    self.start()
+                    return
             elif event.type == QUIT:
                 self._running = False
 
         self.space.step(1 / FPS)
-        self.screen.fill((255, 255, 255))
-        self.screen.blit(self._images['background'].default_image, (0, -30))
-        self.screen.blit(self._images['title'].default_image, (SCREEN_WIDTH / 2 - 256, 200))
-        self._texts['start_info'].draw(self.screen)
+        if self._render:
+            self.screen.fill((255, 255, 255))
+            self.screen.blit(self._images['background'].default_image, (0, -30))
+            self.screen.blit(self._images['title'].default_image, (SCREEN_WIDTH / 2 - 256, 200))
+            self._texts['start_info'].draw(self.screen)
         self.scale_screen()
-        self._clock.tick(FPS)
+        self.tick()
 
     def end_screen(self):
         """
         Draws ending screen on display and handles user events.
         Loads start screen after pressing space.
         """
-        for event in pygame.event.get():
+        events, _, _ = self.read_input()
+        for event in events:
             if event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     self._running = False
                 elif event.key == K_SPACE:
                     self._status = 0
-                    self.__init__()
+                    self.__init__(
+                        self._headless,
+                        self._render,
+                        self._dirty_renderer is not None,
+                        self._scaled_display,
+                        self._fullscreen,
+                        self._interpolation is not None,
+                        self._adaptive_substeps,
+                        self._profiler.enabled,
+                        self._recorder,
+                        self._preview,
+                        self._loader,
+                        self._debug
+                    )
             elif event.type == QUIT:
                 self._running = False
 
         self.space.step(1 / FPS)
-        self.screen.fill((255, 255, 255))
-        self.screen.blit(self._images['background'].default_image, (0, -30))
-        self.screen.blit(self._images['the_end'].default_image, (SCREEN_WIDTH / 2 - 256, 200))
-        self.screen.blit(self._images['time'].default_image, (SCREEN_WIDTH / 2 - 130, 400))
-        self._texts['end_info_restart'].draw(self.screen)
-        self._texts['end_info_exit'].draw(self.screen)
-        self._texts['author'].draw(self.screen)
-        self._texts['time'].set_str(self.screen, f'{int(self._stopwatch // 60):02}:{int(self._stopwatch % 60):02}')
+        if self._render:
+            self.screen.fill((255, 255, 255))
+            self.screen.blit(self._images['background'].default_image, (0, -30))
+            self.screen.blit(self._images['the_end'].default_image, (SCREEN_WIDTH / 2 - 256, 200))
+            self.screen.blit(self._images['time'].default_image, (SCREEN_WIDTH / 2 - 130, 400))
+            self._texts['end_info_restart'].draw(self.screen)
+            self._texts['end_info_exit'].draw(self.screen)
+            self._texts['author'].draw(self.screen)
+            self._texts['time'].set_str(
+                self.screen,
+                f'{int(self._stopwatch // 60):02}:{int(self._stopwatch % 60):02}'
+            )
         self.scale_screen()
-        self._clock.tick(FPS)
+        self.tick()
 
     def handle_level(self):
         """
         Removes object when it leaves the screen.
+        Only dynamic objects from the registry of the level are checked and pigs are counted by the registry.
+        Objects stopped moving when all of them are sleeping or have small kinetic energy
+        or when settle_timeout seconds passed since the shot.
         Decides whether the level is restarted, new attempt is made or new level is loaded according to
         number of attempts left and number of pigs left.
         """
-        pigs = 0
-        for body, shape in zip(self.space.bodies, self.space.shapes):
-            # Removes objects when they go out of the screen.
-            if body.position[0] > SCREEN_WIDTH + 50 or body.position[0] < -50:
-                self.space.remove(body, shape)
-            if round(body.velocity[0]) != 0 or round(body.velocity[1]) != 0:
-                self._timer = 0
-                return None
-            if shape.collision_type == 3:
-                pigs += 1
+        registry = self._level.registry
+        # Removes objects when they go out of the screen.
+        registry.remove_off_screen(self.space)
+        timed_out = self._bird_shot and self._time - self._shot_time > settle_timeout
+        if not timed_out and not registry.is_settled():
+            self._timer = 0
+            return None
+        pigs = registry.pigs
         if self._timer == 0:
-            self._timer = time.time()
+            self._timer = self._time
         if pigs == 0:
             # Loads another level.
             if self._level.number < self._level.amount_of_levels:
@@ -360,16 +870,16 @@ class Game:
         elif pigs != 0 and self._bird_shot:
             # Loads another attempt.
             self.load_bird()
-        if pigs != 0 and self._level.attempts == 0 and time.time() - self._timer > 1:
+        if pigs != 0 and self._level.attempts == 0 and self._time - self._timer > 1:
             # Restarts the level.
             self.load_level(self._level.number - 1)
 
-    def handle_events(self, mouse_pos: tuple):
+    def handle_events(self, events: list, mouse_pos: tuple):
         """
         Handles events raised by pygame.
         Reacts to keyboard inputs, mouse clicks and position of the mouse.
         """
-        for event in pygame.event.get():
+        for event in events:
             if event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     self._running = False
@@ -379,6 +889,12 @@ class Game:
                     self.load_bird()
                 elif event.key == K_r:
                     self.load_level(self.level.number - 1)
+                elif event.key == K_F3:
+                    self._profiler.toggle_overlay()
+                    if self._dirty_renderer is not None:
+                        self._dirty_renderer.invalidate()
+                elif event.key == K_F4 and self._profiler.enabled:
+                    self._profiler.export_trace(trace_path)
             elif event.type == MOUSEBUTTONDOWN and event.button == 1 and not self._bird_shot:
                 if is_on_circle(bird_position, bird_radius, convert_coords(mouse_pos)):
                     self._bird_clicked = True
@@ -396,29 +912,174 @@ class Game:
         Main method of Game class which is called every frame.
         Updates state of the game by calling Game's methods as well as methods of other classes.
         Draws every object in pymunk space and other elements on the screen in the rigth order.
+        If input is recorded, input of the frame is written to the log after the frame.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pos = (mouse_pos[0] / screen_factor, mouse_pos[1] / screen_factor)
-        self.handle_events(mouse_pos)
-        self.space.step(1 / FPS)
-        self.screen.fill((255, 255, 255))
-        self.screen.blit(self._images['background'].default_image, (0, -30))
+        profiler = self._profiler
+        profiler.begin_frame()
+        with profiler.phase('events'):
+            events, pressed_keys, mouse_pos = self.read_input()
+            self.handle_events(events, mouse_pos)
+        self._destructions = []
+        with profiler.phase('physics'):
+            for _ in range(self._timestep.advance(self._frame_time)):
+                self.physics_step()
+        with profiler.phase('aiming'):
+            if self._bird_clicked:
+                self._bird.set_speed(pressed_keys, convert_coords(mouse_pos), None)
+                self._aim_point = self._bird.aiming_point(convert_coords(mouse_pos))
+            else:
+                self._bird.set_speed(pressed_keys, None, None)
+                self._aim_point = None
+            if self._preview is not None:
+                # Impact is only looked up or requested here, it is computed by the worker thread of the preview.
+                self._impact = None if self._bird_shot else self._preview.request(self._bird.angle, self._bird.velocity)
+        with profiler.phase('handle_level'):
+            self.handle_level()
+        rects = None
+        if self._render:
+            with profiler.phase('draw'):
+                if self._dirty_renderer is None:
+                    self.draw()
+                else:
+                    rects = self.draw_dirty()
+            if profiler.overlay:
+                # Overlay changes every few frames, so the whole screen is redrawn while it is shown.
+                profiler.draw_overlay(self.screen)
+                if self._dirty_renderer is not None:
+                    self._dirty_renderer.invalidate()
+                    rects = None
+        with profiler.phase('scale_screen'):
+            self.scale_screen(rects)
+        with profiler.phase('tick'):
+            self.tick()
+        if self._recorder is not None:
+            self._recorder.record_frame(self._frame_time, events, pressed_keys, mouse_pos, state_checksum(self.space))
+        profiler.end_frame()
+
+    def physics_step(self):
+        """
+        Makes one physics step of fixed length, divided into substeps if adaptive_substeps is True.
+        Collects objects destroyed in the step, removes them from the registry of the level
+        and applies forces from force_pass of the space.
+        """
+        registry = self._level.registry
+        if self._interpolation is not None:
+            self._interpolation.store(registry.dynamic)
+        substeps = self._timestep.substeps(registry.dynamic) if self._adaptive_substeps else 1
+        with self._profiler.phase('space_step'):
+            for _ in range(substeps):
+                self.space.step(self._timestep.dt / substeps)
+        destructions = self.space.destruction_queue.pop_events()
+        for destruction in destructions:
+            registry.discard(destruction.shape)
+        self._destructions += destructions
+        with self._profiler.phase('forces'):
+            self.space.force_pass.apply(self._timestep.dt)
+
+    def draw(self):
+        """
+        Draws background, trajectory with the marker of the impact, every object in pymunk space
+        and number of attempts on the screen.
+        """
+        profiler = self._profiler
+        with profiler.phase('background'):
+            self.screen.fill((255, 255, 255))
+            self.screen.blit(self._images['background'].default_image, (0, -30))
+        with profiler.phase('trajectory'):
+            self._trajectory.calc()
+            self._trajectory.draw(self.screen)
+            self.draw_impact()
+        with profiler.phase('world'):
+            if self._interpolation is None:
+                self._world_renderer.draw(self.screen)
+            else:
+                self._interpolation.alpha = self._timestep.alpha
+                self._world_renderer.draw(self.screen, self._interpolation.transform)
+        with profiler.phase('grass'):
+            self.draw_grass()
+        with profiler.phase('hud'):
+            self.screen.blit(self._images['bird_amount'].default_image, (50, 50))
+            self._texts['attempts'].set_str(self.screen, str(f'x{self._level.attempts}'))
+            self.draw_aiming_line()
+
+    def draw_aiming_line(self):
+        """
+        Draws line from the bird to the mouse position if the bird is clicked.
+        """
+        if self._aim_point is not None:
+            pygame.draw.line(
+                self.screen, (0, 0, 0), convert_coords(self._aim_point), convert_coords(bird_position), 3
+            )
+
+    def draw_impact(self):
+        """
+        Draws circle of the size of the bird where the aimed bird hits the first object.
+        """
+        if self._impact is not None:
+            pygame.draw.circle(self.screen, (0, 0, 0), convert_coords(self._impact.position), bird_radius, 2)
+
+    def draw_background(self):
+        """
+        Returns surface with background image and all static objects of the level.
+        """
+        background = pygame.Surface(self.screen.get_size())
+        background.fill((255, 255, 255))
+        background.blit(self._images['background'].default_image, (0, -30))
+        self._world_renderer.draw_static(background)
+        return background
+
+    def draw_dirty(self):
+        """
+        Draws on the screen only objects which changed since the previous frame using dirty_renderer.
+        Objects are drawn in the same order as by draw method: trajectory, bars and skins in the order of
+        world_renderer, grass, image of the bird, number of attempts and aiming line.
+        Only objects from the registry of the level are drawn, so static shapes are taken from the background
+        and the space is not searched.
+        Returns list of redrawn regions or None if the whole screen was redrawn.
+        """
+        entities = []
         self._trajectory.calc()
-        self._trajectory.draw(self.screen)
-        space_draw(self.space, self._draw_options)
-        self.update_skins()
-        self.draw_grass()
-        self.screen.blit(self._images['bird_amount'].default_image, (50, 50))
-        self._texts['attempts'].set_str(self.screen, str(f'x{self._level.attempts}'))
-        pressed_keys = pygame.key.get_pressed()
-        if self._bird_clicked:
-            self._bird.set_speed(pressed_keys, convert_coords(mouse_pos), self.screen)
-        else:
-            self._bird.set_speed(pressed_keys, None, None)
-        collisions.rolling_resistance(self.space)
-        self.handle_level()
-        self.scale_screen()
-        self._clock.tick(FPS)
+        trajectory_rect = self._trajectory.rect()
+        if trajectory_rect is not None:
+            entities.append((
+                'trajectory',
+                (self._trajectory.x_vel, self._trajectory.y_vel),
+                trajectory_rect,
+                lambda: self._trajectory.draw(self.screen)
+            ))
+        if self._impact is not None:
+            center = convert_coords(self._impact.position)
+            rect = pygame.Rect(0, 0, 2 * bird_radius, 2 * bird_radius)
+            rect.center = (round(center[0]), round(center[1]))
+            entities.append(('impact', rect.center, rect.inflate(4, 4), self.draw_impact))
+        registry = self._level.registry
+        for entry in self._world_renderer.dynamic_entries():
+            shape = entry[0]
+            if shape not in registry:
+                continue
+            rect = body_rect(shape.body)
+            # Images are placed at the exact position of the body, so even a move smaller than a pixel
+            # can shift them and the object is redrawn whenever its body moves.
+            state = (tuple(shape.body.position), round(degrees(shape.body.angle) / rotation_step))
+            entities.append((
+                shape, state, rect, lambda entry=entry: self._world_renderer.draw_entry(self.screen, entry)
+            ))
+        entities.append(('grass', None, self.grass_rect(), self.draw_grass))
+        bird_amount = self._images['bird_amount'].default_image
+        entities.append((
+            'bird_amount', None, bird_amount.get_rect(topleft=(50, 50)),
+            lambda: self.screen.blit(bird_amount, (50, 50))
+        ))
+        attempts = self._texts['attempts']
+        attempts.set_str(None, f'x{self._level.attempts}')
+        entities.append(('attempts', attempts.str, attempts.rect, lambda: attempts.draw(self.screen)))
+        if self._aim_point is not None:
+            start = convert_coords(bird_position)
+            end = convert_coords(self._aim_point)
+            rect = pygame.Rect(min(start[0], end[0]), min(start[1], end[1]), abs(start[0] - end[0]),
+                               abs(start[1] - end[1])).inflate(8, 8)
+            entities.append(('aiming_line', tuple(end), rect, self.draw_aiming_line))
+        return self._dirty_renderer.render(self.screen, entities)
 
 
 class Level:
@@ -447,6 +1108,12 @@ class Level:
 
     :param floor: floor of the level
     :type floor: Floor
+
+    :param space: pymunk space which contains all objects of the level
+    :type space: pymunk.Space
+
+    :param registry: registry of all objects in the space of the level
+    :type registry: EntityRegistry
     """
     def __init__(self, level_data: dict, amount_of_levels: int):
         """
@@ -461,6 +1128,8 @@ class Level:
         self.pigs = None
         self.bars = None
         self.floor = None
+        self.space = None
+        self.registry = None
 
     @property
     def number(self):
@@ -524,8 +1193,10 @@ class Level:
 
     def create_objects(self, space: pymunk.Space):
         """
-        Creates instances of all objects from objects attribute.
+        Creates instances of all objects from objects attribute and adds them to the space.
+        Creates registry containing all objects added to the space.
         """
+        self.space = space
         self.floor = Floor(space)
         self.pigs = [
             Pig(
@@ -539,3 +1210,6 @@ class Level:
             self.create_bar(space, bar)
             for bar in self._objects['bars']
         ]
+        self.registry = EntityRegistry()
+        for shape in space.shapes:
+            self.registry.add(shape)
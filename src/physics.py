@@ -0,0 +1,151 @@
+import pymunk
+from math import ceil
+from setup.config import (
+    physics_rate,
+    max_frame_time,
+    max_substeps,
+    substep_distance
+)
+
+
+class FixedTimestep:
+    """
+    Class FixedTimestep.
+    Accumulates time of rendered frames and decides how many physics steps of fixed length
+    have to be made, so that speed of the simulation does not depend on the frame rate.
+    Contains attributes:
+    :param rate: number of physics steps per second, default: physics_rate
+    :type rate: int
+
+    :param dt: length of one physics step in seconds
+    :type dt: float
+
+    :param accumulator: time in seconds which was not simulated yet, always smaller than dt
+    :type accumulator: float
+
+    :param max_frame_time: longest frame time taken into account, longer frames are shortened to it,
+    so that the simulation does not fall behind after a long pause, default: max_frame_time
+    :type max_frame_time: float
+
+    :param max_substeps: maximal number of substeps into which a step can be divided, default: max_substeps
+    :type max_substeps: int
+
+    :param substep_distance: distance in pixels which the fastest body can move in one substep,
+    default: substep_distance
+    :type substep_distance: float
+    """
+    def __init__(
+            self,
+            rate=physics_rate,
+            max_frame_time=max_frame_time,
+            max_substeps=max_substeps,
+            substep_distance=substep_distance
+    ):
+        """
+        Creates instance of FixedTimestep.
+
+        Raises ValueError if rate, max_frame_time, max_substeps or substep_distance is not positive.
+        """
+        if rate <= 0:
+            raise ValueError('Rate has to be positive')
+        if max_frame_time <= 0:
+            raise ValueError('Maximal frame time has to be positive')
+        if max_substeps <= 0:
+            raise ValueError('Maximal number of substeps has to be positive')
+        if substep_distance <= 0:
+            raise ValueError('Substep distance has to be positive')
+        self._rate = rate
+        self._dt = 1 / rate
+        self._accumulator = 0
+        self._max_frame_time = max_frame_time
+        self._max_substeps = max_substeps
+        self._substep_distance = substep_distance
+
+    @property
+    def rate(self):
+        """
+        Returns number of physics steps per second.
+        """
+        return self._rate
+
+    @property
+    def dt(self):
+        """
+        Returns length of one physics step in seconds.
+        """
+        return self._dt
+
+    @property
+    def accumulator(self):
+        """
+        Returns time in seconds which was not simulated yet.
+        """
+        return self._accumulator
+
+    @property
+    def alpha(self):
+        """
+        Returns part of the next physics step which has already passed.
+        """
+        return self._accumulator / self._dt
+
+    def advance(self, frame_time: float):
+        """
+        Adds time of the frame to the accumulator and returns number of physics steps which have to be made.
+        """
+        self._accumulator += min(frame_time, self._max_frame_time)
+        # Small tolerance prevents losing a step because of rounding errors.
+        steps = int((self._accumulator + 1e-9) / self._dt)
+        self._accumulator = max(self._accumulator - steps * self._dt, 0)
+        return steps
+
+    def substeps(self, shapes):
+        """
+        Returns number of substeps into which the next step should be divided, so that
+        none of the bodies of the given shapes moves further than substep_distance in one substep.
+        Sleeping bodies are skipped.
+        """
+        speed = 0
+        for shape in shapes:
+            body = shape.body
+            if not body.is_sleeping:
+                speed = max(speed, body.velocity.length)
+        return max(1, min(self._max_substeps, ceil(speed * self._dt / self._substep_distance)))
+
+
+class Interpolation:
+    """
+    Class Interpolation.
+    Remembers positions and angles of bodies before the last physics step, so that bodies can be drawn
+    between their previous and current transform when frames are drawn more often than physics steps.
+    Contains attributes:
+    :param previous: positions and angles of bodies before the last physics step stored by bodies
+    :type previous: dict
+
+    :param alpha: part of the next physics step which has already passed, 1 means current transform
+    :type alpha: float
+    """
+    def __init__(self):
+        """
+        Creates instance of Interpolation.
+        """
+        self._previous = {}
+        self.alpha = 1
+
+    def store(self, shapes):
+        """
+        Remembers positions and angles of bodies of the given shapes.
+        """
+        self._previous = {shape.body: (shape.body.position, shape.body.angle) for shape in shapes}
+
+    def transform(self, body: pymunk.Body):
+        """
+        Returns position and angle of the body interpolated between the previous and current transform.
+        """
+        if body not in self._previous:
+            return body.position, body.angle
+        position, angle = self._previous[body]
+        return (
+            position.interpolate_to(body.position, self.alpha),
+            angle + (body.angle - angle) * self.alpha
+        )
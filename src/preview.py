@@ -0,0 +1,429 @@
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from math import cos, sin, radians
+import numpy as np
+import pymunk
+from setup.config import (
+    SCREEN_WIDTH,
+    gravity,
+    bird_radius,
+    floor_height,
+    physics_rate,
+    preview_angle_step,
+    preview_velocity_step,
+    preview_cache_size,
+    preview_time_limit
+)
+
+
+class Impact:
+    """
+    Class Impact. Contains attributes:
+    :param position: position of the center of the bird when it hits the object
+    :type position: tuple
+
+    :param point: point on the surface of the hit object
+    :type point: tuple
+
+    :param collision_type: collision type of the hit object
+    :type collision_type: int
+
+    :param time: time of the flight in seconds before the impact
+    :type time: float
+    """
+    def __init__(self, position: tuple, point: tuple, collision_type: int, time: float):
+        """
+        Creates instance of Impact.
+        """
+        self.position = position
+        self.point = point
+        self.collision_type = collision_type
+        self.time = time
+
+
+def quantize(angle: float, velocity: float):
+    """
+    Returns angle and velocity rounded to multiples of preview_angle_step and preview_velocity_step.
+    """
+    return (
+        round(angle / preview_angle_step) * preview_angle_step % 360,
+        round(velocity / preview_velocity_step) * preview_velocity_step
+    )
+
+
+def launch_velocity(angle: float, velocity: float):
+    """
+    Returns horizontal and vertical velocity given to the bird shot with the angle and velocity,
+    calculated in the same way as by Bird.aim.
+    """
+    return int(velocity * cos(radians(angle))), int(velocity * sin(radians(angle)))
+
+
+def flight_path(
+        start: tuple, velocity: tuple, dt=1 / physics_rate, time_limit=preview_time_limit, radius=bird_radius
+):
+    """
+    Returns NumPy array with positions of the bird after every physics step of length dt in rows,
+    starting with the start position and ending when the bird leaves the screen sideways or time_limit passes.
+    Positions are calculated at once in the same way as pymunk, which updates position before velocity in every step.
+    Bird with the given radius cannot fall through the floor, so from the step in which it would get below the floor
+    it rolls along the floor, which leaves it 2/3 of its horizontal velocity like pymunk's disk sliding with friction
+    which starts rolling, because moment of inertia of a disk is half of its mass times radius squared.
+    """
+    steps = np.arange(int(time_limit / dt) + 1)[:, np.newaxis]
+    path = (
+        np.asarray(start, dtype=float)
+        + steps * dt * np.asarray(velocity, dtype=float)
+        + steps * (steps - 1) / 2 * dt ** 2 * np.asarray(gravity, dtype=float)
+    )
+    below = np.flatnonzero(path[:, 1] < floor_height + radius)
+    if len(below):
+        first = max(below[0], 1)
+        path[first:, 0] = path[first - 1, 0] + (steps[first:, 0] - first + 1) * dt * velocity[0] * 2 / 3
+        path[first:, 1] = floor_height + radius
+    outside = np.flatnonzero((path[:, 0] < -50) | (path[:, 0] > SCREEN_WIDTH + 50))
+    if len(outside):
+        path = path[:outside[0] + 1]
+    return path
+
+
+def snapshot_shapes(shapes):
+    """
+    Returns list of tuples describing geometry of the shapes in world coordinates,
+    which can be used in another thread while the shapes are simulated.
+    """
+    snapshot = []
+    for shape in shapes:
+        body = shape.body
+        if isinstance(shape, pymunk.Circle):
+            snapshot.append(('circle', shape.collision_type, body.local_to_world(shape.offset), shape.radius))
+        elif isinstance(shape, pymunk.Segment):
+            snapshot.append((
+                'segment', shape.collision_type, body.local_to_world(shape.a), body.local_to_world(shape.b), shape.radius
+            ))
+        elif isinstance(shape, pymunk.Poly):
+            vertices = [body.local_to_world(vertex) for vertex in shape.get_vertices()]
+            snapshot.append(('poly', shape.collision_type, vertices, shape.radius))
+    return snapshot
+
+
+class QueryShapes:
+    """
+    Class QueryShapes.
+    Static shapes created from the snapshot made by snapshot_shapes function together with their bounding boxes
+    stored in NumPy array, so that bounding boxes of all shapes can be compared with the whole path at once.
+    Contains attributes:
+    :param shapes: static shapes which are not added to any space
+    :type shapes: list
+
+    :param bounds: bounding boxes of shapes in rows of left, bottom, right and top edge
+    :type bounds: np.ndarray
+    """
+    def __init__(self, snapshot: list):
+        """
+        Creates instance of QueryShapes from the snapshot.
+        """
+        body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        self.shapes = []
+        for kind, collision_type, *geometry in snapshot:
+            if kind == 'circle':
+                center, radius = geometry
+                shape = pymunk.Circle(body, radius, center)
+            elif kind == 'segment':
+                a, b, radius = geometry
+                shape = pymunk.Segment(body, a, b, radius)
+            else:
+                vertices, radius = geometry
+                shape = pymunk.Poly(body, vertices, radius=radius)
+            shape.collision_type = collision_type
+            shape.cache_bb()
+            self.shapes.append(shape)
+        self.bounds = np.array(
+            [(shape.bb.left, shape.bb.bottom, shape.bb.right, shape.bb.top) for shape in self.shapes], dtype=float
+        ).reshape(-1, 4)
+
+
+def find_impact(query: QueryShapes, start: tuple, velocity: tuple, radius=bird_radius, dt=1 / physics_rate):
+    """
+    Returns Impact of the bird with the given radius shot from start with the given velocity
+    with the first shape on its path or None if the bird hits nothing.
+    Path is divided into segments between physics steps. Bounding boxes of all segments enlarged by the radius
+    are compared with bounding boxes of all shapes at once and only shapes which overlap them are checked
+    by exact segment queries, segment after segment.
+    Shapes which the bird touches at the start, like the floor under it, are skipped until the bird leaves them,
+    so the bird shot along the floor hits the first object standing on it, as in simulate_impact function.
+    Segment queries of pymunk space are not used, because its spatial index misses shapes
+    which are closer to the segment than radius but whose bounding boxes do not touch the segment itself.
+    """
+    path = flight_path(start, velocity, dt, radius=radius)
+    if len(path) < 2 or not query.shapes:
+        return None
+    a, b = path[:-1], path[1:]
+    low = np.minimum(a, b) - radius
+    high = np.maximum(a, b) + radius
+    bounds = query.bounds
+    overlap = (
+        (low[:, np.newaxis, 0] <= bounds[:, 2]) & (high[:, np.newaxis, 0] >= bounds[:, 0])
+        & (low[:, np.newaxis, 1] <= bounds[:, 3]) & (high[:, np.newaxis, 1] >= bounds[:, 1])
+    )
+    touching = {index for index, shape in enumerate(query.shapes) if shape.point_query(start).distance <= radius}
+    for index in np.flatnonzero(overlap.any(axis=1)):
+        first, last = tuple(a[index]), tuple(b[index])
+        candidates = np.flatnonzero(overlap[index])
+        touching.intersection_update(candidates)
+        infos = []
+        for shape in candidates:
+            info = query.shapes[shape].segment_query(first, last, radius)
+            if info.shape is None:
+                touching.discard(shape)
+            elif shape not in touching or info.alpha > 0:
+                touching.discard(shape)
+                infos.append(info)
+        if infos:
+            info = min(infos, key=lambda info: info.alpha)
+            position = a[index] + (b[index] - a[index]) * info.alpha
+            return Impact(
+                (float(position[0]), float(position[1])),
+                tuple(info.point),
+                info.shape.collision_type,
+                float((index + info.alpha) * dt)
+            )
+    return None
+
+
+def snapshot_body(body: pymunk.Body):
+    """
+    Returns tuple describing type, position, angle and velocity of the body and geometry and material
+    of its shapes, from which build_body function creates their copy in another thread.
+    """
+    shapes = []
+    for shape in body.shapes:
+        if isinstance(shape, pymunk.Circle):
+            geometry = ('circle', tuple(shape.offset), shape.radius)
+        elif isinstance(shape, pymunk.Segment):
+            geometry = ('segment', tuple(shape.a), tuple(shape.b), shape.radius)
+        else:
+            geometry = ('poly', [tuple(vertex) for vertex in shape.get_vertices()], shape.radius)
+        shapes.append((geometry, shape.density, shape.elasticity, shape.friction, shape.collision_type))
+    return (
+        body.body_type, tuple(body.position), body.angle, tuple(body.velocity), body.angular_velocity, shapes
+    )
+
+
+def build_body(snapshot: tuple):
+    """
+    Returns new body and list of its shapes created from the snapshot made by snapshot_body function.
+    """
+    body_type, position, angle, velocity, angular_velocity, shapes_data = snapshot
+    body = pymunk.Body(body_type=body_type)
+    body.position = position
+    body.angle = angle
+    shapes = []
+    for (kind, *geometry), density, elasticity, friction, collision_type in shapes_data:
+        if kind == 'circle':
+            offset, radius = geometry
+            shape = pymunk.Circle(body, radius, offset)
+        elif kind == 'segment':
+            a, b, radius = geometry
+            shape = pymunk.Segment(body, a, b, radius)
+        else:
+            vertices, radius = geometry
+            shape = pymunk.Poly(body, vertices, radius=radius)
+        shape.density = density
+        shape.elasticity = elasticity
+        shape.friction = friction
+        shape.collision_type = collision_type
+        shapes.append(shape)
+    if body_type == pymunk.Body.DYNAMIC:
+        body.velocity = velocity
+        body.angular_velocity = angular_velocity
+    return body, shapes
+
+
+def snapshot_space(space: pymunk.Space, exclude=()):
+    """
+    Returns tuple describing settings of the space and all its bodies except the excluded ones,
+    from which build_space function creates copy of the space in another thread.
+    Only plain values are read, so the snapshot is much faster than copying the space.
+    """
+    settings = (
+        tuple(space.gravity), space.damping, space.iterations, space.sleep_time_threshold, space.idle_speed_threshold
+    )
+    bodies = dict.fromkeys(shape.body for shape in space.shapes)
+    return settings, [snapshot_body(body) for body in bodies if body not in exclude]
+
+
+def build_space(snapshot: tuple):
+    """
+    Returns new space created from the snapshot made by snapshot_space function.
+    Collision handlers of the original space are not copied.
+    """
+    settings, bodies = snapshot
+    space = pymunk.Space()
+    space.gravity, space.damping, space.iterations, space.sleep_time_threshold, space.idle_speed_threshold = settings
+    for body_snapshot in bodies:
+        body, shapes = build_body(body_snapshot)
+        space.add(body, *shapes)
+    return space
+
+
+def simulate_impact(template: tuple, velocity: tuple, dt=1 / physics_rate, time_limit=preview_time_limit):
+    """
+    Returns Impact found by simulating copy of the space from template until the bird touches another shape,
+    or None if it touches nothing before time_limit passes.
+    Template is a pair of snapshots of the space without the bird and of the bird's body,
+    from which a new space is built, so it can be simulated in another thread.
+    Shapes which the bird touches at the start, like the floor under it, are skipped until the bird leaves them
+    in the same way as by find_impact function.
+    """
+    space_snapshot, bird_snapshot = template
+    space = build_space(space_snapshot)
+    body, bird_shapes = build_body(bird_snapshot)
+    bird_shape = bird_shapes[0]
+    radius = bird_shape.radius
+    touching = {shape for shape in space.shapes if shape.point_query(body.position).distance <= radius}
+    space.add(body, *bird_shapes)
+    body.velocity = velocity
+    contacts = []
+
+    def touch(arbiter, space, data):
+        if arbiter.shapes[1] not in touching:
+            contacts.append(arbiter.shapes[1].collision_type)
+            contacts.append(tuple(arbiter.contact_point_set.points[0].point_b))
+        return True
+
+    space.add_wildcard_collision_handler(bird_shape.collision_type).begin = touch
+    for step in range(int(time_limit / dt)):
+        space.step(dt)
+        if contacts:
+            # Positions are updated before collisions are found, so the body is already where it touched the shape.
+            return Impact(tuple(body.position), contacts[1], contacts[0], (step + 1) * dt)
+        if not -50 <= body.position[0] <= SCREEN_WIDTH + 50:
+            return None
+        touching = {shape for shape in touching if shape.point_query(body.position).distance <= radius}
+    return None
+
+
+class ImpactPreview:
+    """
+    Class ImpactPreview.
+    Finds the first point where the bird shot with the given angle and velocity hits an object of the level.
+    Impacts are computed by a worker thread and remembered by quantized angle and velocity,
+    so asking for them never waits for the computation.
+    By default path of the bird is checked by segment queries against the snapshot of shapes of the level.
+    If simulate is True, copy of the whole space is built by the worker from the snapshot and simulated
+    until the bird touches something, which also takes into account objects moving during the flight.
+    Worker uses only snapshots taken by set_level, never the space simulated by the game.
+    Contains attributes:
+    :param simulate: is True if impacts are found by simulating copy of the space, default: False
+    :type simulate: bool
+
+    :param cache: impacts stored by quantized angle and velocity ordered from the least recently used,
+    at most preview_cache_size
+    :type cache: collections.OrderedDict
+    """
+    def __init__(self, simulate=False):
+        """
+        Creates instance of ImpactPreview with worker thread.
+        """
+        self._simulate = simulate
+        self._cache = collections.OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='impact-preview')
+        self._scene = None
+        self._query = (None, None)
+        self._pending = None
+        self._next = None
+
+    @property
+    def simulate(self):
+        """
+        Returns True if impacts are found by simulating copy of the space.
+        """
+        return self._simulate
+
+    @property
+    def cache(self):
+        """
+        Returns impacts stored by quantized angle and velocity.
+        """
+        return self._cache
+
+    def set_level(self, level, bird_shape: pymunk.Shape):
+        """
+        Takes snapshot of the level with the bird in its starting position and forgets remembered impacts.
+        Snapshot contains only plain values, copy of the space is built from it by the worker thread.
+        Should be called whenever new bird is prepared to be shot.
+        """
+        start = tuple(bird_shape.body.position)
+        space = level.space
+        if self._simulate:
+            data = (snapshot_space(space, (bird_shape.body,)), snapshot_body(bird_shape.body))
+        else:
+            data = snapshot_shapes(shape for shape in space.shapes if shape is not bird_shape)
+        # New tuple is made for every snapshot, so results computed for the old one can be recognized.
+        self._scene = (start, data)
+        self._cache.clear()
+        self._pending = None
+        self._next = None
+
+    def compute(self, scene: tuple, key: tuple):
+        """
+        Returns scene, key and Impact of the bird shot with quantized angle and velocity from the key.
+        Runs in the worker thread, which creates QueryShapes from the snapshot once and keeps them.
+        """
+        start, data = scene
+        velocity = launch_velocity(*key)
+        if self._simulate:
+            return scene, key, simulate_impact(data, velocity)
+        if self._query[0] is not scene:
+            self._query = (scene, QueryShapes(data))
+        return scene, key, find_impact(self._query[1], start, velocity)
+
+    def collect(self):
+        """
+        Stores result of the finished computation and starts computation of the latest requested impact.
+        Results computed for an old snapshot are skipped.
+        """
+        if self._pending is not None and self._pending.done():
+            scene, key, impact = self._pending.result()
+            self._pending = None
+            if scene is self._scene:
+                self._cache[key] = impact
+                if len(self._cache) > preview_cache_size:
+                    self._cache.popitem(last=False)
+        if self._pending is None and self._next is not None:
+            key, self._next = self._next, None
+            if key not in self._cache:
+                self._pending = self._executor.submit(self.compute, self._scene, key)
+
+    def request(self, angle: float, velocity: float):
+        """
+        Returns Impact of the bird shot with the angle and velocity or None if the bird hits nothing
+        or the impact is not computed yet.
+        Computation of the impact is started in the worker thread after the current one,
+        only the latest request waits, so the worker is never behind the player by more than one impact.
+        """
+        if self._scene is None or not velocity:
+            return None
+        self.collect()
+        key = quantize(angle, velocity)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self._next = key
+        self.collect()
+        return None
+
+    def wait(self):
+        """
+        Waits until all requested impacts are computed.
+        """
+        while self._pending is not None:
+            self._pending.result()
+            self.collect()
+
+    def close(self):
+        """
+        Stops the worker thread.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,263 @@
+import collections
+import json
+import time
+import numpy as np
+import pygame
+from src.classes import fonts
+from setup.config import (
+    profiler_window,
+    profiler_overlay_interval,
+    trace_event_limit
+)
+
+
+class _Phase:
+    """
+    Class _Phase.
+    Context manager measuring time of one phase of the frame and passing it to the profiler.
+    """
+    def __init__(self, profiler, name: str):
+        """
+        Creates instance of _Phase measured by the given profiler.
+        """
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+
+    def __enter__(self):
+        """
+        Remembers time of the beginning of the phase.
+        """
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *args):
+        """
+        Records the phase in the profiler.
+        """
+        self._profiler.record(self._name, self._start, time.perf_counter_ns())
+        return False
+
+
+class _NullPhase:
+    """
+    Class _NullPhase.
+    Context manager which does nothing, used when profiler is turned off.
+    """
+    def __enter__(self):
+        """
+        Does nothing.
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Does nothing.
+        """
+        return False
+
+
+_null_phase = _NullPhase()
+
+
+class FrameProfiler:
+    """
+    Class FrameProfiler.
+    Measures time of phases of every frame, keeps durations of the last frames to calculate
+    percentiles and collects trace events which can be saved in Chrome trace event format
+    and opened in chrome://tracing or Perfetto.
+    Contains attributes:
+    :param enabled: is True if phases are measured, defualt: False
+    :type enabled: bool
+
+    :param overlay: is True if statistics are drawn on the screen, defualt: False
+    :type overlay: bool
+
+    :param window: number of the last durations of every phase used to calculate percentiles,
+    defualt: profiler_window
+    :type window: int
+
+    :param durations: durations of phases in milliseconds stored by names of phases
+    :type durations: dict
+
+    :param events: the latest trace events, at most trace_event_limit
+    :type events: collections.deque
+
+    :param frames: number of measured frames
+    :type frames: int
+    """
+    def __init__(self, enabled=False, window=profiler_window, event_limit=trace_event_limit):
+        """
+        Creates instance of FrameProfiler.
+
+        Raises ValueError if window or event_limit is not positive.
+        """
+        if window <= 0:
+            raise ValueError('Window has to be positive')
+        if event_limit <= 0:
+            raise ValueError('Limit of events has to be positive')
+        self._enabled = enabled
+        self._overlay = False
+        self._window = window
+        self._durations = {}
+        self._events = collections.deque(maxlen=event_limit)
+        self._frames = 0
+        self._frame_start = None
+        self._overlay_surface = None
+        self._epoch = time.perf_counter_ns()
+
+    @property
+    def enabled(self):
+        """
+        Returns True if phases are measured.
+        """
+        return self._enabled
+
+    @property
+    def overlay(self):
+        """
+        Returns True if statistics are drawn on the screen.
+        """
+        return self._overlay
+
+    @property
+    def window(self):
+        """
+        Returns number of the last durations used to calculate percentiles.
+        """
+        return self._window
+
+    @property
+    def events(self):
+        """
+        Returns the latest trace events.
+        """
+        return self._events
+
+    @property
+    def frames(self):
+        """
+        Returns number of measured frames.
+        """
+        return self._frames
+
+    def enable(self):
+        """
+        Turns measuring on.
+        """
+        self._enabled = True
+
+    def disable(self):
+        """
+        Turns measuring and overlay off.
+        """
+        self._enabled = False
+        self._overlay = False
+        self._frame_start = None
+
+    def toggle_overlay(self):
+        """
+        Shows overlay with statistics if it is hidden or hides it otherwise.
+        Measuring is turned on together with the overlay.
+        """
+        self._overlay = not self._overlay
+        self._overlay_surface = None
+        if self._overlay:
+            self.enable()
+
+    def phase(self, name: str):
+        """
+        Returns context manager measuring time of the phase with the given name.
+        Nothing is measured if profiler is turned off.
+        """
+        if not self._enabled:
+            return _null_phase
+        return _Phase(self, name)
+
+    def begin_frame(self):
+        """
+        Marks beginning of the frame.
+        """
+        if self._enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        """
+        Marks end of the frame and records its whole duration as the frame phase.
+        """
+        if self._enabled and self._frame_start is not None:
+            self.record('frame', self._frame_start, time.perf_counter_ns())
+            self._frames += 1
+            if self._overlay and self._frames % profiler_overlay_interval == 0:
+                self._overlay_surface = None
+        self._frame_start = None
+
+    def record(self, name: str, start: int, end: int):
+        """
+        Records phase with the given name which started and ended at the given times in nanoseconds.
+        """
+        durations = self._durations.get(name)
+        if durations is None:
+            durations = self._durations[name] = collections.deque(maxlen=self._window)
+        durations.append((end - start) / 1e6)
+        self._events.append({
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self._epoch) / 1e3,
+            'dur': (end - start) / 1e3,
+            'pid': 0,
+            'tid': 0
+        })
+
+    def percentiles(self, name: str):
+        """
+        Returns 50th, 95th and 99th percentile of durations of the phase in milliseconds
+        or None if the phase was not measured.
+        """
+        durations = self._durations.get(name)
+        if not durations:
+            return None
+        return tuple(float(value) for value in np.percentile(durations, (50, 95, 99)))
+
+    def stats(self):
+        """
+        Returns dictionary with 50th, 95th and 99th percentile of durations of every phase.
+        """
+        return {name: self.percentiles(name) for name in self._durations}
+
+    def reset(self):
+        """
+        Removes all durations and trace events.
+        """
+        self._durations.clear()
+        self._events.clear()
+        self._frames = 0
+        self._overlay_surface = None
+
+    def export_trace(self, path: str):
+        """
+        Saves trace events to the file in Chrome trace event format.
+        """
+        with open(path, 'w') as fp:
+            json.dump({'traceEvents': list(self._events), 'displayTimeUnit': 'ms'}, fp)
+
+    def draw_overlay(self, screen: pygame.Surface):
+        """
+        Draws table with percentiles of every phase in the top right corner of the screen.
+        Table is rendered again only every profiler_overlay_interval frames.
+        """
+        if not self._overlay:
+            return
+        if self._overlay_surface is None:
+            lines = ['phase          p50    p95    p99 [ms]']
+            for name, values in self.stats().items():
+                lines.append(f'{name:<12}' + ''.join(f'{value:7.2f}' for value in values))
+            font = fonts.font('couriernew', 18)
+            height = font.get_linesize()
+            width = max(font.size(line)[0] for line in lines)
+            surface = pygame.Surface((width + 20, height * len(lines) + 20))
+            surface.fill((0, 0, 0))
+            for index, line in enumerate(lines):
+                surface.blit(font.render(line, True, (255, 255, 255)), (10, 10 + index * height))
+            self._overlay_surface = surface
+        screen.blit(self._overlay_surface, (screen.get_width() - self._overlay_surface.get_width() - 10, 10))
@@ -0,0 +1,229 @@
+import collections
+import struct
+import zlib
+import pygame
+import pymunk
+from setup.config import FPS, physics_rate
+from pygame.locals import (
+    K_w,
+    K_a,
+    K_s,
+    K_d,
+    K_UP,
+    K_DOWN,
+    K_LEFT,
+    K_RIGHT,
+    KEYDOWN,
+    MOUSEBUTTONDOWN,
+    MOUSEBUTTONUP,
+    QUIT
+)
+
+
+# Log starts with the header and consists of records which begin with one byte of their type.
+# All numbers are little-endian.
+magic = b'ABRL'
+version = 1
+_header = struct.Struct('<4sBHH')
+_record_type = struct.Struct('<B')
+_start = struct.Struct('<HB')
+_frame = struct.Struct('<IdHddHI')
+_event = struct.Struct('<Hi')
+START = 1
+FRAME = 2
+
+# Keys read by Bird.set_speed, stored as bits of one number in the order of this tuple.
+recorded_keys = (K_UP, K_w, K_DOWN, K_s, K_RIGHT, K_d, K_LEFT, K_a)
+# Events handled by Game.handle_events and their attributes which are recorded.
+recorded_events = {
+    KEYDOWN: 'key',
+    MOUSEBUTTONDOWN: 'button',
+    MOUSEBUTTONUP: 'button',
+    QUIT: None
+}
+
+
+class ReplayError(Exception):
+    """
+    Class ReplayError.
+    Class inherits attributes from Exception class.
+    Raised when the log cannot be read or does not match the game.
+    """
+    def __init__(self, message: str):
+        """
+        Creates instance of error.
+        """
+        super().__init__(message)
+
+
+def state_checksum(space: pymunk.Space):
+    """
+    Returns CRC-32 checksum of positions, angles and velocities of all bodies in the space.
+    """
+    values = []
+    for body in space.bodies:
+        values.extend(body.position)
+        values.append(body.angle)
+        values.extend(body.velocity)
+        values.append(body.angular_velocity)
+    return zlib.crc32(struct.pack(f'<{len(values)}d', *values))
+
+
+def encode_keys(pressed_keys):
+    """
+    Returns number whose bits show which of recorded_keys are pressed.
+    """
+    keys = 0
+    for index, key in enumerate(recorded_keys):
+        if pressed_keys[key]:
+            keys |= 1 << index
+    return keys
+
+
+def decode_keys(keys: int):
+    """
+    Returns dictionary of pressed keys from the number made by encode_keys function.
+    """
+    pressed_keys = collections.defaultdict(bool)
+    for index, key in enumerate(recorded_keys):
+        if keys & 1 << index:
+            pressed_keys[key] = True
+    return pressed_keys
+
+
+class FrameInput:
+    """
+    Class FrameInput. Contains attributes:
+    :param frame: number of the frame counted from the start of the level
+    :type frame: int
+
+    :param frame_time: duration of the frame in seconds
+    :type frame_time: float
+
+    :param events: list of (type, value) pairs of events handled in the frame
+    :type events: list
+
+    :param keys: pressed keys encoded by encode_keys function
+    :type keys: int
+
+    :param mouse_pos: mouse position resized to the screen
+    :type mouse_pos: tuple
+
+    :param checksum: checksum of bodies after the frame
+    :type checksum: int
+    """
+    def __init__(self, frame: int, frame_time: float, events: list, keys: int, mouse_pos: tuple, checksum: int):
+        """
+        Creates instance of FrameInput.
+        """
+        self.frame = frame
+        self.frame_time = frame_time
+        self.events = events
+        self.keys = keys
+        self.mouse_pos = mouse_pos
+        self.checksum = checksum
+
+    def pygame_events(self):
+        """
+        Returns list of pygame events recreated from the recorded events.
+        """
+        events = []
+        for event_type, value in self.events:
+            attribute = recorded_events[event_type]
+            events.append(pygame.event.Event(event_type, {attribute: value} if attribute else {}))
+        return events
+
+    def pressed_keys(self):
+        """
+        Returns dictionary of keys pressed in the frame.
+        """
+        return decode_keys(self.keys)
+
+
+class InputRecorder:
+    """
+    Class InputRecorder.
+    Writes input reaching Game.handle_events and Bird.set_speed in every frame to binary log
+    together with duration of the frame and checksum of bodies after the frame.
+    Recording of every level begins with start record written when the game starts.
+    Contains attributes:
+    :param fp: binary file to which the log is written
+    :type fp: io.BufferedIOBase
+
+    :param frame: number of the next frame
+    :type frame: int
+    """
+    def __init__(self, fp):
+        """
+        Creates instance of InputRecorder and writes header of the log to the file.
+        """
+        self._fp = fp
+        self._frame = 0
+        fp.write(_header.pack(magic, version, FPS, physics_rate))
+
+    @property
+    def frame(self):
+        """
+        Returns number of the next frame.
+        """
+        return self._frame
+
+    def begin(self, level_number: int, adaptive_substeps: bool):
+        """
+        Writes record of starting the game from the level with the given number.
+        """
+        self._frame = 0
+        self._fp.write(_record_type.pack(START) + _start.pack(level_number, adaptive_substeps))
+
+    def record_frame(self, frame_time: float, events: list, pressed_keys, mouse_pos: tuple, checksum: int):
+        """
+        Writes record of one frame. Events which are not handled by the game are skipped.
+        """
+        recorded = [
+            (event.type, getattr(event, recorded_events[event.type]) if recorded_events[event.type] else 0)
+            for event in events if event.type in recorded_events
+        ]
+        data = _record_type.pack(FRAME) + _frame.pack(
+            self._frame, frame_time, encode_keys(pressed_keys), mouse_pos[0], mouse_pos[1], len(recorded), checksum
+        )
+        data += b''.join(_event.pack(event_type, value) for event_type, value in recorded)
+        self._fp.write(data)
+        self._frame += 1
+
+
+def _read(fp, structure: struct.Struct):
+    """
+    Reads and unpacks structure from the file.
+    Raises ReplayError if the file ends too early.
+    """
+    data = fp.read(structure.size)
+    if len(data) != structure.size:
+        raise ReplayError('Log ends unexpectedly')
+    return structure.unpack(data)
+
+
+def read_log(fp):
+    """
+    Reads log written by InputRecorder and yields ('start', level number, adaptive_substeps)
+    tuples and ('frame', FrameInput) tuples in the order of recording.
+    Raises ReplayError if the log is invalid or was recorded with different FPS or physics_rate.
+    """
+    log_magic, log_version, log_fps, log_rate = _read(fp, _header)
+    if log_magic != magic or log_version != version:
+        raise ReplayError('File is not an input log')
+    if (log_fps, log_rate) != (FPS, physics_rate):
+        raise ReplayError(f'Log was recorded with FPS {log_fps} and physics rate {log_rate}')
+    while True:
+        data = fp.read(_record_type.size)
+        if not data:
+            return
+        record_type, = _record_type.unpack(data)
+        if record_type == START:
+            level_number, adaptive_substeps = _read(fp, _start)
+            yield 'start', level_number, bool(adaptive_substeps)
+        elif record_type == FRAME:
+            frame, frame_time, keys, x, y, amount, checksum = _read(fp, _frame)
+            events = [_read(fp, _event) for _ in range(amount)]
+            yield 'frame', FrameInput(frame, frame_time, events, keys, (x, y), checksum)
+        else:
+            raise ReplayError(f'Invalid record type {record_type}')
@@ -0,0 +1,153 @@
+import pymunk
+from setup.config import (
+    SCREEN_WIDTH,
+    settle_energy
+)
+
+
+def is_body_at_rest(body: pymunk.Body, energy=settle_energy):
+    """
+    Returns True if the body is sleeping or its kinetic energy is smaller than energy.
+    """
+    return body.is_sleeping or body.kinetic_energy < energy
+
+
+class EntityRegistry:
+    """
+    Class EntityRegistry.
+    Keeps shapes of the level in sets by their collision types, so that every frame
+    only objects of the needed type are checked instead of all shapes of the space.
+    Registry has to be updated whenever objects are added to or removed from the space.
+    Sleeping objects can be woken up only by objects which are awake, by changes of the registry
+    or by changes made outside of the space's step which have to be reported by wake method,
+    so only objects which were awake at the last check are checked again.
+    Contains attributes:
+    :param shapes: sets of shapes stored by collision types
+    :type shapes: dict
+
+    :param dynamic: set of shapes with dynamic bodies
+    :type dynamic: set
+
+    :param awake: set of shapes with dynamic bodies which were not sleeping at the last check
+    :type awake: set
+
+    :param pigs: number of pigs in the registry
+    :type pigs: int
+    """
+    def __init__(self):
+        """
+        Creates empty instance of EntityRegistry.
+        """
+        self._shapes = {}
+        self._dynamic = set()
+        self._awake = set()
+        self._pigs = 0
+
+    @property
+    def dynamic(self):
+        """
+        Returns set of shapes with dynamic bodies.
+        """
+        return self._dynamic
+
+    @property
+    def awake(self):
+        """
+        Returns set of shapes with dynamic bodies which were not sleeping at the last check.
+        """
+        return self._awake
+
+    @property
+    def pigs(self):
+        """
+        Returns number of pigs in the registry.
+        """
+        return self._pigs
+
+    def __len__(self):
+        """
+        Returns number of shapes in the registry.
+        """
+        return sum(len(shapes) for shapes in self._shapes.values())
+
+    def __contains__(self, shape: pymunk.Shape):
+        """
+        Returns True if shape is in the registry.
+        """
+        return shape in self._shapes.get(shape.collision_type, ())
+
+    def shapes(self, collision_type: int):
+        """
+        Returns set of shapes with the given collision type.
+        """
+        return self._shapes.get(collision_type, set())
+
+    def add(self, shape: pymunk.Shape):
+        """
+        Adds shape to the registry.
+        """
+        shapes = self._shapes.setdefault(shape.collision_type, set())
+        if shape in shapes:
+            return
+        shapes.add(shape)
+        if shape.body.body_type == pymunk.Body.DYNAMIC:
+            self._dynamic.add(shape)
+            self._awake.add(shape)
+        if shape.collision_type == 3:
+            self._pigs += 1
+
+    def discard(self, shape: pymunk.Shape):
+        """
+        Removes shape from the registry if it is there.
+        """
+        shapes = self._shapes.get(shape.collision_type)
+        if shapes is None or shape not in shapes:
+            return
+        shapes.remove(shape)
+        self._dynamic.discard(shape)
+        # Removing the body from the space wakes up bodies touching it.
+        self._awake = set(self._dynamic)
+        if shape.collision_type == 3:
+            self._pigs -= 1
+
+    def remove(self, space: pymunk.Space, shape: pymunk.Shape):
+        """
+        Removes shape together with its body from the space and from the registry.
+        """
+        if shape.space is space:
+            space.remove(shape.body, shape)
+        self.discard(shape)
+
+    def wake(self, shape: pymunk.Shape):
+        """
+        Marks shape as awake, so that it is checked by is_settled method.
+        Has to be called when the body of the shape is woken up outside of the space's step,
+        for example when its velocity is set.
+        """
+        if shape in self._dynamic:
+            self._awake.add(shape)
+
+    def is_settled(self, energy=settle_energy):
+        """
+        Returns True if every dynamic object is sleeping or its kinetic energy is smaller than energy.
+        If all objects were sleeping at the last check no object is checked,
+        otherwise all of them are checked, because awake objects wake up sleeping objects which they touch.
+        """
+        if not self._awake:
+            return True
+        self._awake = {shape for shape in self._dynamic if not shape.body.is_sleeping}
+        return all(is_body_at_rest(shape.body, energy) for shape in self._awake)
+
+    def remove_off_screen(self, space: pymunk.Space):
+        """
+        Removes dynamic objects which left the screen from the space and from the registry.
+        Returns list of removed shapes.
+        """
+        removed = []
+        for shape in self._dynamic:
+            x_position = shape.body.position[0]
+            if x_position > SCREEN_WIDTH + 50 or x_position < -50:
+                removed.append(shape)
+        for shape in removed:
+            self.remove(space, shape)
+        return removed
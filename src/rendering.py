@@ -0,0 +1,371 @@
+import pygame
+import pymunk
+import pymunk.pygame_util
+import setup.colors as colors
+from math import ceil, hypot, degrees
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    dirty_rect_limit,
+    rotation_step
+)
+
+
+def draw_shape(options: pymunk.pygame_util.DrawOptions, shape: pymunk.Shape):
+    """
+    Draws single shape on the surface of draw options in the same way as space_draw function does.
+    """
+    body = shape.body
+    fill_color = options.color_for_shape(shape)
+    outline_color = options.shape_outline_color
+    if isinstance(shape, pymunk.Circle):
+        options.draw_circle(body.local_to_world(shape.offset), body.angle, shape.radius, outline_color, fill_color)
+    elif isinstance(shape, pymunk.Poly):
+        vertices = [body.local_to_world(vertex) for vertex in shape.get_vertices()]
+        options.draw_polygon(vertices, shape.radius, outline_color, fill_color)
+    elif isinstance(shape, pymunk.Segment):
+        options.draw_fat_segment(
+            body.local_to_world(shape.a), body.local_to_world(shape.b), shape.radius, outline_color, fill_color
+        )
+
+
+def box_size(shape: pymunk.Poly):
+    """
+    Returns size of the shape if it is a rectangle created by pymunk.Poly.create_box, otherwise returns None.
+    """
+    vertices = shape.get_vertices()
+    if len(vertices) != 4:
+        return None
+    xs = sorted(set(round(vertex.x, 6) for vertex in vertices))
+    ys = sorted(set(round(vertex.y, 6) for vertex in vertices))
+    if len(xs) != 2 or len(ys) != 2 or xs[0] != -xs[1] or ys[0] != -ys[1]:
+        return None
+    return (xs[1] - xs[0], ys[1] - ys[0])
+
+
+def body_rect(body: pymunk.Body):
+    """
+    Returns pygame's rectangle which contains all shapes of the body and its skin.
+    """
+    rect = None
+    for shape in body.shapes:
+        bb = shape.bb
+        shape_rect = pygame.Rect(
+            int(bb.left) - 4, int(SCREEN_HEIGHT - bb.top) - 4,
+            ceil(bb.right - bb.left) + 8, ceil(bb.top - bb.bottom) + 8
+        )
+        rect = shape_rect if rect is None else rect.union(shape_rect)
+    skin = getattr(body, 'skin', None)
+    if skin is not None:
+        # Rotated image of the skin is never bigger than the diagonal of its default image.
+        width, height = skin.default_image.get_size()
+        size = ceil(hypot(width, height)) + 4
+        x, y = body.position
+        skin_rect = pygame.Rect(0, 0, size, size)
+        skin_rect.center = (int(x), int(SCREEN_HEIGHT - y - 3))
+        rect = skin_rect if rect is None else rect.union(skin_rect)
+    return rect
+
+
+def merge_rects(rects: list, bounds: pygame.Rect):
+    """
+    Returns list of rectangles clipped to bounds in which every group of overlapping rectangles
+    is replaced with one rectangle containing all of them.
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.clip(bounds)
+        if not rect.width or not rect.height:
+            continue
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRenderer:
+    """
+    Class DirtyRenderer.
+    Redraws only regions of the screen which were changed since the previous frame.
+    Every drawn object is described by a key, state, rectangle and drawing function.
+    Region of the object is redrawn when its state changes or when it disappears.
+    Contains attributes:
+    :param background: surface with everything that does not move, regions are restored from it
+    :type background: pygame.Surface
+
+    :param limit: part of the screen above which the whole screen is redrawn, defualt: dirty_rect_limit
+    :type limit: float
+
+    :param entities: states and rectangles of objects drawn in the previous frame stored by their keys
+    :type entities: dict
+
+    :param full: is True if the whole screen has to be redrawn in the next frame
+    :type full: bool
+    """
+    def __init__(self, limit=dirty_rect_limit):
+        """
+        Creates instance of DirtyRenderer.
+
+        Raises ValueError if limit is not between 0 and 1.
+        """
+        if limit < 0 or limit > 1:
+            raise ValueError('Limit has to be between 0 and 1')
+        self._limit = limit
+        self._background = None
+        self._entities = {}
+        self._full = True
+
+    @property
+    def background(self):
+        """
+        Returns surface from which regions of the screen are restored.
+        """
+        return self._background
+
+    @property
+    def limit(self):
+        """
+        Returns part of the screen above which the whole screen is redrawn.
+        """
+        return self._limit
+
+    @property
+    def full(self):
+        """
+        Returns True if the whole screen will be redrawn in the next frame.
+        """
+        return self._full
+
+    def set_background(self, background: pygame.Surface):
+        """
+        Changes background to the given surface and makes the whole screen redrawn in the next frame.
+        """
+        self._background = background
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Makes the whole screen redrawn in the next frame.
+        """
+        self._full = True
+
+    def dirty_rects(self, entities: list):
+        """
+        Returns list of rectangles of objects which were changed, added or removed since the previous frame
+        and remembers states of the given objects.
+        """
+        current = {key: (state, rect) for key, state, rect, _ in entities}
+        rects = []
+        for key, (state, rect) in self._entities.items():
+            if key not in current or current[key][0] != state:
+                rects.append(rect)
+        for key, (state, rect) in current.items():
+            if key not in self._entities or self._entities[key][0] != state:
+                rects.append(rect)
+        self._entities = current
+        return rects
+
+    def render(self, screen: pygame.Surface, entities: list):
+        """
+        Draws objects on the screen.
+        Entities is a list of (key, state, rect, draw) tuples in drawing order, where draw
+        is a function without arguments which draws the object.
+        Restores changed regions from the background and redraws objects which overlap them,
+        clipping drawing to these regions.
+        Returns list of redrawn regions or None if the whole screen was redrawn.
+        """
+        bounds = screen.get_rect()
+        regions = merge_rects(self.dirty_rects(entities), bounds)
+        area = sum(region.width * region.height for region in regions)
+        if self._full or area > self._limit * bounds.width * bounds.height:
+            self._full = False
+            screen.blit(self._background, (0, 0))
+            for _, _, _, draw in entities:
+                draw()
+            return None
+        for region in regions:
+            screen.set_clip(region)
+            screen.blit(self._background, region, region)
+            for _, _, rect, draw in entities:
+                if rect.colliderect(region):
+                    draw()
+        screen.set_clip(None)
+        return regions
+
+
+def scale_rect(rect: pygame.Rect, display_size: tuple):
+    """
+    Returns rectangle of the screen resized to the display of the given size.
+    Resized rectangle is rounded outwards, so it always covers the whole region.
+    """
+    x_factor = display_size[0] / SCREEN_WIDTH
+    y_factor = display_size[1] / SCREEN_HEIGHT
+    left = int(rect.left * x_factor)
+    top = int(rect.top * y_factor)
+    return pygame.Rect(
+        left, top,
+        ceil(rect.right * x_factor) - left,
+        ceil(rect.bottom * y_factor) - top
+    )
+
+
+class WorldRenderer:
+    """
+    Class WorldRenderer.
+    Draws every object of the level exactly once.
+    Birds and pigs are drawn only as their skins, bars as images rendered once for every size, color
+    and angle of rotation rounded to rotation_step, other shapes in the same way as space_draw function does.
+    Shapes are kept in a render list in which static shapes are drawn first, then bars and then skins.
+    Contains attributes:
+    :param options: options used to draw shapes which are not bars and do not have skins
+    :type options: pymunk.pygame_util.DrawOptions
+
+    :param layers: lists of static shapes, bars and shapes with skins together with functions drawing them
+    :type layers: tuple
+
+    :param images: rendered images of bars stored by size, radius, color and angle
+    :type images: dict
+
+    :param transform: function returning position and angle at which the body is drawn, used during drawing
+    :type transform: function
+    """
+    def __init__(self):
+        """
+        Creates instance of WorldRenderer with empty render list.
+        """
+        self._options = pymunk.pygame_util.DrawOptions(pygame.Surface((1, 1)))
+        self._options.shape_outline_color = colors.outline_color
+        self._layers = ([], [], [])
+        self._images = {}
+        self._transform = None
+
+    def __len__(self):
+        """
+        Returns number of shapes in the render list.
+        """
+        return sum(len(layer) for layer in self._layers)
+
+    def set_space(self, space: pymunk.Space):
+        """
+        Replaces render list with all shapes of the space.
+        """
+        self._layers = ([], [], [])
+        for shape in space.shapes:
+            self.add(shape)
+
+    def add(self, shape: pymunk.Shape):
+        """
+        Adds shape to the render list.
+        """
+        if shape.body.body_type == pymunk.Body.STATIC:
+            layer = 0
+        elif hasattr(shape.body, 'skin'):
+            layer = 2
+        else:
+            layer = 1
+        if layer == 2:
+            entry = (shape, self.draw_skin, None)
+        elif isinstance(shape, pymunk.Poly) and box_size(shape) is not None:
+            entry = (shape, self.draw_bar, (box_size(shape), shape.radius, tuple(shape.color)))
+        else:
+            entry = (shape, self.draw_shape, None)
+        self._layers[layer].append(entry)
+
+    def transform(self, body: pymunk.Body):
+        """
+        Returns position and angle at which the body is drawn.
+        """
+        if self._transform is None:
+            return body.position, body.angle
+        return self._transform(body)
+
+    def draw(self, surface: pygame.Surface, transform=None):
+        """
+        Draws all shapes from the render list on the surface.
+        Transform is a function returning position and angle at which the given body is drawn,
+        by default bars and skins are drawn at the current position and angle of their bodies.
+        Shapes which were removed from their space are removed from the render list.
+        """
+        self._transform = transform
+        for layer in self._layers:
+            removed = False
+            for shape, draw, data in layer:
+                if shape.space is None:
+                    removed = True
+                    continue
+                draw(surface, shape, data)
+            if removed:
+                layer[:] = [entry for entry in layer if entry[0].space is not None]
+        self._transform = None
+
+    def dynamic_entries(self):
+        """
+        Returns list of (shape, draw, data) entries of bars and shapes with skins which are still in their space
+        in the order in which draw method draws them.
+        """
+        return [entry for layer in self._layers[1:] for entry in layer if entry[0].space is not None]
+
+    def draw_entry(self, surface: pygame.Surface, entry: tuple):
+        """
+        Draws shape of the entry from the render list on the surface.
+        """
+        shape, draw, data = entry
+        draw(surface, shape, data)
+
+    def draw_static(self, surface: pygame.Surface):
+        """
+        Draws only static shapes from the render list on the surface.
+        """
+        for shape, draw, data in self._layers[0]:
+            if shape.space is not None:
+                draw(surface, shape, data)
+
+    def draw_skin(self, surface: pygame.Surface, shape: pymunk.Shape, data=None):
+        """
+        Draws skin of the shape's body on the surface.
+        """
+        position, angle = self.transform(shape.body)
+        shape.body.skin.update(surface, position, angle)
+
+    def draw_shape(self, surface: pygame.Surface, shape: pymunk.Shape, data=None):
+        """
+        Draws shape on the surface in the same way as space_draw function does.
+        """
+        self._options.surface = surface
+        draw_shape(self._options, shape)
+
+    def draw_bar(self, surface: pygame.Surface, shape: pymunk.Poly, data: tuple):
+        """
+        Draws bar on the surface using its image rotated by the angle of its body.
+        Data contains size, radius and color of the bar.
+        """
+        (x, y), angle = self.transform(shape.body)
+        angle = round(degrees(angle) / rotation_step) * rotation_step % 360
+        image = self.bar_image(*data, angle)
+        surface.blit(image, image.get_rect(center=(x, SCREEN_HEIGHT - y)))
+
+    def bar_image(self, size: tuple, radius: float, color: tuple, angle: int):
+        """
+        Returns image of the bar with the given size, radius of its outline and color rotated by angle in degrees.
+        Renders the image only if it was not rendered before.
+        """
+        key = (size, radius, color, angle)
+        if key in self._images:
+            return self._images[key]
+        if angle:
+            image = pygame.transform.rotate(self.bar_image(size, radius, color, 0), angle)
+        else:
+            # Outline is drawn in the same way as pymunk draws polygons with radius:
+            # segments of the given radius along the edges, rounded in the corners.
+            width, height = size
+            border = round(radius)
+            image = pygame.Surface((round(width) + 2 * border, round(height) + 2 * border), pygame.SRCALPHA)
+            box = pygame.Rect(border, border, round(width), round(height))
+            if border > 0:
+                pygame.draw.rect(image, colors.outline_color, image.get_rect(), border_radius=border)
+                box = box.inflate(-2 * border, -2 * border)
+            pygame.draw.rect(image, color, box)
+        self._images[key] = image
+        return image
@@ -0,0 +1,120 @@
+import argparse
+import sys
+import time
+import numpy as np
+from src.get_levels import Game
+from src.recording import ReplayError, read_log, state_checksum
+
+
+class ReplayResult:
+    """
+    Class ReplayResult. Contains attributes:
+    :param frames: number of replayed frames
+    :type frames: int
+
+    :param mismatches: list of (level number, frame number) pairs of frames after which checksum of bodies
+    was different than in the log or which could not be replayed because the game was not in progress
+    :type mismatches: list
+
+    :param frame_times: wall time of every replayed frame in milliseconds
+    :type frame_times: list
+
+    :param wall_time: wall time of the whole replay in seconds
+    :type wall_time: float
+
+    :param profiler: profiler of the last replayed game
+    :type profiler: FrameProfiler
+    """
+    def __init__(self):
+        """
+        Creates empty instance of ReplayResult.
+        """
+        self.frames = 0
+        self.mismatches = []
+        self.frame_times = []
+        self.wall_time = 0
+        self.profiler = None
+
+    @property
+    def deterministic(self):
+        """
+        Returns True if every frame had the same checksum as in the log.
+        """
+        return not self.mismatches
+
+    def slowest_frames(self, amount=10):
+        """
+        Returns list of (frame index, wall time) pairs of the slowest frames.
+        """
+        order = np.argsort(self.frame_times)[::-1][:amount]
+        return [(int(index), self.frame_times[index]) for index in order]
+
+
+def replay(fp, render=False, profile=False):
+    """
+    Replays log written by InputRecorder in headless game without limiting frame rate.
+    Every recorded frame gets the same input and duration as during recording and after every frame
+    checksum of bodies is compared with the recorded one.
+    If render is True objects are drawn on the screen like during recording.
+    If profile is True phases of every frame are measured by profiler of the game.
+    Returns ReplayResult.
+    Raises ReplayError if the log is invalid.
+    """
+    result = ReplayResult()
+    game = None
+    level_number = None
+    start = time.perf_counter()
+    for record in read_log(fp):
+        if record[0] == 'start':
+            _, level_number, adaptive_substeps = record
+            game = Game(headless=True, render=render, adaptive_substeps=adaptive_substeps, profile=profile)
+            game.start(level_number)
+            result.profiler = game.profiler
+            continue
+        frame = record[1]
+        if game is None:
+            raise ReplayError('Log has no start record before the first frame')
+        result.frames += 1
+        if not game.running or game.status != 1:
+            result.mismatches.append((level_number, frame.frame))
+            continue
+        game.queue_input(frame.pygame_events(), frame.pressed_keys(), frame.mouse_pos, frame.frame_time)
+        frame_start = time.perf_counter()
+        game.step()
+        result.frame_times.append((time.perf_counter() - frame_start) * 1000)
+        if state_checksum(game.space) != frame.checksum:
+            result.mismatches.append((level_number, frame.frame))
+    result.wall_time = time.perf_counter() - start
+    return result
+
+
+def main(argv=None):
+    """
+    Replays the log, prints summary and the slowest frames and returns 1 if replay was not deterministic.
+    """
+    parser = argparse.ArgumentParser(description='Replays input recorded by game.py --record at maximal speed.')
+    parser.add_argument('log', help='file with recorded input')
+    parser.add_argument('--render', action='store_true', help='draw objects like during recording')
+    parser.add_argument('--profile', action='store_true', help='measure phases of every frame')
+    parser.add_argument('--trace', help='file to which trace of the frames is saved, turns on --profile')
+    args = parser.parse_args(argv)
+    with open(args.log, 'rb') as fp:
+        result = replay(fp, args.render, args.profile or args.trace is not None)
+    print(f'{result.frames} frames replayed in {result.wall_time:.2f} s')
+    if result.frame_times:
+        print('slowest frames [ms]: ' + ', '.join(f'{index}: {ms:.2f}' for index, ms in result.slowest_frames(5)))
+    if result.profiler is not None and result.profiler.enabled:
+        for name, values in result.profiler.stats().items():
+            print(f'{name:<12}' + ''.join(f'{value:7.2f}' for value in values))
+        if args.trace is not None:
+            result.profiler.export_trace(args.trace)
+    if result.deterministic:
+        print('replay is deterministic')
+        return 0
+    level_number, frame = result.mismatches[0]
+    print(f'{len(result.mismatches)} frames differ, the first one is frame {frame} of level {level_number + 1}')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
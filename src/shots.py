@@ -0,0 +1,165 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.classes import Bird
+from src.get_levels import get_level
+from setup.config import (
+    physics_rate,
+    bird_position,
+    bird_radius
+)
+
+
+class ShotResult:
+    """
+    Class ShotResult. Contains attributes:
+    :param level: index of the level in which the shot was made
+    :type level: int
+
+    :param angle: angle of the shot in degrees
+    :type angle: float
+
+    :param velocity: velocity of the shot
+    :type velocity: float
+
+    :param pigs_killed: number of pigs removed from the level after the shot
+    :type pigs_killed: int
+
+    :param pigs_left: number of pigs which are still in the level after the shot
+    :type pigs_left: int
+
+    :param bars_destroyed: number of bars removed from the level after the shot
+    :type bars_destroyed: int
+
+    :param settle_time: simulated time in seconds after which all objects stopped moving
+    :type settle_time: float
+
+    :param settled: is True if all objects stopped moving before the time limit
+    :type settled: bool
+    """
+    def __init__(
+            self,
+            level: int,
+            angle: float,
+            velocity: float,
+            pigs_killed: int,
+            pigs_left: int,
+            bars_destroyed: int,
+            settle_time: float,
+            settled: bool
+    ):
+        """
+        Creates instance of ShotResult.
+        """
+        self.level = level
+        self.angle = angle
+        self.velocity = velocity
+        self.pigs_killed = pigs_killed
+        self.pigs_left = pigs_left
+        self.bars_destroyed = bars_destroyed
+        self.settle_time = settle_time
+        self.settled = settled
+
+    def __repr__(self):
+        """
+        Returns text representation of the result.
+        """
+        return (
+            f'ShotResult(level={self.level}, angle={self.angle}, velocity={self.velocity}, '
+            f'pigs_killed={self.pigs_killed}, pigs_left={self.pigs_left}, bars_destroyed={self.bars_destroyed}, '
+            f'settle_time={self.settle_time:.2f}, settled={self.settled})'
+        )
+
+
+def shoot(level, angle: float, velocity: float, time_limit=20):
+    """
+    Adds new bird to the level in the same way as Game.load_bird, shoots it with the given angle and velocity
+    and simulates the world until all objects are sleeping or almost not moving or time_limit in seconds passes.
+    Birds shot before stay in the level like in the game.
+    Returns number of simulated frames and True if all objects stopped moving.
+    """
+    space = level.space
+    bird = Bird(space, bird_position, bird_radius, 0.7, 0.6, 0.8)
+    space.force_pass.add(bird.body)
+    level.registry.add(bird.shape)
+    bird.aim(angle, velocity)
+    bird.body.velocity = (bird.x_velocity, bird.y_velocity)
+    frames = 0
+    settled = False
+    while frames < time_limit * physics_rate and not settled:
+        space.step(1 / physics_rate)
+        for destruction in space.destruction_queue.pop_events():
+            level.registry.discard(destruction.shape)
+        space.force_pass.apply()
+        level.registry.remove_off_screen(space)
+        frames += 1
+        settled = level.registry.is_settled()
+    return frames, settled
+
+
+def simulate_shot(level_number: int, angle: float, velocity: float, time_limit=20, previous=()):
+    """
+    Loads world of the level with the given number, shoots the bird with the given angle and velocity
+    and simulates the world until all objects are sleeping or almost not moving or time_limit in seconds passes.
+    If previous is a list of (angle, velocity) pairs, these shots are made first in earlier attempts,
+    so the shot is made in the world left by them and only pigs and bars removed by the last shot are counted.
+    Returns ShotResult.
+    """
+    level = get_level(level_number)
+    for previous_angle, previous_velocity in previous:
+        shoot(level, previous_angle, previous_velocity, time_limit)
+    pigs_before = level.registry.pigs
+    bars_before = len([bar for bar in level.bars if bar.shape.space is not None])
+    frames, settled = shoot(level, angle, velocity, time_limit)
+    pigs_left = level.registry.pigs
+    bars_left = len([bar for bar in level.bars if bar.shape.space is not None])
+    return ShotResult(
+        level_number,
+        angle,
+        velocity,
+        pigs_before - pigs_left,
+        pigs_left,
+        bars_before - bars_left,
+        frames / physics_rate,
+        settled
+    )
+
+
+def simulate_shots(level_number: int, shots: list, time_limit=20, previous=()):
+    """
+    Simulates every shot from the list of (angle, velocity) pairs after previous shots and returns list of ShotResult.
+    """
+    return [simulate_shot(level_number, angle, velocity, time_limit, previous) for angle, velocity in shots]
+
+
+def evaluate_shots(
+        level_number: int,
+        shots: list,
+        workers=None,
+        chunk_size=None,
+        time_limit=20,
+        previous=(),
+        executor=None
+):
+    """
+    Simulates every shot from the list of (angle, velocity) pairs in the level with the given number
+    after previous shots using pool of worker processes.
+    Shots are sent to workers in chunks so that every worker gets several chunks.
+    If executor is given its processes are used and it is not shut down, so it can be reused by many calls.
+    Yields ShotResult of every shot as soon as the chunk containing it is finished,
+    so results are not in the same order as shots.
+    """
+    shots = list(shots)
+    previous = list(previous)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(shots) // (workers * 4))
+    chunks = [shots[i:i + chunk_size] for i in range(0, len(shots), chunk_size)]
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(simulate_shots, level_number, chunk, time_limit, previous) for chunk in chunks]
+        for future in as_completed(futures):
+            for result in future.result():
+                yield result
+    finally:
+        if executor is None:
+            pool.shutdown()
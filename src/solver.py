@@ -0,0 +1,289 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.get_levels import get_data, get_level
+from src.shots import evaluate_shots
+from setup.config import (
+    aiming_range,
+    settle_timeout
+)
+
+
+# The highest velocity which can be set by Bird.set_speed.
+max_velocity = aiming_range * 1913 / 400
+# Steps of angle and velocity of the finest search, the same as changes made by keyboard keys in Bird.set_speed.
+angle_step = 1
+velocity_step = 10
+
+
+class Solution:
+    """
+    Class Solution. Contains attributes:
+    :param level: index of the level
+    :type level: int
+
+    :param attempts: number of birds available in the level
+    :type attempts: int
+
+    :param shots: results of the chosen shot of every attempt in the order of attempts
+    :type shots: list
+
+    :param margins: part of neighbouring shots of every chosen shot, which differ by angle_step
+    or velocity_step and leave at most the same number of pigs
+    :type margins: list
+
+    :param simulated: number of simulated shots
+    :type simulated: int
+
+    :param wall_time: wall time of the search in seconds
+    :type wall_time: float
+    """
+    def __init__(self, level: int, attempts: int):
+        """
+        Creates instance of Solution without shots.
+        """
+        self.level = level
+        self.attempts = attempts
+        self.shots = []
+        self.margins = []
+        self.simulated = 0
+        self.wall_time = 0
+
+    @property
+    def solved(self):
+        """
+        Returns True if all pigs are killed after the last shot.
+        """
+        return bool(self.shots) and self.shots[-1].pigs_left == 0
+
+    def to_dict(self):
+        """
+        Returns dictionary with data of the solution which can be saved in JSON format.
+        """
+        return {
+            'level': self.level + 1,
+            'attempts': self.attempts,
+            'solved': self.solved,
+            'shots': [
+                {
+                    'angle': shot.angle,
+                    'velocity': shot.velocity,
+                    'pigs_killed': shot.pigs_killed,
+                    'pigs_left': shot.pigs_left,
+                    'margin': margin
+                }
+                for shot, margin in zip(self.shots, self.margins)
+            ],
+            'simulated': self.simulated,
+            'wall_time': round(self.wall_time, 3)
+        }
+
+
+def clamp_shot(angle: float, velocity: float):
+    """
+    Returns shot which can be set by Bird.set_speed closest to the given one:
+    whole angle in degrees from 0 to 359 and velocity which is a multiple of velocity_step not greater
+    than max_velocity or max_velocity itself.
+    """
+    velocity = round(velocity / velocity_step) * velocity_step
+    return int(round(angle)) % 360, min(max(velocity, velocity_step), max_velocity)
+
+
+def grid(angles: tuple, velocities: tuple, angle_step: float, velocity_step: float):
+    """
+    Returns list of shots with angles and velocities from the given ranges of (minimum, maximum)
+    with the given steps. The maximal velocity is always included.
+
+    Raises ValueError if a step is not positive.
+    """
+    if angle_step <= 0 or velocity_step <= 0:
+        raise ValueError('Steps of the grid have to be positive')
+    shots = set()
+    angle = angles[0]
+    while angle <= angles[1]:
+        velocity = velocities[0]
+        while velocity < velocities[1]:
+            shots.add(clamp_shot(angle, velocity))
+            velocity += velocity_step
+        shots.add(clamp_shot(angle, velocities[1]))
+        angle += angle_step
+    return sorted(shots)
+
+
+def neighbours(shot: tuple, angle_step: float, velocity_step: float):
+    """
+    Returns shots around the given one which differ from it by the steps.
+    """
+    angle, velocity = shot
+    shots = {
+        clamp_shot(angle + angle_change * angle_step, velocity + velocity_change * velocity_step)
+        for angle_change in (-1, 0, 1)
+        for velocity_change in (-1, 0, 1)
+    }
+    shots.discard(shot)
+    return sorted(shots)
+
+
+def score(result):
+    """
+    Returns key by which results are sorted from the best one: fewer pigs left, more bars destroyed
+    and shorter time of settling.
+    """
+    return result.pigs_left, -result.bars_destroyed, result.settle_time
+
+
+def search_attempt(
+        level_number: int,
+        previous: list,
+        executor,
+        workers: int,
+        angles=(0, 80),
+        velocities=(100, max_velocity),
+        coarse_steps=(10, 100),
+        dense_steps=(2, 20),
+        keep=4,
+        time_limit=settle_timeout
+):
+    """
+    Searches for the best shot made after previous shots in the level with the given number.
+    Shots from the coarse grid are simulated first, then around the best keep shots finer and finer grids
+    are simulated, halving the steps until they are equal to angle_step and velocity_step.
+    Shots which kill no pigs are pruned if any shot kills a pig and if a shot kills all pigs,
+    only shots killing all pigs are refined.
+    If no shot kills a pig, the search is repeated with the coarse grid twice as dense,
+    until its steps reach dense_steps, because some pigs can be hit only by shots from a narrow range.
+    Returns dictionary of all simulated results by (angle, velocity).
+    """
+    results = {}
+
+    def simulate(shots):
+        shots = [shot for shot in shots if shot not in results]
+        for result in evaluate_shots(
+                level_number, shots, workers, time_limit=time_limit, previous=previous, executor=executor
+        ):
+            results[(result.angle, result.velocity)] = result
+
+    while True:
+        steps = coarse_steps
+        simulate(grid(angles, velocities, *steps))
+        while True:
+            best = sorted(results.values(), key=score)
+            if best[0].pigs_left == 0:
+                best = [result for result in best if result.pigs_left == 0]
+            elif best[0].pigs_killed > 0:
+                best = [result for result in best if result.pigs_killed > 0]
+            if steps == (angle_step, velocity_step):
+                break
+            steps = (max(angle_step, steps[0] // 2), max(velocity_step, steps[1] // 2))
+            shots = set()
+            for result in best[:keep]:
+                shots.update(neighbours((result.angle, result.velocity), *steps))
+            simulate(shots)
+        if best[0].pigs_killed > 0 or coarse_steps[0] <= dense_steps[0] and coarse_steps[1] <= dense_steps[1]:
+            return results
+        coarse_steps = (max(dense_steps[0], coarse_steps[0] // 2), max(dense_steps[1], coarse_steps[1] // 2))
+
+
+def margin(
+        level_number: int,
+        previous: list,
+        result,
+        executor,
+        workers: int,
+        results: dict,
+        time_limit=settle_timeout
+):
+    """
+    Returns part of shots differing from the shot of the result by angle_step or velocity_step,
+    which leave at most the same number of pigs.
+    Shots which are not in results are simulated and added to them.
+    """
+    shots = neighbours((result.angle, result.velocity), angle_step, velocity_step)
+    missing = [shot for shot in shots if shot not in results]
+    for neighbour in evaluate_shots(
+            level_number, missing, workers, time_limit=time_limit, previous=previous, executor=executor
+    ):
+        results[(neighbour.angle, neighbour.velocity)] = neighbour
+    return sum(results[shot].pigs_left <= result.pigs_left for shot in shots) / len(shots)
+
+
+def solve_level(level_number: int, executor, workers: int, time_limit=settle_timeout, **kwargs):
+    """
+    Searches for shots which kill all pigs of the level with the given number in the available attempts.
+    Every attempt is searched in the world left by the shots chosen for previous attempts,
+    so the best shot of every attempt is chosen greedily.
+    Other keyword arguments are passed to search_attempt function.
+    Returns Solution.
+    """
+    start = time.perf_counter()
+    solution = Solution(level_number, get_level(level_number).attempts)
+    previous = []
+    for _ in range(solution.attempts):
+        results = search_attempt(level_number, previous, executor, workers, time_limit=time_limit, **kwargs)
+        best = min(results.values(), key=score)
+        solution.margins.append(margin(level_number, previous, best, executor, workers, results, time_limit))
+        solution.simulated += len(results)
+        solution.shots.append(best)
+        previous.append((best.angle, best.velocity))
+        if best.pigs_left == 0:
+            break
+    solution.wall_time = time.perf_counter() - start
+    return solution
+
+
+def solve_levels(level_numbers: list, workers=None, **kwargs):
+    """
+    Solves every level from the list using one pool of worker processes.
+    Yields Solution of every level in the order of the list.
+    Other keyword arguments are passed to solve_level function.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for level_number in level_numbers:
+            yield solve_level(level_number, executor, workers, **kwargs)
+
+
+def main(argv=None):
+    """
+    Solves levels, prints their shots, margins and wall time and returns 1 if any level cannot be solved.
+    """
+    parser = argparse.ArgumentParser(description='Checks that levels can be solved with the available birds.')
+    parser.add_argument('levels', type=int, nargs='*', help='numbers of levels counted from 1, default: all levels')
+    parser.add_argument('--workers', type=int, help='number of worker processes, default: number of CPUs')
+    parser.add_argument('--angle-step', type=int, default=10, help='angle step of the coarse grid, default: 10')
+    parser.add_argument('--velocity-step', type=int, default=100, help='velocity step of the coarse grid, default: 100')
+    parser.add_argument('--keep', type=int, default=4, help='shots refined in every round, default: 4')
+    parser.add_argument('--output', help='file to which solutions are saved in JSON format')
+    args = parser.parse_args(argv)
+    if args.angle_step <= 0 or args.velocity_step <= 0:
+        parser.error('steps of the coarse grid have to be positive')
+    numbers = args.levels or range(1, len(get_data()['levels']) + 1)
+    solutions = []
+    for solution in solve_levels(
+            [number - 1 for number in numbers],
+            args.workers,
+            coarse_steps=(args.angle_step, args.velocity_step),
+            keep=args.keep
+    ):
+        solutions.append(solution)
+        state = 'solved' if solution.solved else 'NOT SOLVED'
+        print(
+            f'level {solution.level + 1}: {state} with {len(solution.shots)} of {solution.attempts} birds, '
+            f'{solution.simulated} shots simulated in {solution.wall_time:.2f} s'
+        )
+        for shot, shot_margin in zip(solution.shots, solution.margins):
+            print(
+                f'    angle {shot.angle:3}, velocity {shot.velocity:6.1f}: '
+                f'{shot.pigs_killed} pigs killed, {shot.pigs_left} left, margin {shot_margin:.2f}'
+            )
+    if args.output is not None:
+        with open(args.output, 'w') as fp:
+            json.dump({'levels': [solution.to_dict() for solution in solutions]}, fp, indent=4)
+    return 0 if all(solution.solved for solution in solutions) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import pygame
+import pytest
+from src.assets import AssetLoader, screen_images, startup_images
+from src.classes import textures, pig_skin_size
+from src.get_levels import Game, get_data
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_startup_images():
+    images = startup_images()
+    assert images[:len(screen_images)] == list(screen_images)
+    radii = {pig['radius'] for level in get_data()['levels'] for pig in level['objects']['pigs']}
+    for radius in radii:
+        assert ('pig.png', pig_skin_size(radius)) in images
+    assert len(images) == len(set(images))
+
+
+def test_startup_images_given_levels():
+    levels_data = {'levels': [{'objects': {'pigs': [{'radius': 30}, {'radius': 30}]}}]}
+    assert startup_images(levels_data)[-1] == ('pig.png', (73, 73))
+
+
+def test_asset_loader_wait():
+    textures.clear()
+    loader = AssetLoader([('pig.png', (41, 41)), ('pig.png', (42, 42)), ('time.png', (100, 20))], workers=2)
+    assert loader.progress == 0
+    assert not loader.done
+    loader.wait()
+    assert loader.done
+    assert loader.progress == 1
+    assert ('pig.png', (41, 41)) in textures
+    assert ('pig.png', (42, 42)) in textures
+    assert set(loader.timings) == {'pig.png', 'time.png'}
+    assert loader.wall_time is not None
+
+
+def test_asset_loader_skips_loaded_images():
+    textures.clear()
+    textures.get('pig.png', (41, 41))
+    loader = AssetLoader([('pig.png', (41, 41))])
+    loader.start()
+    assert loader.done
+    assert loader.timings == {}
+
+
+def test_asset_loader_invalid_file():
+    with pytest.raises(FileNotFoundError):
+        AssetLoader([('pig.png', (41, 41)), ('123', (10, 10))])
+
+
+def test_game_loading_screen():
+    textures.clear()
+    game = Game(headless=True, loader=AssetLoader())
+    assert game.status == 3
+    game.loading_screen()
+    assert 'first_frame' in game.startup_times
+    game.loader.wait()
+    game.loading_screen()
+    assert game.status == 0
+    assert game.level.number == 1
+    assert game.startup_times['first_frame'] <= game.startup_times['assets'] <= game.startup_times['ready']
+    game.start_screen()
+
+
+def test_game_loading_screen_debug(capsys):
+    game = Game(headless=True, loader=AssetLoader(), debug=True)
+    game.loader.wait()
+    while game.status == 3:
+        game.loading_screen()
+    assert 'start screen after' in capsys.readouterr().out
+
+
+def test_game_loaded_assets():
+    loader = AssetLoader()
+    loader.wait()
+    game = Game(headless=True, loader=loader)
+    assert game.status == 0
@@ -0,0 +1,30 @@
+from benchmarks.benchmark import compare, measure, percentile
+
+
+def test_measure():
+    calls = []
+    time = measure(lambda: calls.append(1), 3, 4)
+    assert len(calls) == 12
+    assert time >= 0
+
+
+def test_percentile():
+    values = [5, 1, 4, 2, 3, 6, 8, 7, 10, 9]
+    assert percentile(values, 50) == 5
+    assert percentile(values, 95) == 10
+    assert percentile(values, 0) == 1
+
+
+def test_compare():
+    baseline = {'space_step/50': 1.0, 'skin_update': 0.1, 'space_step_throughput/50': 1000, 'removed': 1}
+    results = {'space_step/50': 1.1, 'skin_update': 0.15, 'space_step_throughput/50': 700, 'new': 1}
+    comparison = {name: (ratio, regressed) for name, _, _, ratio, regressed in compare(results, baseline)}
+    assert set(comparison) == {'space_step/50', 'skin_update', 'space_step_throughput/50'}
+    assert comparison['space_step/50'][1] is False
+    assert comparison['skin_update'][1] is True
+    assert comparison['space_step_throughput/50'] == (0.7, True)
+
+
+def test_compare_tolerance():
+    comparison = compare({'skin_update': 0.15}, {'skin_update': 0.1}, 0.6)
+    assert comparison[0][4] is False
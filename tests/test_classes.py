@@ -1,6 +1,7 @@
 import pygame
 import pymunk
 import pytest
+from math import radians
 import setup.colors as colors
 from src.classes import (
     SizeError,
@@ -14,16 +15,22 @@ from src.classes import (
     Floor,
     Skin,
     Text,
+    TextureCache,
+    FontCache,
     convert_coords,
     check_coords,
     check_radius,
     calc_distance_and_angle,
-    is_on_circle
+    is_on_circle,
+    bird_skin_size,
+    pig_skin_size,
+    load_image
 )
 from setup.config import (
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
-    floor_height
+    floor_height,
+    bird_position
 )
 
 space = pymunk.Space()
@@ -340,6 +347,88 @@ def test_trajectory_calc():
     assert tra.a_of_pattern == pytest.approx(-0.00625)
 
 
+def test_trajectory_points_empty():
+    bird = Bird(space, (width, height), 20)
+    tra = Trajectory(bird)
+    tra.calc()
+    assert len(tra.point_array()) == 0
+    assert tra.rect() is None
+
+
+def test_trajectory_points_right():
+    bird = Bird(space, bird_position, 20)
+    tra = Trajectory(bird)
+    bird.x_velocity = 200
+    bird.y_velocity = 300
+    tra.calc()
+    points = tra.point_array().tolist()
+    assert len(points) > 0
+    assert all(point[0] < 700 for point in points)
+    rect = tra.rect()
+    assert all(rect.collidepoint(point) for point in points)
+
+
+def test_trajectory_points_upwards():
+    bird = Bird(space, (width, height), 20)
+    tra = Trajectory(bird)
+    bird.x_velocity = 0
+    bird.y_velocity = 300
+    tra.calc()
+    points = tra.point_array().tolist()
+    assert len(points) == 4
+    assert all(point[0] == 220 for point in points)
+
+
+def test_trajectory_points_left():
+    bird = Bird(space, bird_position, 20)
+    tra = Trajectory(bird)
+    bird.x_velocity = -200
+    bird.y_velocity = 300
+    tra.calc()
+    points = tra.point_array().tolist()
+    assert len(points) > 0
+    assert all(-100 <= point[0] < bird_position[0] for point in points)
+
+
+def test_trajectory_points_downwards():
+    bird = Bird(space, bird_position, 20)
+    tra = Trajectory(bird)
+    bird.x_velocity = 200
+    bird.y_velocity = -300
+    tra.calc()
+    assert tra.point_array().shape == (0, 2)
+
+
+def test_trajectory_overlay_cached():
+    bird = Bird(space, bird_position, 20)
+    tra = Trajectory(bird)
+    assert tra.overlay() is None
+    bird.x_velocity = 200
+    bird.y_velocity = 300
+    tra.calc()
+    overlay = tra.overlay()
+    assert tra.overlay() is overlay
+    assert tra.rect() == overlay[1]
+    bird.x_velocity = 210
+    tra.calc()
+    assert tra.overlay() is not overlay
+
+
+def test_trajectory_draw():
+    bird = Bird(space, bird_position, 20)
+    tra = Trajectory(bird)
+    bird.x_velocity = 200
+    bird.y_velocity = 300
+    tra.calc()
+    expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    expected.fill((255, 255, 255))
+    screen = expected.copy()
+    for point in tra.point_array().tolist():
+        pygame.draw.circle(expected, (0, 0, 0), point, 3)
+    tra.draw(screen)
+    assert pygame.image.tostring(screen, 'RGB') == pygame.image.tostring(expected, 'RGB')
+
+
 def test_bar_create_normal():
     bar = Bar(space, (width, height), (10, 20), 'static', (0, 0, 0))
     assert bar.body.position == (width, height)
@@ -657,3 +746,174 @@ def test_skin_update():
     assert skin.image is None
     skin.update(screen)
     assert skin.image.get_rect().bottomright == (20, 20)
+
+
+def test_texture_cache_get():
+    cache = TextureCache()
+    image = cache.get('pig.png', (40, 50))
+    assert image.get_width() == 40
+    assert image.get_height() == 50
+    assert cache.misses == 1
+    assert cache.hits == 0
+    assert len(cache) == 1
+
+
+def test_texture_cache_get_shared():
+    cache = TextureCache()
+    image_1 = cache.get('pig.png', (40, 50))
+    image_2 = cache.get('pig.png', (40, 50))
+    image_3 = cache.get('pig.png', (50, 50))
+    assert image_1 is image_2
+    assert image_1 is not image_3
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert cache.hit_rate == pytest.approx(1 / 3)
+
+
+def test_texture_cache_memory_usage():
+    cache = TextureCache()
+    image = cache.get('pig.png', (40, 50))
+    assert cache.memory_usage == image.get_bytesize() * 40 * 50
+    cache.get('pig.png', (40, 50))
+    assert cache.memory_usage == image.get_bytesize() * 40 * 50
+
+
+def test_texture_cache_hit_rate_empty():
+    cache = TextureCache()
+    assert cache.hit_rate == 0
+
+
+def test_texture_cache_invalid_file():
+    cache = TextureCache()
+    with pytest.raises(FileNotFoundError):
+        cache.get('123', (100, 200))
+
+
+def test_texture_cache_clear():
+    cache = TextureCache()
+    cache.get('pig.png', (40, 50))
+    cache.get('pig.png', (40, 50))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+    assert cache.memory_usage == 0
+
+
+def test_texture_cache_add():
+    cache = TextureCache()
+    image = pygame.Surface((40, 50), pygame.SRCALPHA)
+    cache.add('pig.png', (40, 50), image)
+    assert ('pig.png', (40, 50)) in cache
+    assert ('pig.png', [40, 50]) in cache
+    assert ('pig.png', (50, 50)) not in cache
+    assert cache.get('pig.png', (40, 50)).get_size() == (40, 50)
+    assert cache.misses == 0
+    assert cache.memory_usage == image.get_bytesize() * 40 * 50
+
+
+def test_texture_cache_add_replaces_image():
+    cache = TextureCache()
+    cache.add('pig.png', (40, 50), pygame.Surface((40, 50), pygame.SRCALPHA))
+    image = pygame.Surface((40, 50), pygame.SRCALPHA)
+    cache.add('pig.png', (40, 50), image)
+    assert len(cache) == 1
+    assert cache.memory_usage == image.get_bytesize() * 40 * 50
+
+
+def test_skin_sizes():
+    assert bird_skin_size() == (61, 61)
+    assert pig_skin_size(20) == (50, 50)
+    assert pig_skin_size(30) == (73, 73)
+
+
+def test_load_image():
+    image = load_image('pig.png', (30, 20))
+    assert image.get_size() == (30, 20)
+
+
+def test_skin_create_shared_image():
+    bird = Bird(space, (width, height), 20)
+    skin_1 = Skin(bird, 'red_bird.png', (40, 50))
+    skin_2 = Skin(bird, 'red_bird.png', (40, 50))
+    assert skin_1.default_image is skin_2.default_image
+
+
+def test_texture_cache_get_rotated():
+    cache = TextureCache()
+    image_1 = cache.get_rotated('pig.png', (40, 40), 90)
+    image_2 = cache.get_rotated('pig.png', (40, 40), 90)
+    assert image_1 is image_2
+    assert image_1 is not cache.get('pig.png', (40, 40))
+    assert cache.misses == 1
+
+
+def test_skin_update_rotation_cached():
+    bird = Bird(space, (width, height), 20)
+    skin = Skin(bird, 'red_bird.png', (20, 40))
+    skin.update(screen)
+    image = skin.image
+    assert skin.angle == 0
+    bird.body.angle = 0.001
+    skin.update(screen)
+    assert skin.image is image
+
+
+def test_skin_update_rotation_rounded():
+    bird = Bird(space, (width, height), 20)
+    skin = Skin(bird, 'red_bird.png', (20, 40))
+    bird.body.angle = radians(89.5)
+    skin.update(screen)
+    assert skin.angle == 90
+    assert skin.image.get_rect().bottomright == (40, 20)
+
+
+def test_font_cache_font_shared():
+    pygame.init()
+    cache = FontCache()
+    assert cache.font('timesnewroman', 20) is cache.font('timesnewroman', 20)
+    assert cache.font('timesnewroman', 20) is not cache.font('timesnewroman', 30)
+
+
+def test_font_cache_render_shared():
+    pygame.init()
+    cache = FontCache()
+    surf = cache.render('timesnewroman', 20, 'x2', (0, 0, 0), (255, 255, 255))
+    assert surf is cache.render('timesnewroman', 20, 'x2', [0, 0, 0], [255, 255, 255])
+    assert surf is not cache.render('timesnewroman', 20, 'x1', (0, 0, 0), (255, 255, 255))
+    assert surf.get_colorkey() == (255, 255, 255, 255)
+    assert len(cache) == 2
+
+
+def test_font_cache_render_least_recently_used_removed():
+    pygame.init()
+    cache = FontCache(2)
+    surf = cache.render('timesnewroman', 20, 'a', (0, 0, 0), (255, 255, 255))
+    cache.render('timesnewroman', 20, 'b', (0, 0, 0), (255, 255, 255))
+    cache.render('timesnewroman', 20, 'a', (0, 0, 0), (255, 255, 255))
+    cache.render('timesnewroman', 20, 'c', (0, 0, 0), (255, 255, 255))
+    assert len(cache) == 2
+    assert surf is cache.render('timesnewroman', 20, 'a', (0, 0, 0), (255, 255, 255))
+
+
+def test_font_cache_invalid_size():
+    with pytest.raises(ValueError):
+        FontCache(0)
+
+
+def test_font_cache_render_invalid_color():
+    pygame.init()
+    cache = FontCache()
+    with pytest.raises(ValueError):
+        cache.render('timesnewroman', 20, 'a', (0, 0, 256), (255, 255, 255))
+
+
+def test_text_set_str_rect():
+    pygame.init()
+    text = Text('WASD123', (width, height))
+    rect = text.rect
+    text.set_str(screen, 'WASD123')
+    assert text.rect == rect
+    text.set_str(None, 'WASD')
+    assert text.str == 'WASD'
+    assert text.rect.width < rect.width
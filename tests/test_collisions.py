@@ -0,0 +1,138 @@
+import pygame
+import pymunk
+import pytest
+from src.classes import Bird, Pig, Floor
+from src.collisions import (
+    DestructionQueue,
+    compile_damage_table,
+    create_handlers,
+    get_damage_table
+)
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    gravity
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_compile_damage_table_orders_pair():
+    data = {'damage': [{'pair': ['stone_bar', 'pig'], 'energy': 10, 'destroy': ['pig']}]}
+    assert compile_damage_table(data) == {(3, 6): (10, (0,))}
+
+
+def test_compile_damage_table_same_types():
+    data = {'damage': [
+        {'pair': ['pig', 'pig'], 'energy': 10, 'destroy': ['pig', 'pig']},
+        {'pair': ['wooden_bar', 'wooden_bar'], 'energy': 20, 'destroy': ['wooden_bar']}
+    ]}
+    assert compile_damage_table(data) == {(3, 3): (10, (0, 1)), (5, 5): (20, (1,))}
+
+
+def test_compile_damage_table_invalid_name():
+    data = {'damage': [{'pair': ['pig', 'cat'], 'energy': 10, 'destroy': ['pig']}]}
+    with pytest.raises(KeyError):
+        compile_damage_table(data)
+
+
+def test_compile_damage_table_invalid_destroy():
+    data = {'damage': [{'pair': ['bird', 'pig'], 'energy': 10, 'destroy': ['floor']}]}
+    with pytest.raises(ValueError):
+        compile_damage_table(data)
+
+
+def test_compile_damage_table_negative_energy():
+    data = {'damage': [{'pair': ['bird', 'pig'], 'energy': -10, 'destroy': ['pig']}]}
+    with pytest.raises(ValueError):
+        compile_damage_table(data)
+
+
+def test_get_damage_table_loaded_once():
+    table = get_damage_table()
+    assert get_damage_table() is table
+    assert (3, 3) in table
+    assert (5, 6) in table
+    assert (1, 2) not in table
+
+
+def test_create_handlers_only_damage_pairs():
+    space = pymunk.Space()
+    table = {(1, 3): (10, (1,))}
+    handlers = create_handlers(space, table)
+    assert len(handlers) == 1
+    assert handlers[0].post_solve is not None
+
+
+def test_bird_destroys_pig():
+    space = pymunk.Space()
+    space.gravity = gravity
+    create_handlers(space)
+    Floor(space)
+    pig = Pig(space, (600, 220), 20)
+    bird = Bird(space, (300, 220), 20, 0.7, 0.6, 0.8)
+    bird.body.velocity = (3000, 0)
+    destroyed = []
+    for _ in range(30):
+        space.step(1 / 30)
+        destroyed += space.destruction_queue.pop_events()
+    assert pig.shape.space is None
+    assert bird.shape.space is space
+    assert [destruction.shape for destruction in destroyed] == [pig.shape]
+    assert destroyed[0].collision_type == 3
+
+
+def test_slow_bird_does_not_destroy_pig():
+    space = pymunk.Space()
+    space.gravity = gravity
+    create_handlers(space)
+    Floor(space)
+    pig = Pig(space, (600, 220), 20)
+    bird = Bird(space, (300, 220), 20, 0.7, 0.6, 0.8)
+    bird.body.velocity = (100, 0)
+    for _ in range(90):
+        space.step(1 / 30)
+    assert pig.shape.space is space
+
+
+def test_destruction_queue_removes_once():
+    space = pymunk.Space()
+    pig = Pig(space, (600, 220), 20)
+    queue = DestructionQueue()
+    queue.mark(space, pig.shape, 10)
+    queue.mark(space, pig.shape, 20)
+    assert queue.marked == [pig.shape]
+    space.step(1 / 30)
+    assert pig.shape.space is None
+    assert pig.body not in space.bodies
+    events = queue.pop_events()
+    assert len(events) == 1
+    assert events[0].energy == 10
+    assert queue.events == []
+    assert queue.marked == []
+
+
+def test_destruction_queue_removed_during_step():
+    space = pymunk.Space()
+    pig = Pig(space, (600, 220), 20)
+    queue = DestructionQueue()
+    queue.mark(space, pig.shape, 10)
+    space.remove(pig.body, pig.shape)
+    space.step(1 / 30)
+    assert queue.pop_events() == []
+
+
+def test_destruction_queue_pigs_collision():
+    space = pymunk.Space()
+    create_handlers(space, {(1, 3): (0, (1,)), (3, 3): (0, (0, 1))})
+    pig_1 = Pig(space, (600, 220), 20)
+    pig_2 = Pig(space, (630, 220), 20)
+    bird = Bird(space, (570, 220), 20, 0.7, 0.6, 0.8)
+    bird.body.velocity = (100, 0)
+    pig_1.body.velocity = (100, 0)
+    for _ in range(10):
+        space.step(1 / 30)
+    destroyed = [destruction.shape for destruction in space.destruction_queue.pop_events()]
+    assert sorted(destroyed, key=id) == sorted([pig_1.shape, pig_2.shape], key=id)
+    assert bird.shape.space is space
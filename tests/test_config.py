@@ -0,0 +1,82 @@
+import subprocess
+import sys
+import pytest
+import setup.config as config
+from setup.config import (
+    Settings,
+    parse_resolution,
+    get_screen_size,
+    resolution_variable
+)
+
+
+def test_parse_resolution():
+    assert parse_resolution('1280x720') == (1280, 720)
+    assert parse_resolution('1920X1080') == (1920, 1080)
+
+
+@pytest.mark.parametrize('text', ['1280', 'axb', '0x720', '1280x720x1'])
+def test_parse_resolution_invalid(text):
+    with pytest.raises(ValueError):
+        parse_resolution(text)
+
+
+def test_get_screen_size():
+    assert get_screen_size((1920, 1080)) == (1920, 1080, 1)
+    assert get_screen_size((3840, 1080)) == (1920, 1080, 1)
+    assert get_screen_size((960, 1080)) == (960, 540, 0.5)
+
+
+def test_settings_environment():
+    settings = Settings({resolution_variable: '1280x720'})
+    assert settings.resolution == (1280, 720)
+    assert settings.display_size == (1273, 690)
+    assert settings.screen_factor == pytest.approx(2 / 3)
+
+
+def test_settings_lazy(monkeypatch):
+    calls = []
+    monkeypatch.setattr(config, 'get_monitor_resolution', lambda: calls.append(1) or (1920, 1080))
+    settings = Settings({})
+    assert calls == []
+    assert settings.display_size == (1913, 1050)
+    assert settings.screen_factor == 1
+    assert calls == [1]
+
+
+def test_settings_override():
+    settings = Settings({resolution_variable: '1280x720'})
+    assert settings.screen_factor == pytest.approx(2 / 3)
+    settings.override('3840x2160')
+    assert settings.resolution == (3840, 2160)
+    assert settings.screen_factor == 2
+    settings.override((1920, 1080))
+    assert settings.display_size == (1913, 1050)
+    settings.override()
+    assert settings.resolution == (1280, 720)
+
+
+def test_settings_override_invalid():
+    settings = Settings({})
+    with pytest.raises(ValueError):
+        settings.override((0, 100))
+
+
+def test_settings_environment_invalid():
+    settings = Settings({resolution_variable: 'big'})
+    with pytest.raises(ValueError):
+        settings.resolution
+
+
+def test_module_display_metrics(monkeypatch):
+    monkeypatch.setattr(config, 'settings', Settings({resolution_variable: '1280x720'}))
+    assert (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT) == (1273, 690)
+    assert config.screen_factor == pytest.approx(2 / 3)
+    with pytest.raises(AttributeError):
+        config.unknown
+
+
+def test_import_does_not_initialize_pygame():
+    code = 'import pygame, src.get_levels; print(pygame.get_init(), pygame.display.get_init())'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.splitlines()[-1] == 'False False'
@@ -0,0 +1,85 @@
+import numpy as np
+import pygame
+import pymunk
+from src.classes import Bird, Pig, Wooden_bar
+from src.forces import ForcePass, rolling_resistance
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_rolling_resistance():
+    velocities = np.array([
+        (10, 0), (-10, 0.2), (2, 0), (-2, 0), (0, 0.3), (10, 5), (3, 0), (-3, 0)
+    ], dtype=float)
+    rolling_resistance(velocities, 1 / 30)
+    assert velocities.tolist() == [
+        [7, 0], [-7, 0.2], [0, 0], [0, 0], [0, 0.3], [10, 5], [0, 0], [0, 0]
+    ]
+
+
+def test_force_pass_set_space():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    bird = Bird(space, (220, 220), 20)
+    Wooden_bar(space, (700, 500), (20, 100))
+    force_pass = ForcePass()
+    force_pass.set_space(space)
+    assert len(force_pass) == 2
+    assert set(force_pass.bodies) == {pig.body, bird.body}
+
+
+def test_force_pass_apply():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    pig.body.velocity = (10, 0)
+    bar = Wooden_bar(space, (700, 500), (20, 100))
+    bar.body.velocity = (10, 0)
+    force_pass = ForcePass()
+    force_pass.add(pig.body)
+    force_pass.apply()
+    assert pig.body.velocity == (7, 0)
+    assert bar.body.velocity == (10, 0)
+
+
+def test_force_pass_removed_body():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    force_pass = ForcePass()
+    force_pass.set_space(space)
+    space.remove(pig.body, pig.shape)
+    force_pass.apply()
+    assert len(force_pass) == 0
+
+
+def test_force_pass_add_force():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    pig.body.velocity = (0, 100)
+
+    def wind(velocities, dt):
+        velocities[:, 0] += 30 * dt
+
+    force_pass = ForcePass()
+    force_pass.add_force(wind)
+    force_pass.add(pig.body)
+    force_pass.apply(0.5)
+    assert pig.body.velocity == (15, 100)
+
+
+def test_force_pass_skips_sleeping_body():
+    space = pymunk.Space()
+    space.sleep_time_threshold = 0.5
+    pig = Pig(space, (500, 500), 20)
+    pig.body.velocity = (10, 0)
+    space.step(1 / 30)
+    pig.body.sleep()
+    force_pass = ForcePass()
+    force_pass.add(pig.body)
+    force_pass.apply()
+    assert pig.body.is_sleeping
+    assert pig.body.velocity == (10, 0)
@@ -0,0 +1,84 @@
+import pygame
+import pytest
+from src.generator import generate_level, generate_levels, pig_field, pyramid, tower
+from src.get_levels import create_level, validate_level
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_tower():
+    pigs, bars = tower(500, 20, 3)
+    assert len(pigs) == 3
+    assert len(bars) == 9
+    assert bars[0] == {'x_position': 470, 'y_position': 20, 'x_size': 20, 'y_size': 40}
+    assert bars[2] == {'x_position': 500, 'y_position': 50, 'x_size': 80, 'y_size': 20}
+    assert bars[3]['y_position'] == 80
+
+
+def test_tower_stone():
+    _, bars = tower(500, 20, 2, stone=True)
+    assert all(bar['type'] == 'stone' for bar in bars)
+
+
+def test_pyramid():
+    pigs, bars = pyramid(500, 10, 4)
+    assert pigs == []
+    assert len(bars) == 10
+    assert bars[0] == {'x_position': 485, 'y_position': 5, 'x_size': 10, 'y_size': 10}
+    assert bars[-1] == {'x_position': 500, 'y_position': 35, 'x_size': 10, 'y_size': 10}
+
+
+def test_pig_field():
+    pigs, bars = pig_field(500, 20, 3)
+    assert bars == []
+    assert [pig['x_position'] for pig in pigs] == [470, 500, 530]
+    assert all(pig['y_position'] == 10 and pig['radius'] == 10 for pig in pigs)
+
+
+@pytest.mark.parametrize('objects', [10, 100, 1000, 3000])
+def test_generate_level_size(objects):
+    level_data = generate_level(1, objects, seed=5)
+    validate_level(level_data)
+    amount = len(level_data['objects']['pigs']) + len(level_data['objects']['bars'])
+    assert objects * 0.9 <= amount <= objects * 1.6
+
+
+def test_generate_level_seed():
+    assert generate_level(1, 200, seed=3) == generate_level(1, 200, seed=3)
+    assert generate_level(1, 200, seed=3) != generate_level(1, 200, seed=4)
+
+
+def test_generate_level_invalid():
+    with pytest.raises(ValueError):
+        generate_level(1, 0)
+    with pytest.raises(ValueError):
+        generate_level(1, 10, kinds=('castle',))
+
+
+def test_generate_level_kinds():
+    level_data = generate_level(1, 100, seed=1, kinds=('pyramid',), birds=5)
+    assert level_data['objects']['pigs'] == []
+    assert level_data['objects']['birds']['amount'] == 5
+
+
+def test_generate_levels():
+    data = generate_levels([20, 50], seed=1)
+    assert [level['level'] for level in data['levels']] == [1, 2]
+    assert data == generate_levels([20, 50], seed=1)
+
+
+def test_generated_level_loads():
+    level_data = generate_level(1, 300, seed=2)
+    level = create_level(level_data)
+    objects = level_data['objects']
+    assert len(level.pigs) == len(objects['pigs'])
+    assert len(level.bars) == len(objects['bars'])
+    assert len(level.registry) == len(objects['pigs']) + len(objects['bars']) + 1
+    for _ in range(60):
+        level.space.step(1 / 30)
+    assert not level.space.destruction_queue.pop_events()
@@ -1,18 +1,35 @@
+import os
 import pygame
 import pymunk
+import pytest
 import json
 from io import StringIO
 import setup.colors as colors
 from src.get_levels import (
     Game,
-    Level
+    Level,
+    get_data,
+    get_level as load_level,
+    validate_level
+)
+from src.classes import (
+    CoordinatesError,
+    SizeError
 )
 from setup.config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     bird_position,
     floor_height,
-    gravity
+    gravity,
+    FPS,
+    interpolation_fps
+)
+from pygame.locals import (
+    KEYDOWN,
+    K_SPACE,
+    MOUSEBUTTONDOWN,
+    MOUSEBUTTONUP
 )
 
 
@@ -95,6 +112,98 @@ def test_game_create():
     assert game.bird_clicked is False
 
 
+def test_game_create_headless():
+    game = Game(headless=True, render=False)
+    assert game.display is None
+    assert game.headless is True
+    assert game.render is False
+    assert game.status == 0
+    assert game.time == 0
+
+
+def test_game_headless_start_screen_queued_input():
+    game = Game(headless=True, render=False)
+    game.queue_input([pygame.event.Event(KEYDOWN, key=K_SPACE)])
+    game.start_screen()
+    assert game.status == 1
+    assert game.level.number == 1
+
+
+def test_game_headless_step_shot():
+    game = Game(headless=True, render=False)
+    game.start(0)
+    game.bird.x_velocity = 400
+    game.bird.y_velocity = 300
+    game.shoot_bird()
+    for _ in range(10):
+        game.step()
+    assert game.bird_shot is True
+    assert game.bird.body.position[0] > bird_position[0]
+    assert game.time == pytest.approx(10 / FPS)
+
+
+def test_game_headless_step_render():
+    game = Game(headless=True)
+    game.start(0)
+    game.step()
+    assert game.screen.get_at((0, 0)) != (255, 255, 255, 255)
+
+
+def test_game_dirty_rects_step():
+    game = Game(dirty_rects=True)
+    game.start(0)
+    game.step()
+    assert game.dirty_renderer.full is False
+    game.bird.x_velocity = 400
+    game.bird.y_velocity = 300
+    game.shoot_bird()
+    for _ in range(5):
+        game.step()
+    assert game.dirty_renderer.full is False
+
+
+def test_game_dirty_rects_same_pixels():
+    games = [Game(headless=True), Game(headless=True, dirty_rects=True)]
+    bird_screen_position = (bird_position[0], SCREEN_HEIGHT - bird_position[1])
+    frames = [
+        ([], bird_screen_position),
+        ([pygame.event.Event(MOUSEBUTTONDOWN, button=1, pos=bird_screen_position)], bird_screen_position),
+        ([], (bird_screen_position[0] - 200, bird_screen_position[1] + 20)),
+        ([pygame.event.Event(MOUSEBUTTONUP, button=1)], (bird_screen_position[0] - 200, bird_screen_position[1] + 20))
+    ] + [([], (0, 0))] * 20
+    for game in games:
+        game.start(0)
+    for events, mouse_pos in frames:
+        for game in games:
+            game.queue_input(events, mouse_pos=mouse_pos)
+            game.step()
+        full, dirty = (pygame.image.tobytes(game.screen, 'RGB') for game in games)
+        assert full == dirty
+    assert games[1].bird_shot
+
+
+def test_game_scaled_display_step():
+    # Display without SCALED flag has to be closed before display with SCALED flag is created.
+    pygame.display.quit()
+    game = Game(scaled_display=True)
+    assert game.scaled_display is True
+    assert game.fullscreen is False
+    assert not game.display.get_flags() & pygame.FULLSCREEN
+    assert game.screen is game.display
+    assert game.screen.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    game.start(0)
+    game.step()
+    pygame.display.quit()
+    pygame.display.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_game_scaled_display_headless():
+    game = Game(headless=True, scaled_display=True)
+    assert game.scaled_display is False
+    assert game.display is None
+
+
 def test_level_create():
     level = Level(data[0], len(data))
     assert level.number == 1
@@ -153,6 +262,77 @@ def test_level_create_objects_check_bar_static():
     assert level.bars[2].shape.friction == 0.6
 
 
+def test_level_create_objects_registry():
+    level_space = pymunk.Space()
+    level = Level(data[0], len(data))
+    level.create_objects(level_space)
+    assert len(level.registry) == len(level_space.shapes)
+    assert level.registry.pigs == len(level.pigs)
+    assert level.floor.shape not in level.registry.dynamic
+    assert level.registry.shapes(3) == {pig.shape for pig in level.pigs}
+
+
+def test_game_handle_level_off_screen_pig():
+    game = Game(headless=True, render=False)
+    game.start(0)
+    assert game.bird.shape in game.level.registry
+    pig = game.level.pigs[0]
+    pig.body.position = (SCREEN_WIDTH + 100, 500)
+    game.handle_level()
+    assert pig.shape.space is None
+    assert game.level.registry.pigs == len(game.level.pigs) - 1
+
+
+def test_game_handle_level_settle_timeout():
+    game = Game(headless=True, render=False)
+    game.start(0)
+    game.shoot_bird()
+    pig = game.level.pigs[0]
+    pig.body.velocity = (0, 1000)
+    game.handle_level()
+    assert game.bird_shot is True
+    game._time += 16
+    pig.body.velocity = (0, 1000)
+    game.handle_level()
+    assert game.bird_shot is False
+
+
+def test_game_headless_interpolation_and_substeps():
+    game = Game(headless=True, interpolate=True, adaptive_substeps=True)
+    game.start(0)
+    game.bird.x_velocity = 2000
+    game.bird.y_velocity = 300
+    game.shoot_bird()
+    for _ in range(10):
+        game.step()
+    assert game.timestep.accumulator == pytest.approx(0)
+    assert game.interpolation.alpha == pytest.approx(0)
+    assert game.bird.body.position.x > bird_position[0]
+
+
+def test_game_interpolation_fps():
+    assert Game(headless=True).fps == FPS
+    game = Game(headless=True, interpolate=True)
+    assert game.fps == interpolation_fps
+    game.start(0)
+    game.queue_input(frame_time=1 / game.fps)
+    game.step()
+    game.queue_input(frame_time=1 / game.fps)
+    game.step()
+    assert 0 < game.interpolation.alpha < 1
+
+
+def test_game_headless_profile():
+    game = Game(headless=True, profile=True)
+    game.start(0)
+    for _ in range(5):
+        game.step()
+    stats = game.profiler.stats()
+    assert game.profiler.frames == 5
+    for phase in ('frame', 'events', 'physics', 'space_step', 'forces', 'handle_level', 'draw', 'world'):
+        assert phase in stats
+
+
 def test_level_create_objects_check_floor():
     level = Level(data[0], len(data))
     level.create_objects(space)
@@ -221,3 +401,85 @@ def test_get_level_check_floor():
     assert level.floor.shape.radius == floor_height
     assert level.floor.shape.elasticity == 0.6
     assert level.floor.shape.color == colors.ground
+
+
+def test_get_level():
+    level = load_level(0)
+    assert level.number == 1
+    assert level.space.gravity == gravity
+    assert level.pigs[0].body in level.space.bodies
+    assert level.pigs[0].body.skin.object is level.pigs[0]
+
+
+def test_get_level_returns_new_level():
+    level_1 = load_level(0)
+    level_2 = load_level(0)
+    assert level_1.space is not level_2.space
+    assert level_1.pigs[0].body is not level_2.pigs[0].body
+    assert level_1.pigs[0].body.position == level_2.pigs[0].body.position
+    level_1.pigs[0].body.velocity = (100, 0)
+    level_1.space.step(0.1)
+    assert level_1.pigs[0].body.position != level_2.pigs[0].body.position
+
+
+def test_get_level_file_changed(tmp_path, monkeypatch):
+    (tmp_path / 'setup').mkdir()
+    (tmp_path / 'images').symlink_to(os.path.abspath('images'))
+    path = tmp_path / 'setup' / 'levels.json'
+    path.write_text(open('setup/levels.json').read())
+    monkeypatch.chdir(tmp_path)
+    assert load_level(0).attempts == 2
+    path.write_text(path.read_text().replace('"amount": 2', '"amount": 4', 1))
+    os.utime(path, ns=(0, 0))
+    assert load_level(0).attempts == 4
+
+
+def test_get_data_cached(tmp_path):
+    path = tmp_path / 'levels.json'
+    path.write_text(file)
+    data_1 = get_data(str(path))
+    data_2 = get_data(str(path))
+    assert data_1 is data_2
+    assert data_1['levels'][0]['level'] == 1
+
+
+def test_get_data_file_changed(tmp_path):
+    path = tmp_path / 'levels.json'
+    path.write_text(file)
+    data_1 = get_data(str(path))
+    path.write_text(file.replace('"amount": 2', '"amount": 3'))
+    data_2 = get_data(str(path))
+    assert data_1 is not data_2
+    assert data_2['levels'][0]['objects']['birds']['amount'] == 3
+
+
+def test_get_data_invalid_level(tmp_path):
+    path = tmp_path / 'levels.json'
+    path.write_text(file.replace('"x_position": 800', '"x_position": 8000'))
+    with pytest.raises(CoordinatesError):
+        get_data(str(path))
+
+
+def test_validate_level():
+    validate_level(data[0])
+
+
+def test_validate_level_invalid_size():
+    level_data = json.loads(file)['levels'][0]
+    level_data['objects']['bars'][0]['x_size'] = 0
+    with pytest.raises(SizeError):
+        validate_level(level_data)
+
+
+def test_validate_level_invalid_bar_type():
+    level_data = json.loads(file)['levels'][0]
+    level_data['objects']['bars'][0]['type'] = 'glass'
+    with pytest.raises(ValueError):
+        validate_level(level_data)
+
+
+def test_validate_level_missing_key():
+    level_data = json.loads(file)['levels'][0]
+    del level_data['objects']['pigs'][0]['radius']
+    with pytest.raises(KeyError):
+        validate_level(level_data)
@@ -0,0 +1,69 @@
+import pygame
+import pymunk
+import pytest
+from src.classes import Bird, Pig
+from src.physics import FixedTimestep, Interpolation
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_fixed_timestep_invalid_rate():
+    with pytest.raises(ValueError):
+        FixedTimestep(0)
+
+
+def test_fixed_timestep_same_rate():
+    timestep = FixedTimestep(30)
+    assert [timestep.advance(1 / 30) for _ in range(100)] == [1] * 100
+    assert timestep.accumulator == pytest.approx(0)
+
+
+def test_fixed_timestep_higher_rate():
+    timestep = FixedTimestep(120)
+    assert timestep.advance(1 / 30) == 4
+    assert timestep.advance(1 / 240) == 0
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(1 / 240) == 1
+
+
+def test_fixed_timestep_slow_frames():
+    timestep = FixedTimestep(30, max_frame_time=0.25)
+    assert timestep.advance(0.1) == 3
+    assert timestep.advance(10) == 7
+
+
+def test_fixed_timestep_substeps():
+    space = pymunk.Space()
+    timestep = FixedTimestep(30, max_substeps=4, substep_distance=20)
+    bird = Bird(space, (220, 220), 20)
+    assert timestep.substeps(space.shapes) == 1
+    bird.body.velocity = (1200, 0)
+    assert timestep.substeps(space.shapes) == 2
+    bird.body.velocity = (12000, 0)
+    assert timestep.substeps(space.shapes) == 4
+
+
+def test_interpolation():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    interpolation = Interpolation()
+    interpolation.store(space.shapes)
+    pig.body.position = (600, 300)
+    pig.body.angle = 1
+    interpolation.alpha = 0.5
+    assert interpolation.transform(pig.body) == ((550, 400), 0.5)
+    interpolation.alpha = 1
+    assert interpolation.transform(pig.body) == ((600, 300), 1)
+
+
+def test_interpolation_unknown_body():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    interpolation = Interpolation()
+    interpolation.alpha = 0
+    assert interpolation.transform(pig.body) == ((500, 500), 0)
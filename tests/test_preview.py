@@ -0,0 +1,243 @@
+import threading
+import pygame
+import pymunk
+import pytest
+from src.classes import Bird, Bar
+from src.get_levels import Game, get_level
+from src.preview import (
+    Impact,
+    ImpactPreview,
+    QueryShapes,
+    quantize,
+    launch_velocity,
+    flight_path,
+    snapshot_shapes,
+    find_impact,
+    simulate_impact,
+    snapshot_body,
+    build_body,
+    snapshot_space,
+    build_space
+)
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    bird_position,
+    bird_radius,
+    gravity,
+    physics_rate
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+dt = 1 / physics_rate
+
+
+def test_quantize():
+    assert quantize(44.6, 903) == (45, 900)
+    assert quantize(359.7, 0) == (0, 0)
+
+
+def test_launch_velocity_same_as_bird():
+    bird = Bird(pymunk.Space(), bird_position, bird_radius)
+    bird.aim(37, 815)
+    assert launch_velocity(37, 815) == (bird.x_velocity, bird.y_velocity)
+
+
+def test_flight_path_same_as_pymunk():
+    space = pymunk.Space()
+    space.gravity = gravity
+    body = pymunk.Body(1, 1)
+    body.position = bird_position
+    body.velocity = (300, 400)
+    space.add(body, pymunk.Circle(body, bird_radius))
+    path = flight_path(bird_position, (300, 400), dt, 1)
+    assert len(path) == physics_rate + 1
+    for point in path[1:]:
+        space.step(dt)
+        assert tuple(point) == pytest.approx(tuple(body.position))
+
+
+def test_flight_path_ends_outside_screen():
+    path = flight_path(bird_position, (-2000, 0), dt)
+    assert path[-1][0] < -50
+    assert path[-2][0] >= -50
+
+
+def test_snapshot_shapes():
+    space = pymunk.Space()
+    bar = Bar(space, (500, 300), (40, 100), 'static')
+    bar.body.angle = 0.5
+    kind, collision_type, vertices, radius = snapshot_shapes(space.shapes)[0]
+    assert kind == 'poly'
+    assert collision_type == bar.shape.collision_type
+    assert vertices == [bar.body.local_to_world(vertex) for vertex in bar.shape.get_vertices()]
+
+
+def test_find_impact_floor():
+    level = get_level(0)
+    query = QueryShapes(snapshot_shapes(level.space.shapes))
+    impact = find_impact(query, bird_position, launch_velocity(10, 900))
+    assert isinstance(impact, Impact)
+    assert impact.collision_type == level.floor.shape.collision_type
+    assert impact.position[1] == pytest.approx(220, abs=1)
+    assert impact.time == pytest.approx(0.66, abs=0.04)
+
+
+def test_find_impact_bar_near_path():
+    # Bar lies next to the path closer than radius of the bird but its bounding box does not touch the path.
+    space = pymunk.Space()
+    Bar(space, (400, 400), (200, 20), 'static')
+    Bar(space, (1200, 400), (20, 20), 'static')
+    Bar(space, (800, 235), (20, 10), 'static')
+    query = QueryShapes(snapshot_shapes(space.shapes))
+    impact = find_impact(query, (700, 255), (600, 0), dt=dt)
+    assert impact is not None
+    assert 760 < impact.position[0] < 800
+    assert 785 <= impact.point[0] <= 815
+
+
+def test_find_impact_nothing():
+    query = QueryShapes([])
+    assert find_impact(query, bird_position, (500, 500)) is None
+
+
+def test_simulate_impact_same_as_find_impact():
+    level = get_level(0)
+    bird = Bird(pymunk.Space(), bird_position, bird_radius, 0.7, 0.6, 0.8)
+    query = QueryShapes(snapshot_shapes(level.space.shapes))
+    expected = find_impact(query, bird_position, launch_velocity(60, 956))
+    impact = simulate_impact((snapshot_space(level.space), snapshot_body(bird.body)), launch_velocity(60, 956))
+    assert impact.collision_type == expected.collision_type
+    assert impact.position == pytest.approx(expected.position, abs=20)
+
+
+def test_simulate_impact_skips_shapes_touched_at_start():
+    level = get_level(0)
+    bird = Bird(level.space, bird_position, bird_radius, 0.7, 0.6, 0.8)
+    query = QueryShapes(snapshot_shapes(shape for shape in level.space.shapes if shape is not bird.shape))
+    template = (snapshot_space(level.space, (bird.body,)), snapshot_body(bird.body))
+    for angle, velocity in ((0, 200), (60, 956)):
+        expected = find_impact(query, bird_position, launch_velocity(angle, velocity))
+        impact = simulate_impact(template, launch_velocity(angle, velocity))
+        assert (impact is None) == (expected is None)
+        if impact is not None:
+            assert impact.collision_type == expected.collision_type
+            assert impact.time > dt
+
+
+def test_find_impact_same_as_simulate_impact_along_floor():
+    level = get_level(0)
+    bird = Bird(level.space, bird_position, bird_radius, 0.7, 0.6, 0.8)
+    query = QueryShapes(snapshot_shapes(shape for shape in level.space.shapes if shape is not bird.shape))
+    template = (snapshot_space(level.space, (bird.body,)), snapshot_body(bird.body))
+    for angle, velocity in ((0, 900), (0, 500), (10, 900), (30, 800)):
+        expected = simulate_impact(template, launch_velocity(angle, velocity))
+        impact = find_impact(query, bird_position, launch_velocity(angle, velocity))
+        assert impact.collision_type == expected.collision_type
+        assert impact.position[0] == pytest.approx(expected.position[0], abs=40)
+    impact = find_impact(query, bird_position, launch_velocity(0, 900))
+    assert impact.collision_type != level.floor.shape.collision_type
+
+
+def test_flight_path_rolls_on_floor():
+    path = flight_path(bird_position, (300, 0), dt, 1)
+    assert all(point[1] == bird_position[1] for point in path)
+    assert path[-1][0] == pytest.approx(bird_position[0] + 200, abs=10)
+
+
+def test_snapshot_body():
+    bird = Bird(pymunk.Space(), bird_position, bird_radius, 0.7, 0.6, 0.8)
+    bird.body.velocity = (100, 50)
+    body, shapes = build_body(snapshot_body(bird.body))
+    assert body is not bird.body
+    assert body.position == bird.body.position
+    assert body.velocity == (100, 50)
+    assert shapes[0].radius == bird.radius
+    assert (shapes[0].density, shapes[0].elasticity, shapes[0].friction) == pytest.approx((0.7, 0.6, 0.8))
+    assert shapes[0].collision_type == bird.shape.collision_type
+    assert body.mass == pytest.approx(bird.body.mass)
+
+
+def test_snapshot_space():
+    level = get_level(0)
+    space = build_space(snapshot_space(level.space))
+    assert space.gravity == level.space.gravity
+    assert space.sleep_time_threshold == level.space.sleep_time_threshold
+    assert len(space.shapes) == len(level.space.shapes)
+    assert sorted(shape.collision_type for shape in space.shapes) == sorted(
+        shape.collision_type for shape in level.space.shapes
+    )
+
+
+@pytest.mark.parametrize('simulate', [False, True])
+def test_impact_preview_request(simulate):
+    level = get_level(0)
+    bird = Bird(level.space, bird_position, bird_radius, 0.7, 0.6, 0.8)
+    preview = ImpactPreview(simulate)
+    preview.set_level(level, bird.shape)
+    assert bird.shape in level.space.shapes
+    assert preview.request(10, 903) is None
+    preview.wait()
+    assert (10, 900) in preview.cache
+    impact = preview.request(10, 897)
+    assert impact is preview.cache[(10, 900)]
+    assert impact.position[0] == pytest.approx(811, abs=12)
+    preview.close()
+
+
+def test_impact_preview_only_latest_request():
+    level = get_level(0)
+    bird = Bird(level.space, bird_position, bird_radius)
+    preview = ImpactPreview()
+    preview.set_level(level, bird.shape)
+    # Worker is blocked on the first request, so that all other requests are made while it is busy.
+    release = threading.Event()
+    compute = preview.compute
+
+    def blocked_compute(scene, key):
+        release.wait()
+        return compute(scene, key)
+
+    preview.compute = blocked_compute
+    for velocity in range(500, 1000, 10):
+        preview.request(30, velocity)
+    release.set()
+    preview.wait()
+    assert set(preview.cache) == {(30, 500), (30, 990)}
+    preview.close()
+
+
+def test_impact_preview_skips_old_level():
+    level = get_level(0)
+    bird = Bird(level.space, bird_position, bird_radius)
+    preview = ImpactPreview()
+    preview.set_level(level, bird.shape)
+    preview.request(30, 800)
+    preview.set_level(level, bird.shape)
+    preview.wait()
+    assert len(preview.cache) == 0
+    preview.close()
+
+
+def test_impact_preview_no_velocity():
+    preview = ImpactPreview()
+    assert preview.request(30, 800) is None
+    preview.close()
+
+
+@pytest.mark.parametrize('simulate', [False, True])
+def test_game_impact_preview(simulate):
+    preview = ImpactPreview(simulate)
+    game = Game(headless=True, dirty_rects=True, preview=preview)
+    game.start(0)
+    game.bird.aim(10, 900)
+    game.step()
+    preview.wait()
+    game.step()
+    assert game.impact is preview.cache[(10, 900)]
+    assert game.impact.position[0] == pytest.approx(811, abs=12)
+    game.shoot_bird()
+    game.step()
+    assert game.impact is None
+    preview.close()
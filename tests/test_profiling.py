@@ -0,0 +1,83 @@
+import json
+import pygame
+import pytest
+from src.profiling import FrameProfiler
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_profiler_invalid_window():
+    with pytest.raises(ValueError):
+        FrameProfiler(window=0)
+
+
+def test_profiler_disabled():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    with profiler.phase('physics'):
+        pass
+    profiler.end_frame()
+    assert profiler.stats() == {}
+    assert len(profiler.events) == 0
+    assert profiler.frames == 0
+
+
+def test_profiler_phases():
+    profiler = FrameProfiler(True)
+    for _ in range(3):
+        profiler.begin_frame()
+        with profiler.phase('physics'):
+            pass
+        profiler.end_frame()
+    assert set(profiler.stats()) == {'physics', 'frame'}
+    assert profiler.frames == 3
+    assert len(profiler.events) == 6
+    assert profiler.percentiles('draw') is None
+
+
+def test_profiler_percentiles():
+    profiler = FrameProfiler(True, window=100)
+    for duration in range(1, 201):
+        profiler.record('physics', 0, duration * 1000000)
+    p50, p95, p99 = profiler.percentiles('physics')
+    assert p50 == pytest.approx(150.5)
+    assert p95 == pytest.approx(195.05)
+    assert p99 == pytest.approx(199.01)
+
+
+def test_profiler_event_limit():
+    profiler = FrameProfiler(True, event_limit=5)
+    for _ in range(10):
+        profiler.record('physics', 0, 1000)
+    assert len(profiler.events) == 5
+
+
+def test_profiler_export_trace(tmp_path):
+    profiler = FrameProfiler(True)
+    profiler.record('physics', profiler._epoch + 2000, profiler._epoch + 5000)
+    path = tmp_path / 'trace.json'
+    profiler.export_trace(path)
+    with open(path) as fp:
+        trace = json.load(fp)
+    assert trace['traceEvents'] == [
+        {'name': 'physics', 'ph': 'X', 'ts': 2, 'dur': 3, 'pid': 0, 'tid': 0}
+    ]
+
+
+def test_profiler_overlay():
+    profiler = FrameProfiler()
+    profiler.toggle_overlay()
+    assert profiler.enabled
+    assert profiler.overlay
+    profiler.record('physics', 0, 1000000)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen.fill((255, 255, 255))
+    profiler.draw_overlay(screen)
+    assert screen.get_at((SCREEN_WIDTH - 15, 15)) == (0, 0, 0)
+    profiler.toggle_overlay()
+    assert not profiler.overlay
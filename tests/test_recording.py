@@ -0,0 +1,89 @@
+import collections
+import io
+import struct
+import pygame
+import pymunk
+import pytest
+from src.classes import Pig
+from src.recording import (
+    InputRecorder,
+    ReplayError,
+    decode_keys,
+    encode_keys,
+    read_log,
+    state_checksum
+)
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+from pygame.locals import (
+    K_a,
+    K_q,
+    K_r,
+    K_UP,
+    KEYDOWN,
+    MOUSEBUTTONUP,
+    MOUSEMOTION,
+    QUIT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_encode_keys():
+    pressed_keys = collections.defaultdict(bool, {K_UP: True, K_a: True, K_q: True})
+    keys = encode_keys(pressed_keys)
+    decoded = decode_keys(keys)
+    assert decoded[K_UP] and decoded[K_a]
+    assert not decoded[K_q]
+
+
+def test_state_checksum():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    checksum = state_checksum(space)
+    assert checksum == state_checksum(space)
+    pig.body.velocity = (0, 1e-9)
+    assert checksum != state_checksum(space)
+
+
+def test_record_and_read():
+    fp = io.BytesIO()
+    recorder = InputRecorder(fp)
+    recorder.begin(2, True)
+    events = [
+        pygame.event.Event(KEYDOWN, key=K_r),
+        pygame.event.Event(MOUSEMOTION, pos=(1, 1)),
+        pygame.event.Event(MOUSEBUTTONUP, button=3),
+        pygame.event.Event(QUIT)
+    ]
+    recorder.record_frame(0.02, events, collections.defaultdict(bool, {K_UP: True}), (10.5, 20.25), 1234)
+    recorder.record_frame(0.03, [], collections.defaultdict(bool), (0, 0), 5)
+    assert recorder.frame == 2
+    fp.seek(0)
+    records = list(read_log(fp))
+    assert records[0] == ('start', 2, True)
+    frame = records[1][1]
+    assert frame.frame == 0
+    assert frame.frame_time == 0.02
+    assert frame.mouse_pos == (10.5, 20.25)
+    assert frame.checksum == 1234
+    assert frame.events == [(KEYDOWN, K_r), (MOUSEBUTTONUP, 3), (QUIT, 0)]
+    replayed = frame.pygame_events()
+    assert replayed[0].key == K_r
+    assert replayed[1].button == 3
+    assert frame.pressed_keys()[K_UP]
+    assert records[2][1].frame == 1
+
+
+def test_read_invalid_log():
+    with pytest.raises(ReplayError):
+        list(read_log(io.BytesIO(b'not a log')))
+    fp = io.BytesIO()
+    InputRecorder(fp).begin(0, False)
+    with pytest.raises(ReplayError):
+        list(read_log(io.BytesIO(fp.getvalue()[:-1])))
+    with pytest.raises(ReplayError):
+        list(read_log(io.BytesIO(fp.getvalue() + struct.pack('<B', 9))))
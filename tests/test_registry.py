@@ -0,0 +1,115 @@
+import pygame
+import pymunk
+from src.classes import Bird, Pig, Bar, Floor
+from src.registry import EntityRegistry, is_body_at_rest
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_registry_add():
+    space = pymunk.Space()
+    floor = Floor(space)
+    pig = Pig(space, (500, 500), 20)
+    bird = Bird(space, (220, 220), 20)
+    registry = EntityRegistry()
+    for shape in space.shapes:
+        registry.add(shape)
+    registry.add(pig.shape)
+    assert len(registry) == 3
+    assert registry.pigs == 1
+    assert registry.shapes(1) == {bird.shape}
+    assert registry.shapes(6) == set()
+    assert registry.dynamic == {pig.shape, bird.shape}
+    assert floor.shape in registry
+
+
+def test_registry_discard():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    registry = EntityRegistry()
+    registry.add(pig.shape)
+    registry.discard(pig.shape)
+    registry.discard(pig.shape)
+    assert registry.pigs == 0
+    assert len(registry) == 0
+    assert pig.shape.space is space
+
+
+def test_registry_remove():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    registry = EntityRegistry()
+    registry.add(pig.shape)
+    registry.remove(space, pig.shape)
+    registry.remove(space, pig.shape)
+    assert pig.shape.space is None
+    assert pig.body not in space.bodies
+    assert registry.pigs == 0
+
+
+def test_registry_remove_off_screen():
+    space = pymunk.Space()
+    pig_1 = Pig(space, (500, 500), 20)
+    pig_2 = Pig(space, (500, 500), 20)
+    bar = Bar(space, (500, 500), (20, 20), 'static')
+    registry = EntityRegistry()
+    for shape in space.shapes:
+        registry.add(shape)
+    pig_2.body.position = (-100, 500)
+    assert registry.remove_off_screen(space) == [pig_2.shape]
+    assert pig_1.shape.space is space
+    assert pig_2.shape.space is None
+    assert bar.shape in registry
+    assert registry.pigs == 1
+
+
+def test_is_body_at_rest():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    assert is_body_at_rest(pig.body)
+    pig.body.velocity = (1, 0)
+    assert is_body_at_rest(pig.body)
+    pig.body.velocity = (100, 0)
+    assert not is_body_at_rest(pig.body)
+    assert is_body_at_rest(pig.body, pig.body.kinetic_energy + 1)
+
+
+def test_registry_is_settled_sleeping():
+    space = pymunk.Space()
+    space.gravity = (0, -500)
+    space.sleep_time_threshold = 0.5
+    Floor(space)
+    pig = Pig(space, (500, 220), 20)
+    pig.body.velocity = (0, -100)
+    registry = EntityRegistry()
+    for shape in space.shapes:
+        registry.add(shape)
+    assert not registry.is_settled()
+    for _ in range(60):
+        space.step(1 / 30)
+    assert pig.body.is_sleeping
+    assert registry.is_settled()
+    assert registry.awake == set()
+
+
+def test_registry_is_settled_wake():
+    space = pymunk.Space()
+    space.gravity = (0, -500)
+    space.sleep_time_threshold = 0.5
+    Floor(space)
+    pig = Pig(space, (500, 220), 20)
+    registry = EntityRegistry()
+    for shape in space.shapes:
+        registry.add(shape)
+    for _ in range(60):
+        space.step(1 / 30)
+    assert registry.is_settled()
+    pig.body.velocity = (0, 300)
+    registry.wake(pig.shape)
+    assert registry.awake == {pig.shape}
+    assert not registry.is_settled()
@@ -0,0 +1,161 @@
+import pygame
+import pymunk
+import pytest
+from src.classes import Pig, Wooden_bar, Floor
+from src.rendering import (
+    DirtyRenderer,
+    WorldRenderer,
+    body_rect,
+    box_size,
+    merge_rects,
+    scale_rect
+)
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+bounds = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+
+def test_merge_rects_overlapping():
+    rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(100, 100, 10, 10)]
+    merged = merge_rects(rects, bounds)
+    assert merged == [pygame.Rect(0, 0, 15, 15), pygame.Rect(100, 100, 10, 10)]
+
+
+def test_merge_rects_chain():
+    rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 0, 10, 10), pygame.Rect(5, 0, 20, 10)]
+    assert merge_rects(rects, bounds) == [pygame.Rect(0, 0, 30, 10)]
+
+
+def test_merge_rects_clipped():
+    rects = [pygame.Rect(-10, -10, 20, 20), pygame.Rect(-100, -100, 10, 10)]
+    assert merge_rects(rects, bounds) == [pygame.Rect(0, 0, 10, 10)]
+
+
+def test_scale_rect():
+    rect = pygame.Rect(10, 20, 30, 40)
+    assert scale_rect(rect, (SCREEN_WIDTH, SCREEN_HEIGHT)) == rect
+    assert scale_rect(rect, (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)) == pygame.Rect(5, 10, 15, 20)
+
+
+def test_body_rect_contains_skin():
+    space = pymunk.Space()
+    pig = Pig(space, (500, 500), 20)
+    rect = body_rect(pig.body)
+    assert rect.collidepoint(500, SCREEN_HEIGHT - 500)
+    assert rect.width >= pig.body.skin.default_image.get_width()
+    assert rect.height >= pig.body.skin.default_image.get_height()
+
+
+def test_dirty_renderer_invalid_limit():
+    with pytest.raises(ValueError):
+        DirtyRenderer(2)
+
+
+def test_dirty_renderer_dirty_rects():
+    renderer = DirtyRenderer()
+    rect_1 = pygame.Rect(0, 0, 10, 10)
+    rect_2 = pygame.Rect(50, 50, 10, 10)
+    assert renderer.dirty_rects([('a', 1, rect_1, None)]) == [rect_1]
+    assert renderer.dirty_rects([('a', 1, rect_1, None)]) == []
+    assert renderer.dirty_rects([('a', 2, rect_2, None)]) == [rect_1, rect_2]
+    assert renderer.dirty_rects([]) == [rect_2]
+
+
+def test_dirty_renderer_render():
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background.fill((255, 255, 255))
+    renderer = DirtyRenderer()
+    renderer.set_background(background)
+    drawn = []
+    rect = pygame.Rect(10, 10, 20, 20)
+
+    def draw():
+        drawn.append(1)
+        screen.fill((255, 0, 0), rect)
+
+    assert renderer.render(screen, [('a', (10, 10), rect, draw)]) is None
+    assert renderer.full is False
+    assert screen.get_at((15, 15)) == (255, 0, 0)
+    assert renderer.render(screen, [('a', (10, 10), rect, draw)]) == []
+    assert len(drawn) == 1
+    moved = pygame.Rect(100, 10, 20, 20)
+    regions = renderer.render(screen, [('b', 1, moved, lambda: screen.fill((0, 0, 255), moved))])
+    assert regions == [rect, moved]
+    assert screen.get_at((15, 15)) == (255, 255, 255)
+    assert screen.get_at((105, 15)) == (0, 0, 255)
+
+
+def test_dirty_renderer_render_over_limit():
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = DirtyRenderer(0.1)
+    renderer.set_background(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    renderer.render(screen, [])
+    big = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT / 2)
+    assert renderer.render(screen, [('a', 1, big, lambda: None)]) is None
+
+
+def test_box_size():
+    space = pymunk.Space()
+    bar = Wooden_bar(space, (100, 100), (40, 20))
+    assert box_size(bar.shape) == (40, 20)
+    triangle = pymunk.Poly(pymunk.Body(), [(0, 0), (10, 0), (0, 10)])
+    assert box_size(triangle) is None
+
+
+def test_world_renderer_render_list():
+    space = pymunk.Space()
+    Floor(space)
+    Pig(space, (100, 300), 20)
+    bar = Wooden_bar(space, (300, 300), (40, 20))
+    renderer = WorldRenderer()
+    renderer.set_space(space)
+    assert len(renderer) == 3
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer.draw(surface)
+    space.remove(bar.body, bar.shape)
+    renderer.draw(surface)
+    assert len(renderer) == 2
+
+
+def test_world_renderer_draws_skin_only():
+    space = pymunk.Space()
+    pig = Pig(space, (100, 300), 20)
+    renderer = WorldRenderer()
+    renderer.set_space(space)
+    surface = pygame.Surface((200, SCREEN_HEIGHT), pygame.SRCALPHA)
+    renderer.draw(surface)
+    assert pig.body.skin.angle == 0
+    pig_color = pygame.Color(pig.shape.color)
+    x, y = 100, SCREEN_HEIGHT - 300
+    pixels = [surface.get_at((x + dx, y + dy)) for dx in range(-25, 26) for dy in range(-25, 26)]
+    assert pig_color not in pixels
+
+
+def test_world_renderer_bar_image_cached():
+    space = pymunk.Space()
+    bar = Wooden_bar(space, (300, 300), (40, 20))
+    renderer = WorldRenderer()
+    image = renderer.bar_image((40, 20), 2, (110, 50, 20, 255), 0)
+    assert image.get_size() == (44, 24)
+    assert image.get_at((22, 12)) == (110, 50, 20, 255)
+    assert renderer.bar_image((40, 20), 2, (110, 50, 20, 255), 0) is image
+    rotated = renderer.bar_image((40, 20), 2, (110, 50, 20, 255), 90)
+    assert rotated.get_size() == (24, 44)
+
+
+def test_world_renderer_draws_bar():
+    space = pymunk.Space()
+    bar = Wooden_bar(space, (300, 300), (40, 20))
+    renderer = WorldRenderer()
+    renderer.set_space(space)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surface.fill((255, 255, 255))
+    renderer.draw(surface)
+    assert surface.get_at((300, SCREEN_HEIGHT - 300)) == bar.shape.color
+    assert surface.get_at((300, SCREEN_HEIGHT - 330)) == (255, 255, 255)
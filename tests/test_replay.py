@@ -0,0 +1,81 @@
+import collections
+import io
+import struct
+import pygame
+from src.get_levels import Game
+from src.recording import InputRecorder
+from src.replay import replay
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+from pygame.locals import (
+    K_RIGHT,
+    K_SPACE,
+    KEYDOWN
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def record_game():
+    fp = io.BytesIO()
+    game = Game(headless=True, render=False, recorder=InputRecorder(fp))
+    game.start(0)
+    keys = collections.defaultdict(bool, {K_RIGHT: True})
+    for frame in range(30):
+        game.queue_input(pressed_keys=keys, mouse_pos=(300, 300), frame_time=1 / 60 if frame % 3 else 1 / 25)
+        game.step()
+    game.queue_input([pygame.event.Event(KEYDOWN, key=K_SPACE)], collections.defaultdict(bool))
+    game.step()
+    assert game.bird_shot
+    for _ in range(100):
+        game.step()
+    return fp.getvalue()
+
+
+def test_replay_deterministic():
+    result = replay(io.BytesIO(record_game()))
+    assert result.frames == 131
+    assert result.deterministic
+    assert len(result.frame_times) == 131
+    assert len(result.slowest_frames(3)) == 3
+
+
+def test_replay_started_from_start_screen():
+    fp = io.BytesIO()
+    game = Game(headless=True, render=False, recorder=InputRecorder(fp))
+    game.queue_input(frame_time=1 / 25)
+    game.start_screen()
+    game.queue_input([pygame.event.Event(KEYDOWN, key=K_SPACE)], frame_time=1 / 25)
+    game.start_screen()
+    assert game.status == 1
+    keys = collections.defaultdict(bool, {K_RIGHT: True})
+    for frame in range(20):
+        game.queue_input(pressed_keys=keys, mouse_pos=(300, 300), frame_time=1 / 30)
+        game.step()
+    game.queue_input([pygame.event.Event(KEYDOWN, key=K_SPACE)], collections.defaultdict(bool))
+    game.step()
+    for _ in range(40):
+        game.step()
+    result = replay(io.BytesIO(fp.getvalue()))
+    assert result.frames == 61
+    assert result.deterministic
+
+
+def test_replay_detects_difference():
+    log = bytearray(record_game())
+    # Changes duration of the first frame, which is stored after header, start record, type and number of the frame.
+    # Duration of the frame is used by physics of the next frame.
+    offset = 9 + 4 + 5
+    log[offset:offset + 8] = struct.pack('<d', 0.1)
+    result = replay(io.BytesIO(bytes(log)))
+    assert not result.deterministic
+    assert result.mismatches[0] == (0, 1)
+
+
+def test_replay_with_profiler():
+    result = replay(io.BytesIO(record_game()), render=True, profile=True)
+    assert result.deterministic
+    assert result.profiler.frames == 131
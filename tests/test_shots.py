@@ -0,0 +1,64 @@
+import pygame
+from concurrent.futures import ProcessPoolExecutor
+from src.shots import (
+    ShotResult,
+    simulate_shot,
+    evaluate_shots
+)
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_simulate_shot_no_velocity():
+    result = simulate_shot(0, 0, 0)
+    assert type(result) is ShotResult
+    assert result.level == 0
+    assert result.pigs_killed == 0
+    assert result.bars_destroyed == 0
+    assert result.settled is True
+
+
+def test_simulate_shot_kills_pigs():
+    result = simulate_shot(0, 10, 900)
+    assert result.pigs_killed > 0
+    assert result.pigs_killed + result.pigs_left == 2
+    assert result.settled is True
+
+
+def test_shot_result_repr():
+    result = ShotResult(0, 10, 900, 1, 1, 2, 3.5, False)
+    assert repr(result) == (
+        'ShotResult(level=0, angle=10, velocity=900, pigs_killed=1, pigs_left=1, bars_destroyed=2, '
+        'settle_time=3.50, settled=False)'
+    )
+
+
+def test_simulate_shot_time_limit():
+    result = simulate_shot(0, 20, 900, time_limit=0.5)
+    assert result.settle_time <= 0.5
+
+
+def test_evaluate_shots():
+    shots = [(0, 0), (10, 500), (30, 800), (45, 900)]
+    results = list(evaluate_shots(0, shots, workers=2))
+    assert len(results) == 4
+    assert sorted((result.angle, result.velocity) for result in results) == shots
+
+
+def test_simulate_shot_previous():
+    first = simulate_shot(0, 28, 700)
+    result = simulate_shot(0, 28, 950, previous=[(28, 700)])
+    assert result.pigs_killed + result.pigs_left == first.pigs_left
+
+
+def test_evaluate_shots_executor():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        results = list(evaluate_shots(0, [(10, 500), (30, 800)], 1, executor=executor, previous=[(0, 0)]))
+        # Executor is not shut down by evaluate_shots, so it still accepts new work.
+        assert executor.submit(simulate_shot, 0, 0, 0).result().pigs_killed == 0
+    assert sorted((result.angle, result.velocity) for result in results) == [(10, 500), (30, 800)]
@@ -0,0 +1,99 @@
+import pygame
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from src.shots import ShotResult, simulate_shot
+from src.solver import (
+    Solution,
+    max_velocity,
+    clamp_shot,
+    grid,
+    neighbours,
+    score,
+    solve_level,
+    main
+)
+from setup.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT
+)
+
+
+pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_clamp_shot():
+    assert clamp_shot(45.4, 503) == (45, 500)
+    assert clamp_shot(-1, 0) == (359, 10)
+    assert clamp_shot(30, 2000) == (30, max_velocity)
+
+
+def test_grid():
+    shots = grid((0, 20), (100, 300), 10, 100)
+    assert len(shots) == 9
+    assert shots[0] == (0, 100)
+    assert shots[-1] == (20, 300)
+
+
+def test_grid_max_velocity():
+    assert grid((0, 0), (900, max_velocity), 1, 100) == [(0, 900), (0, max_velocity)]
+
+
+def test_neighbours():
+    shots = neighbours((30, 500), 2, 20)
+    assert len(shots) == 8
+    assert (30, 500) not in shots
+    assert (28, 480) in shots
+    assert (32, 520) in shots
+
+
+def test_score():
+    better = ShotResult(0, 30, 500, 2, 0, 1, 5, True)
+    worse = ShotResult(0, 30, 500, 1, 1, 3, 2, True)
+    assert sorted([worse, better], key=score) == [better, worse]
+
+
+def test_solution_solved():
+    solution = Solution(0, 2)
+    assert not solution.solved
+    solution.shots.append(ShotResult(0, 30, 500, 1, 1, 0, 2, True))
+    solution.margins.append(0.5)
+    assert not solution.solved
+    solution.shots.append(ShotResult(0, 30, 600, 1, 0, 0, 2, True))
+    solution.margins.append(1)
+    assert solution.solved
+    data = solution.to_dict()
+    assert data['level'] == 1
+    assert data['solved'] is True
+    assert [shot['velocity'] for shot in data['shots']] == [500, 600]
+
+
+def test_solve_level():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        solution = solve_level(0, executor, 2, coarse_steps=(20, 200), keep=2)
+    assert solution.solved
+    assert len(solution.shots) <= solution.attempts
+    assert len(solution.margins) == len(solution.shots)
+    assert 0 <= solution.margins[0] <= 1
+    assert solution.simulated > 0
+    previous = [(shot.angle, shot.velocity) for shot in solution.shots[:-1]]
+    last = solution.shots[-1]
+    assert simulate_shot(0, last.angle, last.velocity, 15, previous).pigs_left == 0
+
+
+def test_main(tmp_path, capsys):
+    output = tmp_path / 'solutions.json'
+    assert main(['1', '--workers', '2', '--angle-step', '20', '--velocity-step', '200', '--output', str(output)]) == 0
+    assert 'level 1: solved' in capsys.readouterr().out
+    assert output.exists()
+
+
+@pytest.mark.parametrize('option', ['--angle-step', '--velocity-step'])
+@pytest.mark.parametrize('step', ['0', '-10'])
+def test_main_invalid_step(option, step):
+    with pytest.raises(SystemExit):
+        main(['1', option, step])
+
+
+def test_grid_invalid_step():
+    with pytest.raises(ValueError):
+        grid((0, 10), (100, 200), 0, 50)